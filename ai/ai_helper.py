@@ -2,7 +2,13 @@ from collections import defaultdict
 
 
 class AIHelper:
-    def __init__(self, player, platforms, enemies, goal):
+    # Extra risk for the side that leads away from the planned route to the goal
+    ROUTE_WEIGHT = 6
+    # Below this many enemies, scanning them beats the entity hash's NumPy queries
+    # (measured crossover ~300; the shipped levels have under 10)
+    HASH_MIN_ENEMIES = 300
+
+    def __init__(self, player, platforms, enemies, goal, entity_hash=None, terrain=None, navigation=None):
         """
         Initialize the AIHelper with references to the game environment.
 
@@ -11,13 +17,26 @@ class AIHelper:
             platforms: List of platform Rects in the level.
             enemies: Group of enemy objects in the level.
             goal: Rect representing the goal position.
+            entity_hash: SpatialHash with an "enemies" layer kept up to date by the
+                simulation. Enemy proximity checks query it instead of scanning enemies
+                once the level has HASH_MIN_ENEMIES of them; it only pays off on large maps.
+            terrain: TerrainTables for the level. Gap and goal checks read it instead of
+                scanning platforms.
+            navigation: NavigationGraph for the level. Direction hints lean towards its
+                best route to the goal.
         """
         self.player = player
         self.platforms = platforms
         self.enemies = enemies
         self.goal = goal
+        self.entity_hash = entity_hash
+        self.terrain = terrain
+        self.navigation = navigation
         self.hint_counter = defaultdict(int)
 
+    def _use_hash(self):
+        return self.entity_hash is not None and len(self.enemies) >= self.HASH_MIN_ENEMIES
+
     def get_hints(self):
         """
         Analyze the current game state and generate context-aware hints for the player.
@@ -57,6 +76,9 @@ class AIHelper:
             True if there's a gap ahead, False otherwise.
         """
         check_distance = 40
+        if self.terrain is not None:
+            return not self.terrain.ground_ahead(self.player.rect, check_distance)
+
         check_rect = self.player.rect.move(check_distance, 5)
         for plat, _ in self.platforms:
             if plat.colliderect(check_rect):
@@ -70,6 +92,10 @@ class AIHelper:
         Returns:
             True if an enemy is close, False otherwise.
         """
+        if self._use_hash():
+            px, py = self.player.rect.center
+            return len(self.entity_hash.query_centers("enemies", px, py, 100, 80)) > 0
+
         for enemy in self.enemies:
             if abs(enemy.rect.centerx - self.player.rect.centerx) < 100 and abs(
                     enemy.rect.centery - self.player.rect.centery) < 80:
@@ -83,13 +109,16 @@ class AIHelper:
         Returns:
             True if the player is near the goal, False otherwise.
         """
+        if self.terrain is not None:
+            return self.terrain.near_goal(self.player.rect.centerx)
         if self.goal and abs(self.goal.centerx - self.player.rect.centerx) < 200:
             return True
         return False
 
     def analyze_direction(self):
         """
-        Evaluate the left and right directions to suggest a safer path.
+        Evaluate the left and right directions to suggest a safer path, favouring the
+        side the planned route to the goal continues on when a navigation graph is set.
 
         Returns:
             A string hint: "Go Left!", "Go Right!", or "Be Careful!" depending on threats and terrain.
@@ -97,26 +126,43 @@ class AIHelper:
         left_risk = 0
         right_risk = 0
 
-        for enemy in self.enemies:
-            if enemy.rect.centerx < self.player.rect.centerx and abs(
-                    enemy.rect.centerx - self.player.rect.centerx) < 150:
-                left_risk += 3
-            if enemy.rect.centerx > self.player.rect.centerx and abs(
-                    enemy.rect.centerx - self.player.rect.centerx) < 150:
-                right_risk += 3
-
-        left_gap = True
-        right_gap = True
-        for plat, _ in self.platforms:
-            if plat.colliderect(self.player.rect.move(-40, 5)):
-                left_gap = False
-            if plat.colliderect(self.player.rect.move(40, 5)):
-                right_gap = False
+        if self._use_hash():
+            # Bands centred 75px either side cover exactly (px - 150, px) and (px, px + 150)
+            px, py = self.player.rect.center
+            left_risk += 3 * len(self.entity_hash.query_centers("enemies", px - 75, py, 75))
+            right_risk += 3 * len(self.entity_hash.query_centers("enemies", px + 75, py, 75))
+        else:
+            for enemy in self.enemies:
+                if enemy.rect.centerx < self.player.rect.centerx and abs(
+                        enemy.rect.centerx - self.player.rect.centerx) < 150:
+                    left_risk += 3
+                if enemy.rect.centerx > self.player.rect.centerx and abs(
+                        enemy.rect.centerx - self.player.rect.centerx) < 150:
+                    right_risk += 3
+
+        if self.terrain is not None:
+            left_gap = not self.terrain.ground_ahead(self.player.rect, -40)
+            right_gap = not self.terrain.ground_ahead(self.player.rect, 40)
+        else:
+            left_gap = True
+            right_gap = True
+            for plat, _ in self.platforms:
+                if plat.colliderect(self.player.rect.move(-40, 5)):
+                    left_gap = False
+                if plat.colliderect(self.player.rect.move(40, 5)):
+                    right_gap = False
         if left_gap:
             left_risk += 5
         if right_gap:
             right_risk += 5
 
+        if self.navigation is not None:
+            route = self.navigation.best_direction(self.player.rect)
+            if route == 1:
+                left_risk += self.ROUTE_WEIGHT
+            elif route == -1:
+                right_risk += self.ROUTE_WEIGHT
+
         if left_risk < right_risk:
             return "Go Left!"
         elif right_risk < left_risk:
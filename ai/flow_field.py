@@ -0,0 +1,128 @@
+import numpy as np
+
+
+class FlowField:
+    """
+    Shared pathing field towards the player's tile, for chasing enemies.
+
+    One breadth-first search over the empty tiles (4-neighbour) runs when the
+    player enters a new tile, recording for every reached cell the centre of the
+    next cell on a shortest path. Each chaser then reads its cell in O(1), so the
+    cost per tick is fixed no matter how many chasers there are. The search is
+    bounded to max_depth steps, as chasers only pursue nearby players anyway.
+    """
+
+    def __init__(self, tiles, tile_size, max_depth=12):
+        """
+        Args:
+            tiles (np.ndarray): (rows, cols) tile codes, non-zero = solid (CompiledLevel.tiles).
+            tile_size (int): Tile width and height in pixels.
+            max_depth (int): Longest path (in tiles) the field covers.
+        """
+        self.tile_size = tile_size
+        self.rows, self.cols = tiles.shape
+        # Flat row-major list: plain indexing is much cheaper than NumPy scalars
+        self.blocked = (tiles != 0).ravel().tolist()
+        self.max_depth = max_depth
+
+        # Centre of the next cell towards the target, -1 where the field is undefined
+        self.next_x = np.full((self.rows, self.cols), -1, dtype=np.int64)
+        self.next_y = np.full((self.rows, self.cols), -1, dtype=np.int64)
+        self.touched = []
+        self.target = None
+        self.dirty = False
+        self.builds = 0
+
+    def set_target(self, rect):
+        """
+        Point the field at the tile under a rect's centre (usually the player).
+        The search reruns lazily, and only when that tile changes.
+
+        Args:
+            rect (pygame.Rect): Target rect.
+        """
+        cell = (rect.centerx // self.tile_size, rect.centery // self.tile_size)
+        if cell != self.target:
+            self.target = cell
+            self.dirty = True
+
+    def _rebuild(self):
+        self.dirty = False
+        self.builds += 1
+        if len(self.touched):
+            self.next_x.flat[self.touched] = -1
+            self.next_y.flat[self.touched] = -1
+            self.touched = []
+
+        col, row = self.target
+        cols, rows = self.cols, self.rows
+        blocked = self.blocked
+        start = row * cols + col
+        if not (0 <= col < cols and 0 <= row < rows) or blocked[start]:
+            return
+
+        # Search on flat cell indices; parents[i] is the cell i steps back towards
+        size = len(blocked)
+        parents = {start: start}
+        frontier = [start]
+        for _ in range(self.max_depth):
+            reached = []
+            for i in frontier:
+                c = i % cols
+                for n in (i - 1 if c > 0 else -1, i + 1 if c < cols - 1 else -1, i - cols, i + cols):
+                    if 0 <= n < size and not blocked[n] and n not in parents:
+                        parents[n] = i
+                        reached.append(n)
+            if not reached:
+                break
+            frontier = reached
+
+        cells = np.fromiter(parents.keys(), dtype=np.int64, count=len(parents))
+        steps = np.fromiter(parents.values(), dtype=np.int64, count=len(parents))
+        half = self.tile_size // 2
+        self.next_x.flat[cells] = (steps % cols) * self.tile_size + half
+        self.next_y.flat[cells] = (steps // cols) * self.tile_size + half
+        self.touched = cells
+
+    def next_point(self, x, y):
+        """
+        Where something at (x, y) should head next to reach the target.
+
+        Args:
+            x (int): Current centre x.
+            y (int): Current centre y.
+
+        Returns:
+            tuple | None: Centre (x, y) of the next cell, or None outside the field.
+        """
+        if self.dirty:
+            self._rebuild()
+        col, row = x // self.tile_size, y // self.tile_size
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return None
+        next_x = int(self.next_x[row, col])
+        if next_x < 0:
+            return None
+        return next_x, int(self.next_y[row, col])
+
+    def next_points(self, x, y):
+        """
+        Vectorized next_point for many positions.
+
+        Args:
+            x (np.ndarray): Centre x positions.
+            y (np.ndarray): Centre y positions.
+
+        Returns:
+            tuple: (next x, next y, valid mask) arrays; entries outside the field are invalid.
+        """
+        if self.dirty:
+            self._rebuild()
+        col = x // self.tile_size
+        row = y // self.tile_size
+        inside = (col >= 0) & (col < self.cols) & (row >= 0) & (row < self.rows)
+        col = np.where(inside, col, 0)
+        row = np.where(inside, row, 0)
+        next_x = self.next_x[row, col]
+        next_y = self.next_y[row, col]
+        return next_x, next_y, inside & (next_x >= 0)
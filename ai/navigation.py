@@ -0,0 +1,301 @@
+import hashlib
+import heapq
+import math
+import numpy as np
+
+
+class NavigationGraph:
+    """
+    Per-level route planner for the hint system.
+
+    Nodes are the tiles a player can stand on (an empty cell above a solid one).
+    Edges cover walking to a neighbouring tile plus the jump, double-jump and
+    dash-jump arcs the player's physics allow; their reach is derived from the
+    player's jump_power, gravity, speed, max_jump and dash settings. One Dijkstra
+    pass from the goal gives every node its travel time (in ticks) and the next
+    step of its best route, so a "which way?" query is a couple of table reads.
+    Graphs are cached per (tiles, goal, physics), so restarting a level is free.
+    """
+    _cache = {}
+
+    def __init__(self, terrain, goal_cell, physics):
+        """
+        Args:
+            terrain (TerrainTables): Tile occupancy tables for the level.
+            goal_cell (tuple | None): (col, row) of the goal.
+            physics (dict): Player movement settings (see physics_of).
+        """
+        self.terrain = terrain
+        self.tile_size = terrain.tile_size
+        self.rows, self.cols = terrain.rows, terrain.cols
+        self.goal_cell = goal_cell
+        self.physics = physics
+        self.reach = self._reach_tables()
+
+        self.nodes = []
+        self.node_index = {}
+        self.edges = []
+        self.goal_edges = {}
+        self.landing = []
+        self.distance = []
+        self.next_node = []
+        self._build_nodes()
+        self._build_edges()
+        self._solve()
+
+    @staticmethod
+    def physics_of(player):
+        """
+        Args:
+            player (Player): Player whose movement settings define the reachable arcs.
+
+        Returns:
+            dict: speed, jump_power, gravity, max_jump, dash_speed and dash_duration.
+        """
+        return {
+            "speed": player.speed,
+            "jump_power": player.jump_power,
+            "gravity": player.gravity,
+            "max_jump": player.max_jump,
+            "dash_speed": player.dash_speed,
+            "dash_duration": player.dash_duration
+        }
+
+    @classmethod
+    def for_level(cls, terrain, tiles, goal_cell, player):
+        """
+        Get the navigation graph for a level, building it only once per layout.
+
+        Args:
+            terrain (TerrainTables): Tile occupancy tables for the level.
+            tiles (np.ndarray): The level's tile codes (cache key).
+            goal_cell (tuple | None): (col, row) of the goal.
+            player (Player): Player whose physics define the edges.
+
+        Returns:
+            NavigationGraph: The cached or newly built graph.
+        """
+        physics = cls.physics_of(player)
+        key = (hashlib.sha1(np.ascontiguousarray(tiles)).hexdigest(), tiles.shape, goal_cell,
+               terrain.tile_size, tuple(sorted(physics.items())))
+        graph = cls._cache.get(key)
+        if graph is None:
+            graph = cls(terrain, goal_cell, physics)
+            cls._cache[key] = graph
+        return graph
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Drop every cached graph.
+        """
+        cls._cache.clear()
+
+    # --- Physics ---
+
+    def _air_time(self, jumps, rise_px):
+        """
+        Ticks spent in the air to land rise_px above the take-off height (negative =
+        below), replaying the player's per-tick gravity. None if out of reach.
+        """
+        physics = self.physics
+        velocity = physics["jump_power"] if jumps else 0
+        jumps_left = jumps - 1
+        height = 0
+        peak = 0
+        max_ticks = (self.rows + 10) * self.tile_size
+        for tick in range(1, max_ticks):
+            if jumps_left > 0 and velocity >= 0:
+                # Next jump at the top of the arc gives the highest reach
+                velocity = physics["jump_power"]
+                jumps_left -= 1
+            velocity += physics["gravity"]
+            height -= velocity
+            peak = max(peak, height)
+            if velocity > 0 and height <= rise_px:
+                return tick if peak >= rise_px else None
+        return None
+
+    def _reach_tables(self):
+        """
+        Reach of every airborne mode, per row offset.
+
+        Returns:
+            dict: row offset (up positive) -> list of (max columns, ticks, mode),
+                fastest first.
+        """
+        physics = self.physics
+        size = self.tile_size
+        modes = {"jump": (1, False), "double_jump": (min(2, physics["max_jump"]), False),
+                 # Dash (20 energy) only pairs with a single jump (15) within the 40 energy pool
+                 "dash_jump": (1, True)}
+        reach = {}
+        for dy in range(-self.rows, self.rows + 1):
+            options = []
+            for mode, (jumps, dash) in modes.items():
+                ticks = self._air_time(jumps, dy * size)
+                if ticks is None:
+                    continue
+                px = ticks * physics["speed"]
+                if dash:
+                    px += min(ticks, physics["dash_duration"]) * physics["dash_speed"]
+                options.append((px // size, ticks, mode))
+            if options:
+                reach[dy] = sorted(options, key=lambda option: option[1])
+        return reach
+
+    def _arc(self, dy, dx):
+        """
+        Fastest airborne mode covering a (row, column) offset.
+
+        Returns:
+            tuple | None: (ticks, mode), or None if out of reach.
+        """
+        for max_dx, ticks, mode in self.reach.get(dy, ()):
+            if abs(dx) <= max_dx:
+                return ticks, mode
+        return None
+
+    # --- Graph ---
+
+    def _build_nodes(self):
+        solid = self.terrain.solid_cells
+        for row in range(self.rows):
+            for col in range(self.cols):
+                # Cells past the bottom edge count as empty: that is the fall-death pit
+                if not solid(col, row, col, row) and row + 1 < self.rows and solid(col, row + 1, col, row + 1):
+                    self.node_index[(col, row)] = len(self.nodes)
+                    self.nodes.append((col, row))
+
+        # Per-cell lookup of the node a player in that cell stands on or falls onto
+        self.landing = [[-1] * self.cols for _ in range(self.rows)]
+        for col in range(self.cols):
+            below = -1
+            for row in range(self.rows - 1, -1, -1):
+                if solid(col, row, col, row):
+                    below = -1
+                    continue
+                below = self.node_index.get((col, row), below)
+                self.landing[row][col] = below
+
+    def _clear_path(self, c0, r0, c1, r1):
+        """
+        True if an L-shaped path (rise/fall first or move across first) between two
+        cells is free of tiles.
+        """
+        solid = self.terrain.solid_cells
+        vertical_first = not solid(c0, r0, c0, r1) and not solid(c0, r1, c1, r1)
+        return vertical_first or (not solid(c0, r0, c1, r0) and not solid(c1, r0, c1, r1))
+
+    def _build_edges(self):
+        walk_cost = math.ceil(self.tile_size / self.physics["speed"])
+        self.edges = [[] for _ in self.nodes]
+        for i, (col, row) in enumerate(self.nodes):
+            edges = {}
+            for step in (-1, 1):
+                j = self.node_index.get((col + step, row))
+                if j is not None:
+                    edges[j] = (walk_cost, "walk")
+            for dy, options in self.reach.items():
+                target_row = row - dy
+                if not 0 <= target_row < self.rows:
+                    continue
+                max_dx = max(option[0] for option in options)
+                for dx in range(-max_dx, max_dx + 1):
+                    j = self.node_index.get((col + dx, target_row))
+                    if j is None or j == i:
+                        continue
+                    ticks, mode = self._arc(dy, dx)
+                    cost = max(ticks, abs(dx) * walk_cost)
+                    if (j not in edges or cost < edges[j][0]) and self._clear_path(col, row, col + dx, target_row):
+                        edges[j] = (cost, mode)
+            self.edges[i] = [(j, cost, mode) for j, (cost, mode) in edges.items()]
+
+        # Nodes from which the goal can be touched, with the cost of doing so
+        if self.goal_cell is None:
+            return
+        gc, gr = self.goal_cell
+        for i, (col, row) in enumerate(self.nodes):
+            if (col, row) == (gc, gr):
+                self.goal_edges[i] = 0
+                continue
+            arc = self._arc(row - gr, gc - col)
+            if arc and self._clear_path(col, row, gc, gr):
+                self.goal_edges[i] = max(arc[0], abs(gc - col) * walk_cost)
+
+    def _solve(self):
+        """
+        Dijkstra from the goal over reversed edges: travel time and next hop per node.
+        """
+        count = len(self.nodes)
+        self.distance = [math.inf] * count
+        self.next_node = [-1] * count
+        reverse = [[] for _ in range(count)]
+        for i, edges in enumerate(self.edges):
+            for j, cost, _ in edges:
+                reverse[j].append((i, cost))
+
+        heap = []
+        for i, cost in self.goal_edges.items():
+            self.distance[i] = cost
+            heapq.heappush(heap, (cost, i))
+        while heap:
+            dist, j = heapq.heappop(heap)
+            if dist > self.distance[j]:
+                continue
+            for i, cost in reverse[j]:
+                candidate = dist + cost
+                if candidate < self.distance[i]:
+                    self.distance[i] = candidate
+                    self.next_node[i] = j
+                    heapq.heappush(heap, (candidate, i))
+
+    # --- Queries ---
+
+    def node_at(self, rect):
+        """
+        Args:
+            rect (pygame.Rect): Player rect.
+
+        Returns:
+            int: Index of the node the player stands on (or will land on), -1 if none.
+        """
+        size = self.tile_size
+        col = rect.centerx // size
+        row = (rect.bottom - 1) // size
+        if not (0 <= col < self.cols):
+            return -1
+        return self.landing[min(max(row, 0), self.rows - 1)][col]
+
+    def goal_distance(self, rect):
+        """
+        Args:
+            rect (pygame.Rect): Player rect.
+
+        Returns:
+            float: Estimated ticks to reach the goal (inf if unreachable or off the map).
+        """
+        node = self.node_at(rect)
+        return self.distance[node] if node >= 0 else math.inf
+
+    def best_direction(self, rect):
+        """
+        Horizontal direction of the next step on the fastest route to the goal.
+
+        Args:
+            rect (pygame.Rect): Player rect.
+
+        Returns:
+            int | None: -1 (left), 1 (right), 0 (goal reachable from here / straight up),
+                or None if there is no known route.
+        """
+        node = self.node_at(rect)
+        if node < 0 or self.distance[node] == math.inf:
+            return None
+        target = self.next_node[node]
+        if target < 0:
+            col = self.goal_cell[0]
+        else:
+            col = self.nodes[target][0]
+        here = self.nodes[node][0]
+        return (col > here) - (col < here)
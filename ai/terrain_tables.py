@@ -0,0 +1,106 @@
+import numpy as np
+
+
+class TerrainTables:
+    """
+    Static terrain facts for one level, precomputed once so hint checks are
+    table reads instead of platform scans.
+
+    Tile occupancy is stored as a summed-area table: whether any solid tile
+    overlaps a rect is four lookups, and because platforms are exactly the
+    grid-aligned tiles the answer matches a colliderect scan over them.
+    """
+
+    def __init__(self, tiles, tile_size, goal=None, goal_range=200):
+        """
+        Args:
+            tiles (np.ndarray): (rows, cols) tile codes, non-zero = solid (CompiledLevel.tiles).
+            tile_size (int): Tile width and height in pixels.
+            goal (pygame.Rect): Goal rect, if the level has one.
+            goal_range (int): Horizontal distance from the goal centre that counts as "near".
+        """
+        self.tile_size = tile_size
+        self.rows, self.cols = tiles.shape
+        sat = np.zeros((self.rows + 1, self.cols + 1), dtype=np.int64)
+        sat[1:, 1:] = np.cumsum(np.cumsum(tiles != 0, axis=0), axis=1)
+        # Plain lists: scalar reads are much cheaper than NumPy indexing
+        self.sat = sat.tolist()
+
+        # Goal proximity band: centre x strictly inside (low, high)
+        self.goal_band = None
+        if goal:
+            self.goal_band = (goal.centerx - goal_range, goal.centerx + goal_range)
+
+    @classmethod
+    def from_level(cls, level, tile_size, goal=None):
+        """
+        Args:
+            level (CompiledLevel): Compiled level.
+            tile_size (int): Tile size in pixels.
+            goal (pygame.Rect): Goal rect, if any.
+
+        Returns:
+            TerrainTables: Tables for the level.
+        """
+        return cls(level.tiles, tile_size, goal)
+
+    def solid_in(self, rect):
+        """
+        Check whether any solid tile overlaps a rect.
+
+        Args:
+            rect (pygame.Rect): Area to test (may extend past the level).
+
+        Returns:
+            bool: True if a tile overlaps the rect.
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        size = self.tile_size
+        return self.solid_cells(rect.left // size, rect.top // size,
+                                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def solid_cells(self, c0, r0, c1, r1):
+        """
+        Check whether any solid tile lies in an inclusive block of tile cells.
+
+        Args:
+            c0 (int): First column.
+            r0 (int): First row.
+            c1 (int): Last column.
+            r1 (int): Last row.
+
+        Returns:
+            bool: True if a tile is inside the block (cells outside the level are empty).
+        """
+        c0, c1 = max(min(c0, c1), 0), min(max(c0, c1), self.cols - 1)
+        r0, r1 = max(min(r0, r1), 0), min(max(r0, r1), self.rows - 1)
+        if c0 > c1 or r0 > r1:
+            return False
+        sat = self.sat
+        return sat[r1 + 1][c1 + 1] - sat[r0][c1 + 1] - sat[r1 + 1][c0] + sat[r0][c0] > 0
+
+    def ground_ahead(self, rect, offset_x, offset_y=5):
+        """
+        Check for ground next to a rect (the hint "gap" probe).
+
+        Args:
+            rect (pygame.Rect): Player rect.
+            offset_x (int): Horizontal probe offset (negative = left).
+            offset_y (int): Vertical probe offset.
+
+        Returns:
+            bool: True if the shifted rect touches a tile.
+        """
+        return self.solid_in(rect.move(offset_x, offset_y))
+
+    def near_goal(self, centerx):
+        """
+        Args:
+            centerx (int): Player centre x.
+
+        Returns:
+            bool: True if inside the goal proximity band.
+        """
+        band = self.goal_band
+        return band is not None and band[0] < centerx < band[1]
@@ -0,0 +1,380 @@
+"""
+Component micro-benchmarks for Shadow Guide's hot paths.
+
+Times player/platform collision, every enemy type's update, AI hint generation,
+level parsing, the CSV statistical summary and logging a row in isolation, over
+the real levels in assets/levels and synthetic levels/logs scaled up by --scale.
+Results are printed (or written with --output) as JSON so runs can be compared
+across versions.
+
+Usage:
+    python benchmarks/bench_components.py --scale 1 10 100 --output bench.json
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from ai.ai_helper import AIHelper  # noqa: E402
+from entities.enemy import (  # noqa: E402
+    PatrollingEnemy, ChasingEnemy, JumpingEnemy, ShootingEnemy,
+    ExplodingEnemy, TeleportingEnemy, DroppingEnemy
+)
+from entities.enemy_engine import EnemyEngine  # noqa: E402
+from entities.player import Player  # noqa: E402
+from entities.projectiles import ProjectileSystem  # noqa: E402
+from utils.aggregate_store import AggregateStore  # noqa: E402
+from utils.data_logger import DataLogger  # noqa: E402
+from utils.game_data_columns import GameDataColumns  # noqa: E402
+from utils.level_cache import CompiledLevel, LevelCache  # noqa: E402
+from utils.level_simulation import LevelSimulation  # noqa: E402
+from utils.record_store import RecordStore  # noqa: E402
+from utils.visualize_data import Visualizer  # noqa: E402
+
+LEVEL_DIR = "assets/levels"
+ENEMY_TYPES = [PatrollingEnemy, ChasingEnemy, JumpingEnemy, ShootingEnemy,
+               ExplodingEnemy, TeleportingEnemy, DroppingEnemy]
+
+
+def measure(fn, repeat=3, number=None, budget=0.02):
+    """
+    Time a callable, picking the inner loop count so one repeat takes ~budget seconds.
+
+    Args:
+        fn (callable): Zero-argument function to time.
+        repeat (int): Number of timed repeats.
+        number (int): Calls per repeat (auto-calibrated when None).
+        budget (float): Target seconds per repeat for calibration.
+
+    Returns:
+        dict: Calls per repeat plus min/median time per call in microseconds.
+    """
+    if number is None:
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            if time.perf_counter() - start >= budget or number >= 1 << 20:
+                break
+            number *= 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+
+    return {
+        "number": number,
+        "min_us": round(min(samples), 3),
+        "median_us": round(statistics.median(samples), 3)
+    }
+
+
+def scale_level(rows, scale):
+    """
+    Build a synthetic level by tiling a real one: `scale` copies side by side,
+    so the tile and enemy counts grow linearly with the scale.
+
+    Args:
+        rows (list[str]): Level rows.
+        scale (int): Number of horizontal copies.
+
+    Returns:
+        list[str]: Scaled level rows (only the first copy keeps its P/G markers).
+    """
+    if scale == 1:
+        return rows
+    width = max(len(row) for row in rows)
+    padded = [row.ljust(width, ".") for row in rows]
+    stripped = [row.replace("P", ".").replace("G", ".") for row in padded]
+    return [row + other * (scale - 1) for row, other in zip(padded, stripped)]
+
+
+def write_level(rows, directory, name):
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write("\n".join(rows) + "\n")
+    return path
+
+
+def bench_collision(level_path, label, scale):
+    """
+    Player.check_collision_y / check_collision_x against the collision grid and
+    against the plain platform list, from random positions inside the level.
+    """
+    sim = LevelSimulation(level_path, 1, seed=0)
+    rng = random.Random(0)
+    width = sim.pixel_width
+    height = sim.pixel_height
+    starts = [(rng.randrange(width), rng.randrange(height), rng.randint(-15, 15)) for _ in range(256)]
+    player = Player([(0, 0)], rng=rng)
+    state = {"i": 0}
+
+    def reset():
+        x, y, vy = starts[state["i"] % len(starts)]
+        state["i"] += 1
+        player.rect.topleft = (x, y)
+        player.velocity_y = vy
+
+    def collide_y(platforms):
+        def run():
+            reset()
+            player.check_collision_y(platforms)
+        return run
+
+    def collide_x(platforms):
+        def run():
+            reset()
+            player.check_collision_x(platforms, 5)
+        return run
+
+    results = []
+    for method, factory in (("check_collision_y", collide_y), ("check_collision_x", collide_x)):
+        for index_name, platforms in (("grid", sim.collision_grid), ("list", sim.platforms)):
+            results.append({
+                "name": f"Player.{method}[{index_name}]",
+                "level": label,
+                "scale": scale,
+                "platforms": len(sim.platforms),
+                **measure(factory(platforms))
+            })
+    return results
+
+
+def bench_enemies(scale):
+    """
+    EnemyBase.update for each enemy subclass, over 100 * scale enemies.
+    """
+    count = 100 * scale
+    player_rect = pygame.Rect(400, 300, 30, 30)
+    results = []
+    for cls in ENEMY_TYPES:
+        rng = random.Random(0)
+        enemies = [cls(rng.randrange(800), rng.randrange(600), rng=rng) for _ in range(count)]
+
+        def run():
+            for enemy in enemies:
+                enemy.update(player_rect)
+
+        timing = measure(run)
+        results.append({
+            "name": f"{cls.__name__}.update",
+            "scale": scale,
+            "enemies": count,
+            "per_enemy_us": round(timing["median_us"] / count, 4),
+            **timing
+        })
+
+    # The struct-of-arrays engine: every type in one batch, one kernel per type
+    rng = random.Random(0)
+    engine = EnemyEngine(ProjectileSystem(capacity=1024), rng)
+    for i in range(count * len(ENEMY_TYPES)):
+        engine.add(ENEMY_TYPES[i % len(ENEMY_TYPES)], rng.randrange(800), rng.randrange(600))
+    timing = measure(lambda: engine.update(player_rect))
+    results.append({
+        "name": "EnemyEngine.update",
+        "scale": scale,
+        "enemies": count * len(ENEMY_TYPES),
+        "per_enemy_us": round(timing["median_us"] / (count * len(ENEMY_TYPES)), 4),
+        **timing
+    })
+    return results
+
+
+def bench_hints(level_path, label, scale):
+    """
+    AIHelper.get_hints with the level's platforms and 20 * scale enemies, scanning
+    platforms and enemies directly versus reading the simulation's terrain tables,
+    entity hash and navigation graph.
+    """
+    sim = LevelSimulation(level_path, 3, seed=0)
+    rng = random.Random(0)
+    width = sim.pixel_width
+    for _ in range(20 * scale):
+        sim.enemies.add(PatrollingEnemy(rng.randrange(width), rng.randrange(600), rng=rng))
+    sim.index_enemies()
+    results = []
+    variants = (("AIHelper.get_hints", None, None, None),
+                ("AIHelper.get_hints[indexed]", sim.entity_hash, sim.terrain, sim.navigation))
+    for name, entity_hash, terrain, navigation in variants:
+        helper = AIHelper(sim.player, sim.platforms, sim.enemies, sim.goal, entity_hash, terrain, navigation)
+        results.append({
+            "name": name,
+            "level": label,
+            "scale": scale,
+            "platforms": len(sim.platforms),
+            "enemies": len(sim.enemies),
+            **measure(helper.get_hints)
+        })
+    return results
+
+
+def bench_parse(level_path, label, scale):
+    """
+    Level start cost: compiling the text file from scratch versus building the
+    level objects from the compiled-level cache (PlayScreen gets both through
+    the LevelSimulation it creates; it has no parsing of its own).
+    """
+    sim = LevelSimulation(level_path, 3, seed=0)
+    tiles = sim.level_data.rows * sim.level_data.cols
+
+    def compile_level():
+        with open(level_path) as f:
+            CompiledLevel.compile([line.strip() for line in f.readlines()])
+
+    def build_level():
+        sim.platforms = []
+        sim.enemies.empty()
+        sim.spawn_points = []
+        sim.level_data = sim.load_map()
+        sim.parse_map()
+
+    return [
+        {"name": "CompiledLevel.compile", "level": label, "scale": scale, "tiles": tiles,
+         **measure(compile_level, repeat=3)},
+        {"name": "LevelSimulation.parse_map", "level": label, "scale": scale, "tiles": tiles,
+         **measure(build_level, repeat=3)}
+    ]
+
+
+def write_csv(path, rows):
+    """
+    Write a synthetic game_data.csv with `rows` random records.
+    """
+    rng = random.Random(0)
+    names = [f"player{i}" for i in range(50)]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(", ".join(DataLogger.HEADER) + "\n")
+        for _ in range(rows):
+            values = [rng.choice(names), rng.randint(0, 10), rng.randint(0, 40), rng.randint(0, 3),
+                      round(rng.random() * 3, 3), rng.randint(0, 30), rng.randint(0, 3), rng.randint(0, 10)]
+            values += [rng.randint(0, 8) for _ in range(6)]
+            f.write(",".join(str(v) for v in values) + "\n")
+
+
+def bench_summary(directory, scale):
+    """
+    Visualizer.get_statistical_summary over a synthetic CSV of 1000 * scale rows
+    (parsed on every call, with the parsed columns reused, and with one row appended
+    before each call),
+    over the same rows imported into the SQLite store, and from running aggregates.
+    """
+    rows = 1000 * scale
+    path = os.path.join(directory, f"game_data_{rows}.csv")
+    write_csv(path, rows)
+    original = Visualizer.FILE_PATH
+    Visualizer.FILE_PATH = path
+    try:
+        def cold_summary():
+            # Parse the file on every call, like the first summary after a game
+            GameDataColumns.clear_cache()
+            Visualizer.get_statistical_summary()
+
+        timing = measure(cold_summary, repeat=3, budget=0.2)
+        cached_timing = measure(Visualizer.get_statistical_summary, repeat=3, budget=0.2)
+
+        def appended_summary():
+            # One new game logged since the last summary: only that line is parsed
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("player0,1,10,1,0.5,3,1,7,1,0,1,0,1,0\n")
+            Visualizer.get_statistical_summary()
+
+        appended_timing = measure(appended_summary, repeat=3, budget=0.2)
+        store = RecordStore(os.path.join(directory, f"game_data_{rows}.db"))
+        store.import_csv(path)
+        DataLogger.store = store
+        sql_timing = measure(Visualizer.get_statistical_summary, repeat=3, budget=0.2)
+        DataLogger.aggregates = AggregateStore(os.path.join(directory, f"game_data_{rows}_stats.json"),
+                                               DataLogger.HEADER)
+        DataLogger.aggregates.rebuild(store.rows(), None)
+        agg_timing = measure(Visualizer.get_statistical_summary, repeat=3, budget=0.2)
+    finally:
+        Visualizer.FILE_PATH = original
+        DataLogger.store = DataLogger.aggregates = None
+    return [
+        {"name": "Visualizer.get_statistical_summary", "scale": scale, "rows": rows, **timing},
+        {"name": "Visualizer.get_statistical_summary[cached]", "scale": scale, "rows": rows, **cached_timing},
+        {"name": "Visualizer.get_statistical_summary[appended]", "scale": scale, "rows": rows, **appended_timing},
+        {"name": "Visualizer.get_statistical_summary[sqlite]", "scale": scale, "rows": rows, **sql_timing},
+        {"name": "Visualizer.get_statistical_summary[aggregates]", "scale": scale, "rows": rows, **agg_timing}
+    ]
+
+
+def bench_log_write(directory, scale):
+    """
+    DataLogger.write_rows for one finished game, with running aggregates over a
+    synthetic history of 1000 * scale rows (the cost should not grow with it).
+    """
+    rows = 1000 * scale
+    path = os.path.join(directory, f"game_data_{rows}_write.csv")
+    write_csv(path, rows)
+    original = DataLogger.FILE_PATH
+    DataLogger.FILE_PATH = path
+    try:
+        DataLogger.use_aggregates(os.path.join(directory, f"game_data_{rows}_write_stats.json"))
+        row = ["player0", 1, 10, 1, 0.5, 3, 1, 7, 1, 0, 1, 0, 1, 0]
+        timing = measure(lambda: DataLogger.write_rows([row]), repeat=3, budget=0.2)
+    finally:
+        DataLogger.FILE_PATH = original
+        DataLogger.aggregates = None
+    return [{"name": "DataLogger.write_rows[aggregates]", "scale": scale, "rows": rows, **timing}]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shadow Guide component benchmarks")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100],
+                        help="Input size multipliers (default: 1 10 100)")
+    parser.add_argument("--levels", default=LEVEL_DIR, help="Directory with level .txt files")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    pygame.init()
+    levels = sorted(glob.glob(os.path.join(args.levels, "*.txt")))
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Synthetic levels are throwaway files: keep their compiled copies out of the game's cache
+        LevelCache.set_disk_cache(True, os.path.join(tmp, "level_cache"))
+        for scale in args.scale:
+            for level_path in levels:
+                with open(level_path) as f:
+                    rows = [line.strip() for line in f]
+                label = os.path.basename(level_path)
+                path = write_level(scale_level(rows, scale), tmp, f"x{scale}_{label}")
+                results += bench_collision(path, label, scale)
+                results += bench_hints(path, label, scale)
+                results += bench_parse(path, label, scale)
+            results += bench_enemies(scale)
+            results += bench_summary(tmp, scale)
+            results += bench_log_write(tmp, scale)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "results": results
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
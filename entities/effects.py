@@ -0,0 +1,134 @@
+import pygame
+
+
+class EffectFrames:
+    """
+    Cache of pre-rendered animation frames, built once per (radius, duration).
+    """
+    _frames = {}
+
+    @staticmethod
+    def explosion(radius, duration):
+        """
+        Frames of the fading red explosion circle.
+
+        Args:
+            radius (int): Circle radius in pixels.
+            duration (int): Number of frames (ticks) the effect lasts.
+
+        Returns:
+            list[pygame.Surface]: One SRCALPHA surface per frame, alpha 255 → 0.
+        """
+        key = ("explosion", radius, duration)
+        frames = EffectFrames._frames.get(key)
+        if frames is None:
+            frames = []
+            for frame in range(duration):
+                alpha = max(0, 255 - int((frame / duration) * 255))
+                surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(surface, (255, 0, 0, alpha), (radius, radius), radius)
+                frames.append(surface)
+            EffectFrames._frames[key] = frames
+        return frames
+
+
+class _EffectSlot:
+    """
+    One reusable effect instance in an EffectPool.
+    """
+    __slots__ = ("active", "frames", "frame", "pos", "order")
+
+    def __init__(self):
+        self.active = False
+        self.frames = None
+        self.frame = 0
+        self.pos = (0, 0)
+        self.order = 0
+
+
+class EffectPool:
+    """
+    Fixed-size pool of animated effects.
+    Effects advance one frame per simulation tick and are drawn in one batched
+    Surface.blits call, so triggering effects allocates no surfaces.
+    """
+
+    def __init__(self, size=32):
+        """
+        Args:
+            size (int): Maximum number of effects alive at once. When full, the
+                oldest effect is recycled.
+        """
+        self.slots = [_EffectSlot() for _ in range(size)]
+        self.spawned = 0
+        self._batch = []
+
+    def spawn_explosion(self, x, y, radius=80, duration=30):
+        """
+        Start an explosion centred at (x, y).
+
+        Args:
+            x (int): Centre x position.
+            y (int): Centre y position.
+            radius (int): Circle radius.
+            duration (int): Lifetime in ticks.
+        """
+        self.spawn(EffectFrames.explosion(radius, duration), (x - radius, y - radius))
+
+    def spawn(self, frames, pos):
+        """
+        Start an effect from pre-rendered frames.
+
+        Args:
+            frames (list[pygame.Surface]): Animation frames.
+            pos (tuple): Top-left draw position.
+        """
+        slot = next((s for s in self.slots if not s.active), None)
+        if slot is None:
+            slot = min(self.slots, key=lambda s: s.order)
+        slot.active = True
+        slot.frames = frames
+        slot.frame = 0
+        slot.pos = pos
+        slot.order = self.spawned
+        self.spawned += 1
+
+    def update(self):
+        """
+        Advance every live effect by one tick, freeing finished ones.
+        """
+        for slot in self.slots:
+            if slot.active:
+                slot.frame += 1
+                if slot.frame >= len(slot.frames):
+                    slot.active = False
+
+    def draw(self, screen):
+        """
+        Draw all live effects in one batch.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+
+        Returns:
+            list[pygame.Rect]: Areas drawn.
+        """
+        batch = self._batch
+        batch.clear()
+        for slot in self.slots:
+            if slot.active:
+                batch.append((slot.frames[slot.frame], slot.pos))
+        if not batch:
+            return []
+        return screen.blits(batch)
+
+    def clear(self):
+        """
+        Stop every effect.
+        """
+        for slot in self.slots:
+            slot.active = False
+
+    @property
+    def active_count(self):
+        return sum(1 for slot in self.slots if slot.active)
@@ -2,18 +2,44 @@ import pygame
 import math
 import random
 from entities.explosion import Explosion
+from entities.projectiles import ProjectileSystem
+from utils.asset_manager import AssetManager
 
 
 class EnemyBase(pygame.sprite.Sprite):
     """
     Base class for all enemy types. Handles basic sprite setup and position.
+
+    Enemies follow a tick contract: ``tick`` is called exactly once per fixed
+    simulation step, and every timer/speed in ``update`` is expressed per tick.
     """
 
-    def __init__(self, x, y, color=(255, 0, 0)):
+    def __init__(self, x, y, color=(255, 0, 0), rng=None):
+        """
+        Args:
+            x (int): Spawn x position.
+            y (int): Spawn y position.
+            color (tuple): Fill colour of the enemy square.
+            rng (random.Random): Random source for this enemy (defaults to the global module).
+        """
         super().__init__()
-        self.image = pygame.Surface((32, 32))
-        self.image.fill(color)
+        self.rng = rng or random
+        self.image = AssetManager.solid((32, 32), color)
         self.rect = self.image.get_rect(topleft=(x, y))
+        self.previous_pos = self.rect.topleft
+
+    def tick(self, player_rect):
+        """
+        Advance the enemy by one simulation tick.
+
+        Args:
+            player_rect (pygame.Rect): Current player rect.
+
+        Returns:
+            Whatever the subclass ``update`` returns.
+        """
+        self.previous_pos = self.rect.topleft
+        return self.update(player_rect)
 
     def update(self, player_rect):
         """
@@ -21,14 +47,29 @@ class EnemyBase(pygame.sprite.Sprite):
         """
         pass
 
+    def interpolated_rect(self, alpha):
+        """
+        Rect blended between the previous and current tick, for rendering.
+
+        Args:
+            alpha (float): Fraction of a tick elapsed since the last update (0–1).
+
+        Returns:
+            pygame.Rect: Rect to render this frame.
+        """
+        x = self.previous_pos[0] + (self.rect.x - self.previous_pos[0]) * alpha
+        y = self.previous_pos[1] + (self.rect.y - self.previous_pos[1]) * alpha
+        return pygame.Rect(round(x), round(y), self.rect.width, self.rect.height)
+
 
 class PatrollingEnemy(EnemyBase):
     """
     Enemy that moves back and forth within a fixed horizontal range.
     """
+    COLOR = (255, 100, 100)
 
-    def __init__(self, x, y):
-        super().__init__(x, y, (255, 100, 100))
+    def __init__(self, x, y, rng=None):
+        super().__init__(x, y, self.COLOR, rng)
         self.original_x = x
         self.direction = 1
         self.speed = 2
@@ -42,18 +83,37 @@ class PatrollingEnemy(EnemyBase):
 
 class ChasingEnemy(EnemyBase):
     """
-    Enemy that moves horizontally toward the player if within range.
+    Enemy that moves toward the player if within range.
+    Chasers have no gravity and only move along x. With a shared FlowField they
+    take the horizontal step of the route around obstacles; where the route goes
+    straight up or down, outside the field, or without one, they move straight
+    at the player.
     """
+    COLOR = (255, 200, 100)
 
-    def __init__(self, x, y):
-        super().__init__(x, y, (255, 200, 100))
+    def __init__(self, x, y, rng=None):
+        super().__init__(x, y, self.COLOR, rng)
         self.speed = 2
         self.chase_range = 200
+        self.flow_field = None
+
+    def use_flow_field(self, flow_field):
+        """
+        Follow a shared flow field towards the player.
+
+        Args:
+            flow_field (FlowField): Field kept pointed at the player by the owner (the simulation).
+        """
+        self.flow_field = flow_field
 
     def update(self, player_rect):
         dist = math.hypot(player_rect.centerx - self.rect.centerx, player_rect.centery - self.rect.centery)
         if dist < self.chase_range:
-            if player_rect.centerx < self.rect.centerx:
+            target = self.flow_field.next_point(*self.rect.center) if self.flow_field else None
+            size = self.flow_field.tile_size if self.flow_field else 1
+            if target and target[0] // size != self.rect.centerx // size:
+                self.rect.x += max(-self.speed, min(self.speed, target[0] - self.rect.centerx))
+            elif player_rect.centerx < self.rect.centerx:
                 self.rect.x -= self.speed
             else:
                 self.rect.x += self.speed
@@ -63,9 +123,10 @@ class JumpingEnemy(EnemyBase):
     """
     Enemy that moves vertically in a sinusoidal jumping pattern.
     """
+    COLOR = (100, 255, 100)
 
-    def __init__(self, x, y):
-        super().__init__(x, y, (100, 255, 100))
+    def __init__(self, x, y, rng=None):
+        super().__init__(x, y, self.COLOR, rng)
         self.base_y = y
         self.jump_height = 40
         self.timer = 0
@@ -78,41 +139,35 @@ class JumpingEnemy(EnemyBase):
 class ShootingEnemy(EnemyBase):
     """
     Enemy that periodically fires bullets toward the player.
+    Bullets live in a ProjectileSystem; in a level every shooter shares the
+    simulation's system, which moves, culls and hit-tests them centrally.
     """
+    COLOR = (100, 100, 255)
 
-    def __init__(self, x, y):
-        super().__init__(x, y, (100, 100, 255))
+    def __init__(self, x, y, rng=None):
+        super().__init__(x, y, self.COLOR, rng)
         self.shoot_cooldown = 120
         self.shoot_timer = 0
-        self.bullets = pygame.sprite.Group()
+        self.projectiles = ProjectileSystem(capacity=16)
+        self.owns_projectiles = True
+
+    def use_projectile_system(self, projectiles):
+        """
+        Fire into a shared projectile system instead of a private one.
+
+        Args:
+            projectiles (ProjectileSystem): System updated by the owner (the simulation).
+        """
+        self.projectiles = projectiles
+        self.owns_projectiles = False
 
     def update(self, player_rect):
         self.shoot_timer += 1
         if self.shoot_timer >= self.shoot_cooldown:
             self.shoot_timer = 0
-            bullet = Bullet(self.rect.centerx, self.rect.centery, player_rect.centerx, player_rect.centery)
-            self.bullets.add(bullet)
-        self.bullets.update()
-
-
-class Bullet(pygame.sprite.Sprite):
-    """
-    Bullet fired by a ShootingEnemy, moves in a straight line toward the player.
-    """
-
-    def __init__(self, x, y, target_x, target_y):
-        super().__init__()
-        self.image = pygame.Surface((8, 8))
-        self.image.fill((255, 255, 0))
-        self.rect = self.image.get_rect(center=(x, y))
-        angle = math.atan2(target_y - y, target_x - x)
-        speed = 5
-        self.dx = math.cos(angle) * speed
-        self.dy = math.sin(angle) * speed
-
-    def update(self):
-        self.rect.x += int(self.dx)
-        self.rect.y += int(self.dy)
+            self.projectiles.spawn(self.rect.centerx, self.rect.centery, player_rect.centerx, player_rect.centery)
+        if self.owns_projectiles:
+            self.projectiles.update()
 
 
 class ExplodingEnemy(EnemyBase):
@@ -120,9 +175,10 @@ class ExplodingEnemy(EnemyBase):
     Enemy that explodes when the player is within a trigger range.
     Deals area damage and removes itself from the game.
     """
+    COLOR = (255, 150, 0)
 
-    def __init__(self, x, y):
-        super().__init__(x, y, (255, 150, 0))
+    def __init__(self, x, y, rng=None):
+        super().__init__(x, y, self.COLOR, rng)
         self.trigger_range = 80
         self.damage_radius = 80
         self.exploded = False
@@ -142,9 +198,10 @@ class TeleportingEnemy(EnemyBase):
     """
     Enemy that teleports near the player every few seconds.
     """
+    COLOR = (150, 0, 200)
 
-    def __init__(self, x, y):
-        super().__init__(x, y, (150, 0, 200))
+    def __init__(self, x, y, rng=None):
+        super().__init__(x, y, self.COLOR, rng)
         self.timer = 0
         self.teleport_interval = 90
         self.safe_distance = 100
@@ -154,20 +211,23 @@ class TeleportingEnemy(EnemyBase):
         if self.timer >= self.teleport_interval:
             self.timer = 0
             px, py = player_rect.center
-            offset_x = random.choice([-1, 1]) * random.randint(50, 100)
-            offset_y = random.choice([-1, 1]) * random.randint(30, 80)
+            offset_x = self.rng.choice([-1, 1]) * self.rng.randint(50, 100)
+            offset_y = self.rng.choice([-1, 1]) * self.rng.randint(30, 80)
             new_x = max(0, px + offset_x)
             new_y = max(0, py + offset_y)
             self.rect.center = (new_x, new_y)
+            # Teleports snap instead of sliding across the screen
+            self.previous_pos = self.rect.topleft
 
 
 class DroppingEnemy(EnemyBase):
     """
     Enemy that stays above and drops down when the player walks underneath.
     """
+    COLOR = (100, 100, 100)
 
-    def __init__(self, x, y):
-        super().__init__(x, y, (100, 100, 100))
+    def __init__(self, x, y, rng=None):
+        super().__init__(x, y, self.COLOR, rng)
         self.original_y = y
         self.speed = 8
         self.dropped = False
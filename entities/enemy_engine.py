@@ -0,0 +1,351 @@
+import math
+import numpy as np
+import pygame
+from entities.enemy import (PatrollingEnemy, ChasingEnemy, JumpingEnemy, ShootingEnemy,
+                            ExplodingEnemy, TeleportingEnemy, DroppingEnemy)
+from entities.explosion import Explosion
+from utils.asset_manager import AssetManager
+
+
+class EnemyView:
+    """
+    Read-only stand-in for an enemy sprite, built on demand from the engine arrays
+    (AIHelper, state snapshots and other code that expects ``enemy.rect``).
+    """
+    __slots__ = ("type_name", "rect", "image", "previous_pos")
+
+    def __init__(self, type_name, rect, image, previous_pos):
+        self.type_name = type_name
+        self.rect = rect
+        self.image = image
+        self.previous_pos = previous_pos
+
+    def interpolated_rect(self, alpha):
+        x = self.previous_pos[0] + (self.rect.x - self.previous_pos[0]) * alpha
+        y = self.previous_pos[1] + (self.rect.y - self.previous_pos[1]) * alpha
+        return pygame.Rect(round(x), round(y), self.rect.width, self.rect.height)
+
+
+class _EnemyBlock:
+    """
+    Struct-of-arrays state for every enemy of one type.
+    Common columns are x, y (top-left), the previous tick's position, an alive
+    flag and a spawn id; type-specific columns live in ``fields``.
+    """
+
+    def __init__(self, cls, size):
+        self.cls = cls
+        self.size = size
+        # A throwaway instance is the single source of truth for speeds, ranges and timers
+        self.proto = cls(0, 0)
+        self.image = AssetManager.solid((size, size), cls.COLOR)
+        self.pending = []
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.x = np.zeros(0, dtype=np.int64)
+        self.y = np.zeros(0, dtype=np.int64)
+        self.prev_x = np.zeros(0, dtype=np.int64)
+        self.prev_y = np.zeros(0, dtype=np.int64)
+        self.alive = np.zeros(0, dtype=bool)
+        self.fields = {}
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def build(self):
+        """
+        Move enemies queued by EnemyEngine.add into the arrays.
+        """
+        if not self.pending:
+            return
+        ids, xs, ys = (np.array(column, dtype=np.int64) for column in zip(*self.pending))
+        count = len(self.pending)
+        self.pending = []
+
+        self.ids = np.concatenate((self.ids, ids))
+        self.x = np.concatenate((self.x, xs))
+        self.y = np.concatenate((self.y, ys))
+        self.prev_x = np.concatenate((self.prev_x, xs))
+        self.prev_y = np.concatenate((self.prev_y, ys))
+        self.alive = np.concatenate((self.alive, np.ones(count, dtype=bool)))
+
+        proto = self.proto
+        initial = {}
+        if self.cls is PatrollingEnemy:
+            initial = {"origin_x": xs, "direction": np.full(count, proto.direction)}
+        elif self.cls is JumpingEnemy:
+            initial = {"base_y": ys, "timer": np.full(count, proto.timer)}
+        elif self.cls is ShootingEnemy:
+            initial = {"timer": np.full(count, proto.shoot_timer)}
+        elif self.cls is TeleportingEnemy:
+            initial = {"timer": np.full(count, proto.timer)}
+        elif self.cls is DroppingEnemy:
+            initial = {"dropped": np.zeros(count, dtype=bool)}
+        for name, column in initial.items():
+            existing = self.fields.get(name)
+            column = column.astype(column.dtype if column.dtype == bool else np.int64)
+            self.fields[name] = column if existing is None else np.concatenate((existing, column))
+
+
+class EnemyEngine:
+    """
+    Vectorized alternative to a Group of enemy sprites.
+    Enemy state is stored per type in NumPy arrays and each behaviour (patrol,
+    chase, sinusoidal jump, drop, ...) advances with one kernel per tick, so levels
+    with thousands of enemies still simulate in real time. Behaviour matches the
+    sprite classes in entities.enemy, whose constants it reads.
+    """
+    SIZE = 32
+    TYPES = (PatrollingEnemy, ChasingEnemy, JumpingEnemy, ShootingEnemy,
+             ExplodingEnemy, TeleportingEnemy, DroppingEnemy)
+
+    def __init__(self, projectiles, rng, flow_field=None):
+        """
+        Args:
+            projectiles (ProjectileSystem): System shooting enemies fire into.
+            rng (random.Random): Random source for teleports.
+            flow_field (FlowField): Shared field chasing enemies follow, if any.
+        """
+        self.projectiles = projectiles
+        self.rng = rng
+        self.flow_field = flow_field
+        self.blocks = {cls: _EnemyBlock(cls, self.SIZE) for cls in self.TYPES}
+        self.spawned = 0
+        self.kernels = {
+            PatrollingEnemy: self._update_patrolling,
+            ChasingEnemy: self._update_chasing,
+            JumpingEnemy: self._update_jumping,
+            ShootingEnemy: self._update_shooting,
+            ExplodingEnemy: self._update_exploding,
+            TeleportingEnemy: self._update_teleporting,
+            DroppingEnemy: self._update_dropping,
+        }
+
+    def add(self, cls, x, y):
+        """
+        Queue an enemy; it joins the arrays before the next update or query.
+
+        Args:
+            cls (type): One of the enemy classes in TYPES.
+            x (int): Spawn x position.
+            y (int): Spawn y position.
+        """
+        self.blocks[cls].pending.append((self.spawned, x, y))
+        self.spawned += 1
+
+    def _build(self):
+        for block in self.blocks.values():
+            block.build()
+
+    def __len__(self):
+        self._build()
+        return sum(len(block) for block in self.blocks.values())
+
+    def _live_columns(self):
+        """
+        Live enemies of every type gathered into flat arrays, in spawn order.
+
+        Returns:
+            tuple: (classes, x, y, prev_x, prev_y) where classes is a list and the rest
+                are int arrays.
+        """
+        self._build()
+        classes, columns = [], []
+        for cls, block in self.blocks.items():
+            alive = block.alive
+            if alive.any():
+                classes.append(cls)
+                columns.append((block.ids[alive], np.full(np.count_nonzero(alive), len(classes) - 1),
+                                block.x[alive], block.y[alive], block.prev_x[alive], block.prev_y[alive]))
+        if not columns:
+            empty = np.zeros(0, dtype=np.int64)
+            return [], empty, empty, empty, empty, empty
+        ids, kinds, x, y, prev_x, prev_y = (np.concatenate(column) for column in zip(*columns))
+        order = np.argsort(ids, kind="stable")
+        return classes, kinds[order], x[order], y[order], prev_x[order], prev_y[order]
+
+    def __iter__(self):
+        """
+        Yield an EnemyView per live enemy in spawn order (same order as a sprite Group).
+        """
+        classes, kinds, x, y, prev_x, prev_y = self._live_columns()
+        size = self.SIZE
+        blocks = [self.blocks[cls] for cls in classes]
+        for kind, ex, ey, px, py in zip(kinds.tolist(), x.tolist(), y.tolist(), prev_x.tolist(), prev_y.tolist()):
+            cls = classes[kind]
+            yield EnemyView(cls.__name__, pygame.Rect(ex, ey, size, size), blocks[kind].image, (px, py))
+
+    def snapshot(self):
+        """
+        Returns:
+            list[tuple]: (type name, rect tuple) per live enemy, in spawn order.
+        """
+        classes, kinds, x, y, _, _ = self._live_columns()
+        names = [cls.__name__ for cls in classes]
+        size = self.SIZE
+        return [(names[kind], (ex, ey, size, size)) for kind, ex, ey in zip(kinds.tolist(), x.tolist(), y.tolist())]
+
+    def update(self, player_rect):
+        """
+        Advance every enemy by one tick against the player's current rect.
+
+        Contact damage is not checked here: the caller tests the player against
+        live_rects() (through its broadphase) once the whole batch has moved.
+
+        Args:
+            player_rect (pygame.Rect): Current player rect.
+
+        Returns:
+            tuple: (explosions, hits) where explosions is a list of Explosion and hits
+                is the number of explosions that caught the player.
+        """
+        self._build()
+        explosions = []
+        hits = 0
+        for cls, block in self.blocks.items():
+            if not len(block.ids):
+                continue
+            block.prev_x[:] = block.x
+            block.prev_y[:] = block.y
+            hits += self.kernels[cls](block, player_rect, explosions)
+        return explosions, hits
+
+    def live_rects(self):
+        """
+        Rects of every live enemy, in spawn order.
+
+        Returns:
+            tuple: ((n, 4) int array of x, y, width, height, (n,) bool array that is
+                True for enemies that hurt on contact; exploding enemies only hurt by
+                exploding, as in the sprite loop).
+        """
+        classes, kinds, x, y, _, _ = self._live_columns()
+        rects = np.empty((len(x), 4), dtype=np.int64)
+        rects[:, 0] = x
+        rects[:, 1] = y
+        rects[:, 2:] = self.SIZE
+        contact = np.array([cls is not ExplodingEnemy for cls in classes], dtype=bool)
+        return rects, contact[kinds] if len(classes) else np.zeros(0, dtype=bool)
+
+    # --- Kernels: one vectorized step per enemy type ---
+
+    def _update_patrolling(self, block, player_rect, explosions):
+        proto = block.proto
+        direction = block.fields["direction"]
+        block.x += proto.speed * direction
+        direction[np.abs(block.x - block.fields["origin_x"]) > proto.range] *= -1
+        return 0
+
+    def _update_chasing(self, block, player_rect, explosions):
+        proto = block.proto
+        half = self.SIZE // 2
+        dx = player_rect.centerx - (block.x + half)
+        dy = player_rect.centery - (block.y + half)
+        in_range = block.alive & (dx * dx + dy * dy < proto.chase_range ** 2)
+        if not in_range.any():
+            return 0
+        speed = proto.speed
+        move_x = np.where(dx < 0, -speed, speed)
+        if self.flow_field is not None:
+            # Only the horizontal part of the route, as in ChasingEnemy.update;
+            # a vertical step keeps the straight pursuit
+            cx = block.x + half
+            next_x, _, valid = self.flow_field.next_points(cx, block.y + half)
+            sideways = valid & (next_x // self.flow_field.tile_size != cx // self.flow_field.tile_size)
+            move_x = np.where(sideways, np.clip(next_x - cx, -speed, speed), move_x)
+        block.x += np.where(in_range, move_x, 0)
+        return 0
+
+    def _update_jumping(self, block, player_rect, explosions):
+        proto = block.proto
+        timer = block.fields["timer"]
+        timer += 1
+        block.y[:] = block.fields["base_y"] + np.trunc(np.sin(timer * 0.1) * proto.jump_height).astype(np.int64)
+        return 0
+
+    def _update_shooting(self, block, player_rect, explosions):
+        proto = block.proto
+        timer = block.fields["timer"]
+        timer += 1
+        firing = np.flatnonzero(block.alive & (timer >= proto.shoot_cooldown))
+        if firing.size:
+            timer[firing] = 0
+            half = self.SIZE // 2
+            tx, ty = player_rect.center
+            for x, y in zip(block.x[firing].tolist(), block.y[firing].tolist()):
+                self.projectiles.spawn(x + half, y + half, tx, ty)
+        return 0
+
+    def _update_exploding(self, block, player_rect, explosions):
+        proto = block.proto
+        half = self.SIZE // 2
+        dx = player_rect.centerx - (block.x + half)
+        dy = player_rect.centery - (block.y + half)
+        dist_sq = dx * dx + dy * dy
+        triggered = np.flatnonzero(block.alive & (dist_sq < proto.trigger_range ** 2))
+        if not triggered.size:
+            return 0
+        block.alive[triggered] = False
+        for i in triggered.tolist():
+            explosions.append(Explosion(int(block.x[i]) + half, int(block.y[i]) + half))
+        return int(np.count_nonzero(dist_sq[triggered] < proto.damage_radius ** 2))
+
+    def _update_teleporting(self, block, player_rect, explosions):
+        proto = block.proto
+        timer = block.fields["timer"]
+        timer += 1
+        jumping = np.flatnonzero(block.alive & (timer >= proto.teleport_interval))
+        if jumping.size:
+            timer[jumping] = 0
+            rng = self.rng
+            half = self.SIZE // 2
+            px, py = player_rect.center
+            # Draws stay in spawn order so seeded runs remain reproducible
+            for i in jumping.tolist():
+                offset_x = rng.choice([-1, 1]) * rng.randint(50, 100)
+                offset_y = rng.choice([-1, 1]) * rng.randint(30, 80)
+                block.x[i] = max(0, px + offset_x) - half
+                block.y[i] = max(0, py + offset_y) - half
+            # Teleports snap instead of sliding across the screen
+            block.prev_x[jumping] = block.x[jumping]
+            block.prev_y[jumping] = block.y[jumping]
+        return 0
+
+    def _update_dropping(self, block, player_rect, explosions):
+        proto = block.proto
+        half = self.SIZE // 2
+        dropped = block.fields["dropped"]
+        block.y[dropped] += proto.speed
+        below = (np.abs(player_rect.centerx - (block.x + half)) < 20) & (player_rect.centery > block.y + half)
+        dropped |= below
+        return 0
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw every live enemy, interpolated between the last two ticks, in one
+        batched blit per type.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+            alpha (float): Fraction of a tick elapsed since the last update (0–1).
+
+        Returns:
+            list[pygame.Rect]: Areas drawn.
+        """
+        self._build()
+        drawn = []
+        for block in self.blocks.values():
+            alive = block.alive
+            if not alive.any():
+                continue
+            prev_x, prev_y = block.prev_x[alive], block.prev_y[alive]
+            x = np.rint(prev_x + (block.x[alive] - prev_x) * alpha).astype(np.int64)
+            y = np.rint(prev_y + (block.y[alive] - prev_y) * alpha).astype(np.int64)
+            image = block.image
+            drawn.extend(screen.blits([(image, pos) for pos in zip(x.tolist(), y.tolist())]))
+        return drawn
+
+    def clear(self):
+        """
+        Remove every enemy.
+        """
+        self.blocks = {cls: _EnemyBlock(cls, self.SIZE) for cls in self.TYPES}
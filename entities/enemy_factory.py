@@ -45,18 +45,19 @@ class EnemyFactory:
     }
 
     @staticmethod
-    def create_random(x, y, level):
+    def choose_class(level, rng=None):
         """
-        Randomly selects an enemy class based on level difficulty and spawns it at (x, y).
+        Pick an enemy class for the given level using the weighted pool.
 
         Args:
-            x (int): X position of the enemy spawn.
-            y (int): Y position of the enemy spawn.
             level (int): The current level, used to scale difficulty.
+            rng (random.Random): Random source (defaults to the global module).
 
         Returns:
-            EnemyBase: An instance of a randomly selected enemy subclass.
+            type: The selected EnemyBase subclass.
         """
+        rng = rng or random
+
         # Ensure level stays within 1–5
         level = max(1, min(level, 5))
 
@@ -65,5 +66,23 @@ class EnemyFactory:
         weights = [w for _, w in pool]
 
         # Use weighted random choice to select an enemy class
-        chosen_cls = random.choices(classes, weights=weights, k=1)[0]
-        return chosen_cls(x, y)
+        return rng.choices(classes, weights=weights, k=1)[0]
+
+    @staticmethod
+    def create_random(x, y, level, rng=None):
+        """
+        Randomly selects an enemy class based on level difficulty and spawns it at (x, y).
+
+        Args:
+            x (int): X position of the enemy spawn.
+            y (int): Y position of the enemy spawn.
+            level (int): The current level, used to scale difficulty.
+            rng (random.Random): Random source (defaults to the global module), also
+                handed to the enemy so seeded sessions stay reproducible.
+
+        Returns:
+            EnemyBase: An instance of a randomly selected enemy subclass.
+        """
+        rng = rng or random
+        chosen_cls = EnemyFactory.choose_class(level, rng)
+        return chosen_cls(x, y, rng=rng)
@@ -1,10 +1,13 @@
-import pygame
+from entities.effects import EffectFrames
 
 
 class Explosion:
     """
     Visual effect representing an expanding and fading explosion.
     Typically used when an ExplodingEnemy is triggered.
+
+    The game hands these to an EffectPool (see entities/effects.py); draw() is kept
+    for standalone use and also reuses the pre-rendered frames.
     """
 
     def __init__(self, x, y, radius=80, duration=30):
@@ -23,19 +26,18 @@ class Explosion:
 
         Args:
             screen (pygame.Surface): The screen to draw the explosion on.
+
+        Returns:
+            pygame.Rect | None: The area drawn, or None once the effect has finished.
         """
         if self.frame < self.duration:
-            # Calculate transparency (alpha): from 255 → 0 over duration
-            alpha = max(0, 255 - int((self.frame / self.duration) * 255))
-
-            # Create a transparent surface for the fading circle
-            surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-
-            # Draw red circle with current alpha
-            pygame.draw.circle(surface, (255, 0, 0, alpha), (self.radius, self.radius), self.radius)
+            # Pre-rendered fading circle for this frame (alpha 255 → 0 over duration)
+            surface = EffectFrames.explosion(self.radius, self.duration)[self.frame]
 
             # Blit the explosion centered at (x, y)
-            screen.blit(surface, (self.x - self.radius, self.y - self.radius))
+            rect = screen.blit(surface, (self.x - self.radius, self.y - self.radius))
 
             # Advance to the next frame
             self.frame += 1
+            return rect
+        return None
@@ -1,5 +1,6 @@
 import pygame
 import random
+from utils.collision_grid import CollisionGrid
 
 
 class Player:
@@ -8,17 +9,21 @@ class Player:
     energy management, and platform collision.
     """
 
-    def __init__(self, spawn_points, tile_size=30):
+    def __init__(self, spawn_points, tile_size=30, rng=None):
         """
         Initializes the player at one of the provided spawn points.
 
         Args:
             spawn_points (list): List of (x, y) positions to randomly choose as spawn.
             tile_size (int): Width and height of the player square.
+            rng (random.Random): Random source for spawn selection (defaults to the global module).
         """
+        self.rng = rng or random
         self.tile_size = tile_size
         self.spawn_points = spawn_points
         self.rect = pygame.Rect(0, 0, tile_size, tile_size)
+        self.previous_pos = self.rect.topleft
+        self.ticks = 0
         self.velocity_y = 0
         self.gravity = 1
         self.speed = 5
@@ -35,7 +40,7 @@ class Player:
         self.dash_duration = 10
         self.dash_timer = 0
         self.dash_cooldown = 60
-        self.last_dash_time = -self.dash_cooldown
+        self.last_dash_tick = -self.dash_cooldown
         self.direction_x = 0
 
         # ⭐ Energy
@@ -44,9 +49,40 @@ class Player:
         self.energy_regen_rate = 0.3
 
         if spawn_points:
-            self.rect.topleft = random.choice(spawn_points)
+            self.rect.topleft = self.rng.choice(spawn_points)
         else:
             self.rect.topleft = (100, 300)
+        self.previous_pos = self.rect.topleft
+
+    def update(self, keys, platforms):
+        """
+        Advances the player by one simulation tick: movement, gravity and collision.
+        All timers (dash duration, dash cooldown, energy regen) count ticks.
+
+        Args:
+            keys (pygame.key.get_pressed()): Input state for this tick.
+            platforms (list | CollisionGrid): Platforms to collide with.
+        """
+        self.previous_pos = self.rect.topleft
+        self.ticks += 1
+        move_x = self.move(keys)
+        self.apply_gravity()
+        self.check_collision_y(platforms)
+        self.check_collision_x(platforms, move_x)
+
+    def interpolated_rect(self, alpha):
+        """
+        Returns the player rect blended between the previous and current tick.
+
+        Args:
+            alpha (float): Fraction of a tick elapsed since the last update (0–1).
+
+        Returns:
+            pygame.Rect: Rect to render this frame.
+        """
+        x = self.previous_pos[0] + (self.rect.x - self.previous_pos[0]) * alpha
+        y = self.previous_pos[1] + (self.rect.y - self.previous_pos[1]) * alpha
+        return pygame.Rect(round(x), round(y), self.rect.width, self.rect.height)
 
     def move(self, keys):
         """
@@ -62,12 +98,11 @@ class Player:
 
         # ⭐ Dash trigger
         if (keys[pygame.K_LSHIFT]) or (keys[pygame.K_RSHIFT]):
-            current_time = pygame.time.get_ticks()
-            if current_time - self.last_dash_time >= self.dash_cooldown * (1000 // 60):
+            if self.ticks - self.last_dash_tick >= self.dash_cooldown:
                 if self.energy >= 20:
                     self.is_dashing = True
                     self.dash_timer = self.dash_duration
-                    self.last_dash_time = current_time
+                    self.last_dash_tick = self.ticks
                     self.energy -= 20
 
         # ⭐ Walking
@@ -116,15 +151,29 @@ class Player:
         if self.energy > self.max_energy:
             self.energy = self.max_energy
 
+    def _platform_rects(self, platforms):
+        """
+        Yields the platform rects to test against the player.
+
+        Args:
+            platforms (list | CollisionGrid): Platform tuples or the level's collision grid.
+        """
+        if isinstance(platforms, CollisionGrid):
+            yield from platforms.iter_platforms(self.rect)
+        else:
+            for plat, _ in platforms:
+                yield plat
+
     def check_collision_y(self, platforms):
         """
         Handles vertical collision with platforms (ground/ceiling).
 
         Args:
-            platforms (list): List of (Rect, type) platform tuples.
+            platforms (list | CollisionGrid): List of (Rect, type) platform tuples,
+                or a CollisionGrid built from them.
         """
         self.on_ground = False
-        for plat, _ in platforms:
+        for plat in self._platform_rects(platforms):
             if self.rect.colliderect(plat):
                 if self.velocity_y > 0:
                     self.rect.bottom = plat.top
@@ -140,11 +189,12 @@ class Player:
         Handles horizontal collision with platforms.
 
         Args:
-            platforms (list): List of (Rect, type) platform tuples.
+            platforms (list | CollisionGrid): List of (Rect, type) platform tuples,
+                or a CollisionGrid built from them.
             move_x (int): Amount of horizontal movement.
         """
         self.rect.x += move_x
-        for plat, _ in platforms:
+        for plat in self._platform_rects(platforms):
             if self.rect.colliderect(plat):
                 if move_x > 0:
                     self.rect.right = plat.left
@@ -156,15 +206,21 @@ class Player:
         Respawns the player at a random spawn point.
         """
         if self.spawn_points:
-            self.rect.topleft = random.choice(self.spawn_points)
+            self.rect.topleft = self.rng.choice(self.spawn_points)
         else:
             self.rect.topleft = (100, 300)
+        # Respawn is a jump, not a movement, so don't interpolate across it
+        self.previous_pos = self.rect.topleft
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Renders the player as a yellow rectangle.
 
         Args:
             screen (pygame.Surface): The screen to draw on.
+            alpha (float): Interpolation factor between the last two ticks.
+
+        Returns:
+            pygame.Rect: The area drawn.
         """
-        pygame.draw.rect(screen, (255, 255, 0), self.rect)
+        return pygame.draw.rect(screen, (255, 255, 0), self.interpolated_rect(alpha))
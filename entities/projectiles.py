@@ -0,0 +1,163 @@
+import math
+import numpy as np
+from utils.asset_manager import AssetManager
+
+
+class ProjectileSystem:
+    """
+    Central bullet store backed by preallocated NumPy arrays.
+    All bullets move in one vectorized step per tick, bullets leaving the level are
+    culled and their slots recycled, and player hits are tested in bulk.
+    """
+
+    def __init__(self, capacity=256, bounds=None, size=8, speed=5):
+        """
+        Args:
+            capacity (int): Maximum live bullets; when full the oldest bullet is recycled.
+            bounds (tuple): (x, y, width, height) of the area bullets may live in.
+                None disables culling.
+            size (int): Width and height of a bullet.
+            speed (int): Bullet speed in pixels per tick.
+        """
+        self.capacity = capacity
+        self.bounds = bounds
+        self.size = size
+        self.speed = speed
+
+        # Top-left positions and per-tick velocities (whole pixels, like Rect moves)
+        self.pos = np.zeros((capacity, 2), dtype=np.int32)
+        self.vel = np.zeros((capacity, 2), dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.order = np.zeros(capacity, dtype=np.int64)
+        self.spawned = 0
+        # Live bullet count, kept in step with active so idle ticks skip NumPy entirely,
+        # and one past the highest slot in use (spawns take the lowest free slot)
+        self.live = 0
+        self.top = 0
+
+        self.image = AssetManager.solid((size, size), (255, 255, 0))
+
+    def __len__(self):
+        return self.live
+
+    def spawn(self, x, y, target_x, target_y):
+        """
+        Fire a bullet from (x, y) towards (target_x, target_y).
+
+        Args:
+            x (int): Start centre x.
+            y (int): Start centre y.
+            target_x (int): Aim point x.
+            target_y (int): Aim point y.
+        """
+        free = np.flatnonzero(~self.active)
+        slot = free[0] if free.size else int(np.argmin(self.order))
+        if free.size:
+            self.live += 1
+        self.top = max(self.top, int(slot) + 1)
+
+        angle = math.atan2(target_y - y, target_x - x)
+        half = self.size // 2
+        self.pos[slot] = (x - half, y - half)
+        # Velocity truncates to whole pixels per tick, as Rect-based bullets did
+        self.vel[slot] = (int(math.cos(angle) * self.speed), int(math.sin(angle) * self.speed))
+        self.active[slot] = True
+        self.order[slot] = self.spawned
+        self.spawned += 1
+
+    def update(self):
+        """
+        Move every live bullet one tick and cull the ones outside the bounds.
+        """
+        if not self.live:
+            self.top = 0
+            return
+        # Whole-slice moves over the slots in use: free slots drift too, spawn() resets them
+        top = self.top
+        pos = self.pos[:top]
+        pos += self.vel[:top]
+
+        if self.bounds is not None:
+            bx, by, bw, bh = self.bounds
+            x = pos[:, 0]
+            y = pos[:, 1]
+            active = self.active[:top]
+            active &= (x + self.size > bx) & (x < bx + bw) & (y + self.size > by) & (y < by + bh)
+            self.live = int(np.count_nonzero(active))
+
+    def hit_test(self, rect, consume=True, candidates=None):
+        """
+        Find live bullets overlapping a rect.
+
+        Args:
+            rect (pygame.Rect): Rect to test (usually the player).
+            consume (bool): Remove the bullets that hit.
+            candidates (np.ndarray): Only test these slots (e.g. from a broadphase query).
+
+        Returns:
+            np.ndarray: Slot indices of the bullets that hit.
+        """
+        slots = np.arange(self.top) if candidates is None else np.asarray(candidates, dtype=np.int64)
+        x = self.pos[slots, 0]
+        y = self.pos[slots, 1]
+        hits = self.active[slots] & (x < rect.right) & (x + self.size > rect.left) & \
+            (y < rect.bottom) & (y + self.size > rect.top)
+        indices = slots[hits]
+        if consume and indices.size:
+            self.active[indices] = False
+            self.live -= int(indices.size)
+        return indices
+
+    def live_rects(self):
+        """
+        Returns:
+            tuple: (slots, rects) for every live bullet, rects as an (n, 4) array of
+                x, y, width, height.
+        """
+        slots = np.flatnonzero(self.active[:self.top])
+        rects = np.empty((len(slots), 4), dtype=np.int64)
+        rects[:, :2] = self.pos[slots]
+        rects[:, 2:] = self.size
+        return slots, rects
+
+    def positions(self, alpha=1.0):
+        """
+        Top-left positions of live bullets, optionally interpolated back towards
+        the previous tick for rendering.
+
+        Args:
+            alpha (float): Fraction of a tick elapsed since the last update (0–1).
+
+        Returns:
+            np.ndarray: (n, 2) array of positions.
+        """
+        active = self.active
+        pos = self.pos[active]
+        if alpha >= 1.0:
+            return pos
+        return np.rint(pos - self.vel[active] * (1.0 - alpha)).astype(np.int32)
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw every live bullet in one batch.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+            alpha (float): Interpolation factor between the last two ticks.
+
+        Returns:
+            list[pygame.Rect]: Areas drawn.
+        """
+        pos = self.positions(alpha)
+        if not len(pos):
+            return []
+        image = self.image
+        return screen.blits([(image, (x, y)) for x, y in pos.tolist()])
+
+    def clear(self):
+        """
+        Remove every bullet.
+        """
+        self.active[:] = False
+        self.live = 0
+        self.top = 0
@@ -7,6 +7,10 @@ from ui.console_screen import ConsoleScreen
 from ui.records_screen import RecordsScreen
 from ui.stats_screen import StatsScreen
 from ui.name_input_screen import NameInputScreen
+from utils.level_cache import LevelCache
+from utils.asset_manager import AssetManager
+from utils.data_logger import DataLogger
+from utils.text_cache import TextCache
 
 
 class ShadowGuideGame:
@@ -15,22 +19,38 @@ class ShadowGuideGame:
     Handles game start, level progression, and navigation between UI screens.
     """
 
-    def __init__(self):
+    def __init__(self, dirty_rects=False, max_fps=60, storage="csv"):
         """
         Initializes Pygame, window configuration, and default game state.
+
+        Args:
+            dirty_rects (bool): Use dirty-rectangle rendering on the gameplay screen.
+            max_fps (int): Gameplay render frame cap (0 = uncapped).
+            storage (str): "csv" to log stats to game_data.csv, "sqlite" for game_data.db
+                (imports the existing CSV on first use).
         """
         pygame.init()
         self.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE | pygame.SCALED)
         pygame.display.set_caption("Shadow Guide")
-        self.font = pygame.font.SysFont(None, 32)
+        self.font = TextCache.font(32)
         self.clock = pygame.time.Clock()
 
         # Load all level map paths
         self.level_maps = self.load_maps("assets/levels")
+        LevelCache.preload(self.level_maps)
+        AssetManager.preload(PlayScreen.TILE_SIZE)
+        if storage == "sqlite":
+            DataLogger.use_sqlite()
+        # Running stats for the stats/records screens, updated as rows are logged
+        DataLogger.use_aggregates()
+        # Stats are written by a background thread so gameplay never waits on the disk
+        DataLogger.start_buffered()
         self.used_maps = []
         self.current_screen = MainMenu(self.screen)
         self.level = 0
         self.player_name = None
+        self.dirty_rects = dirty_rects
+        self.max_fps = max_fps
 
     def load_maps(self, path):
         """
@@ -89,7 +109,8 @@ class ShadowGuideGame:
                     continue
 
                 previous_map = map_choice
-                self.current_screen = PlayScreen(self.screen, map_choice, self.level, self.player_name)
+                self.current_screen = PlayScreen(self.screen, map_choice, self.level, self.player_name,
+                                                 dirty_rects=self.dirty_rects, max_fps=self.max_fps)
 
             elif next_screen == "level_complete":
                 self.level += 1
@@ -104,7 +125,8 @@ class ShadowGuideGame:
                     continue
 
                 previous_map = map_choice
-                self.current_screen = PlayScreen(self.screen, map_choice, self.level, self.player_name)
+                self.current_screen = PlayScreen(self.screen, map_choice, self.level, self.player_name,
+                                                 dirty_rects=self.dirty_rects, max_fps=self.max_fps)
 
             elif next_screen == "console":
                 self.current_screen = ConsoleScreen(self.screen)
@@ -117,6 +139,7 @@ class ShadowGuideGame:
 
             self.clock.tick(60)
 
+        DataLogger.stop()
         pygame.quit()
 
     def get_next_map(self, previous_map):
@@ -156,9 +179,9 @@ class ShadowGuideGame:
         center_x = self.screen.get_width() // 2
         center_y = self.screen.get_height() // 2
 
-        title_font = pygame.font.SysFont(None, 64, bold=True)
-        text_font = pygame.font.SysFont(None, 40)
-        button_font = pygame.font.SysFont(None, 32, bold=True)
+        title_font = TextCache.font(64, bold=True)
+        text_font = TextCache.font(40)
+        button_font = TextCache.font(32, bold=True)
 
         try:
             average_score = sum(self.current_screen.total_score_list) / len(self.current_screen.total_score_list)
@@ -169,11 +192,11 @@ class ShadowGuideGame:
             self.screen.fill((0, 0, 0))
 
             # 🎉 Title
-            msg1 = title_font.render("✅ You Finished All Maps!", True, (0, 255, 0))
+            msg1 = TextCache.render(title_font, "✅ You Finished All Maps!", (0, 255, 0))
             self.screen.blit(msg1, msg1.get_rect(center=(center_x, center_y - 100)))
 
             # 📊 Score
-            msg2 = text_font.render(f"Average Score: {average_score:.2f}/10", True, (255, 255, 255))
+            msg2 = TextCache.render(text_font, f"Average Score: {average_score:.2f}/10", (255, 255, 255))
             self.screen.blit(msg2, msg2.get_rect(center=(center_x, center_y - 30)))
 
             # 🔘 Button: B to home
@@ -181,11 +204,11 @@ class ShadowGuideGame:
             pygame.draw.rect(self.screen, (50, 50, 200), back_rect, border_radius=8)
             pygame.draw.rect(self.screen, (255, 255, 255), back_rect, 2, border_radius=8)
 
-            back_text = button_font.render("Back to Home (B)", True, (255, 255, 255))
+            back_text = TextCache.render(button_font, "Back to Home (B)", (255, 255, 255))
             self.screen.blit(back_text, back_text.get_rect(center=back_rect.center))
 
             # Footer
-            footer = self.font.render("Press B to return Home", True, (180, 180, 180))
+            footer = TextCache.render(self.font, "Press B to return Home", (180, 180, 180))
             self.screen.blit(footer, footer.get_rect(center=(center_x, center_y + 110)))
 
             pygame.display.flip()
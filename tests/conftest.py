@@ -0,0 +1,12 @@
+import os
+import sys
+
+# Tests import the game packages from the repository root and never open a real window
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from utils.level_cache import LevelCache  # noqa: E402
+
+# Levels built in temporary directories must not leave entries in the shared disk cache
+LevelCache.set_disk_cache(False)
@@ -0,0 +1,20 @@
+import random
+from ai.ai_helper import AIHelper
+from entities.enemy import PatrollingEnemy
+from utils.level_simulation import LevelSimulation
+
+
+def test_hashed_and_scanned_enemy_checks_give_the_same_hints(monkeypatch):
+    sim = LevelSimulation("assets/levels/level3.txt", 3, seed=0)
+    rng = random.Random(0)
+    for _ in range(40):
+        sim.enemies.add(PatrollingEnemy(rng.randrange(sim.pixel_width), rng.randrange(600), rng=rng))
+    sim.index_enemies()
+    scanned = AIHelper(sim.player, sim.platforms, sim.enemies, sim.goal, None, sim.terrain)
+    hashed = AIHelper(sim.player, sim.platforms, sim.enemies, sim.goal, sim.entity_hash, sim.terrain)
+    assert not hashed._use_hash()
+
+    monkeypatch.setattr(AIHelper, "HASH_MIN_ENEMIES", 0)
+    for x in range(0, sim.pixel_width, 45):
+        sim.player.rect.x = x
+        assert hashed.get_hints() == scanned.get_hints()
@@ -0,0 +1,66 @@
+import random
+import pygame
+from ai.flow_field import FlowField
+from entities.enemy import ChasingEnemy
+from entities.enemy_engine import EnemyEngine
+from entities.projectiles import ProjectileSystem
+from utils.level_cache import CompiledLevel
+
+LEVEL = CompiledLevel.compile([
+    "..........",
+    "....#.....",
+    "....#.....",
+    "..........",
+    "##########",
+])
+SPAWNS = [(30, 60), (180, 30), (240, 90)]
+
+
+def test_chasers_follow_the_field_along_x_only():
+    field = FlowField(LEVEL.tiles, 30)
+    engine_field = FlowField(LEVEL.tiles, 30)
+    sprites = []
+    for x, y in SPAWNS:
+        enemy = ChasingEnemy(x, y)
+        enemy.use_flow_field(field)
+        sprites.append(enemy)
+    engine = EnemyEngine(ProjectileSystem(), random.Random(0), engine_field)
+    for x, y in SPAWNS:
+        engine.add(ChasingEnemy, x, y)
+
+    player = pygame.Rect(270, 90, 30, 30)
+    for tick in range(120):
+        player.x = 270 - tick
+        field.set_target(player)
+        engine_field.set_target(player)
+        for enemy in sprites:
+            enemy.tick(player)
+        engine.update(player)
+        assert engine.snapshot() == [("ChasingEnemy", tuple(enemy.rect)) for enemy in sprites]
+
+    # No gravity: chasers keep their height and only moved sideways
+    assert [enemy.rect.y for enemy in sprites] == [y for _, y in SPAWNS]
+    assert any(enemy.rect.x != x for enemy, (x, _) in zip(sprites, SPAWNS))
+
+
+def test_chaser_closes_in_around_an_obstacle_on_its_row():
+    level = CompiledLevel.compile([".........."] * 3 + ["......#...", "##########"])
+    player = pygame.Rect(8 * 30, 3 * 30, 30, 30)
+    for vectorized in (False, True):
+        field = FlowField(level.tiles, 30)
+        field.set_target(player)
+        if vectorized:
+            chaser = EnemyEngine(ProjectileSystem(), random.Random(0), field)
+            chaser.add(ChasingEnemy, 3 * 30, 3 * 30)
+        else:
+            chaser = ChasingEnemy(3 * 30, 3 * 30)
+            chaser.use_flow_field(field)
+
+        def distance():
+            x = chaser.snapshot()[0][1][0] if vectorized else chaser.rect.x
+            return abs(player.centerx - (x + 16))
+
+        start = distance()
+        for _ in range(60):
+            chaser.update(player) if vectorized else chaser.tick(player)
+        assert distance() < start - 30
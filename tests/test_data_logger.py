@@ -0,0 +1,67 @@
+import os
+import pytest
+from utils.aggregate_store import AggregateStore
+from utils.data_logger import DataLogger
+
+
+@pytest.fixture
+def buffered_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLogger, "FILE_PATH", str(tmp_path / "game_data.csv"))
+    monkeypatch.setattr(DataLogger, "aggregates", None)
+    DataLogger.start_buffered(flush_interval=60, batch_size=100)
+    yield tmp_path
+    DataLogger.stop(timeout=1.0)
+
+
+def log_row(name="Tester", level=1):
+    DataLogger.log(level, 5, 1, 0.4, 2, 1, 8, player_name=name)
+
+
+def logged_names():
+    return [row[0] for row in DataLogger.read_rows()]
+
+
+def test_flush_reports_a_failed_write(buffered_log, monkeypatch):
+    monkeypatch.setattr(DataLogger, "FILE_PATH", str(buffered_log / "missing" / "game_data.csv"))
+    log_row()
+    assert DataLogger.flush(timeout=1.0) is False
+
+    # The rows were kept and reach the log once it is writable
+    os.mkdir(buffered_log / "missing")
+    assert DataLogger.flush(timeout=1.0) is True
+    assert logged_names() == ["Tester"]
+
+
+def test_writer_survives_an_aggregates_failure(buffered_log, monkeypatch):
+    class BrokenAggregates:
+        def add_row(self, row):
+            raise KeyError("level")
+
+    monkeypatch.setattr(DataLogger, "aggregates", BrokenAggregates())
+    log_row("First")
+    assert DataLogger.flush(timeout=1.0) is True
+    assert DataLogger.aggregates is None
+
+    log_row("Second")
+    assert DataLogger.flush(timeout=1.0) is True
+    # Each row was written once: the failure did not leave "First" queued for a retry
+    assert logged_names() == ["First", "Second"]
+
+
+def test_aggregates_are_saved_on_stop_not_per_row(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLogger, "FILE_PATH", str(tmp_path / "game_data.csv"))
+    monkeypatch.setattr(DataLogger, "aggregates", None)
+    aggregates = DataLogger.use_aggregates()
+    saved = os.path.getmtime(aggregates.path), os.path.getsize(aggregates.path)
+
+    for level in range(1, 4):
+        log_row(level=level)
+    assert aggregates.rows == 3 and aggregates.dirty
+    assert (os.path.getmtime(aggregates.path), os.path.getsize(aggregates.path)) == saved
+
+    DataLogger.stop()
+    assert not aggregates.dirty
+    # The saved file matches the log, so the next start loads it instead of rebuilding
+    monkeypatch.setattr(AggregateStore, "rebuild", None)
+    reloaded = DataLogger.use_aggregates()
+    assert reloaded.rows == 3 and reloaded.marker == aggregates.marker
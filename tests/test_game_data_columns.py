@@ -0,0 +1,54 @@
+import csv
+import io
+import math
+import numpy as np
+from utils.data_logger import DataLogger
+from utils.game_data_columns import GameDataColumns
+
+HEADER = ", ".join(DataLogger.HEADER)
+LINES = [
+    "Alice,1,12,0,0.5,3,1,10,1,0,1,0,1,0",
+    "Bob,2,20,1,0.75,4,2,,0,1,0,1,0,1",              # blank level_score
+    '"Doe, Jane",1,8,2,1.25,1,0,6,0,0,0,1,0,0',       # quoted name with a comma
+    ' Alice ,3,30,0,0.333,2,3,9,0,0,1,0,0,1',         # padded name
+    "Carol,1,abc,0,0.5,3,1,10,1,0,1,0,1,0",            # broken: not a number
+    "Dave,1,5,0",                                      # broken: too few fields
+    "Erin,1,5,0,0.5,3,1,10,1,0,1,0,1,0,99",            # broken: too many fields
+    '"Bob",4,7,1,0.2,0,0,8,0,0,0,0,0,0',
+]
+
+
+def dict_reader_rows(text):
+    """
+    Reference parse: csv.DictReader with stripped field names and a per-field
+    conversion, skipping unreadable rows.
+    """
+    reader = csv.DictReader(io.StringIO(text))
+    reader.fieldnames = [name.strip() for name in reader.fieldnames]
+    rows = []
+    for record in reader:
+        if None in record or None in record.values():
+            continue
+        try:
+            values = [float(v) if v.strip() else math.nan for v in list(record.values())[1:]]
+        except ValueError:
+            continue
+        rows.append((record["player_name"].strip(), values))
+    return rows
+
+
+def test_parse_lines_matches_dict_reader_on_the_slow_path():
+    expected = dict_reader_rows("\n".join([HEADER] + LINES))
+    names = {}
+    codes, values = GameDataColumns.parse_lines(LINES, len(DataLogger.HEADER) - 1, names)
+
+    player_names = list(names)
+    assert [player_names[code] for code in codes] == [name for name, _ in expected]
+    assert player_names == ["Alice", "Bob", "Doe, Jane"]
+    np.testing.assert_array_equal(values, np.array([row for _, row in expected]))
+
+
+def test_blank_level_score_is_marked_invalid():
+    columns = GameDataColumns.parse("\n".join([HEADER] + LINES))
+    assert columns.score_valid.tolist() == [True, False, True, True, True]
+    assert [row[7] for row in columns.rows()] == [10, None, 6, 9, 8]
@@ -0,0 +1,42 @@
+import os
+import pytest
+from utils.level_cache import LevelCache
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(LevelCache, "CACHE_DIR", LevelCache.CACHE_DIR)
+    monkeypatch.setattr(LevelCache, "disk_enabled", LevelCache.disk_enabled)
+    monkeypatch.setattr(LevelCache, "_memory", {})
+    LevelCache.set_disk_cache(True, str(tmp_path / "cache"))
+    return tmp_path
+
+
+def write_level(path, lines):
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def cache_entries():
+    return sorted(os.listdir(LevelCache.CACHE_DIR))
+
+
+def test_prune_removes_entries_of_deleted_and_edited_levels(disk_cache):
+    kept = write_level(disk_cache / "kept.txt", ["P..G", "####"])
+    deleted = write_level(disk_cache / "deleted.txt", ["P.G", "###"])
+    edited = write_level(disk_cache / "edited.txt", ["P..", "###"])
+    for path in (kept, deleted, edited):
+        LevelCache.load(path)
+    assert len(cache_entries()) == 3
+
+    os.remove(deleted)
+    write_level(disk_cache / "edited.txt", ["P....G", "######"])
+    assert LevelCache.prune_disk() == 2
+    assert [name.split("-")[0] for name in cache_entries()] == ["kept"]
+
+
+def test_disabled_disk_cache_writes_nothing(disk_cache):
+    LevelCache.set_disk_cache(False)
+    level = LevelCache.load(write_level(disk_cache / "level.txt", ["P..G", "####"]))
+    assert level.goal == (3, 0)
+    assert not os.path.exists(LevelCache.CACHE_DIR)
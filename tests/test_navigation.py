@@ -0,0 +1,53 @@
+import math
+import pygame
+from ai.navigation import NavigationGraph
+from ai.terrain_tables import TerrainTables
+from entities.player import Player
+from utils.level_cache import CompiledLevel
+
+TILE_SIZE = 30
+
+
+def build_graph(lines):
+    level = CompiledLevel.compile(lines)
+    player = Player([(0, 0)], tile_size=TILE_SIZE)
+    terrain = TerrainTables.from_level(level, TILE_SIZE)
+    return NavigationGraph(terrain, level.goal, NavigationGraph.physics_of(player))
+
+
+def standing_rect(col, row):
+    return pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+
+def test_gap_cells_are_not_standable():
+    graph = build_graph([
+        "...........",
+        "P.........G",
+        "####...####",
+    ])
+    assert not any(col in (4, 5, 6) for col, _ in graph.nodes)
+    # Above the gap the player falls out of the level: no route from there
+    assert graph.node_at(standing_rect(5, 1)) == -1
+    assert graph.best_direction(standing_rect(5, 1)) is None
+
+
+def test_route_jumps_a_narrow_gap():
+    graph = build_graph([
+        "...........",
+        "P.........G",
+        "####...####",
+    ])
+    assert graph.best_direction(standing_rect(3, 1)) == 1
+    assert graph.goal_distance(standing_rect(0, 1)) < math.inf
+
+
+def test_no_route_through_the_pit():
+    # Far wider than any jump: the only "route" would be walking along the pit floor
+    graph = build_graph([
+        "......................",
+        "P....................G",
+        "####............######",
+    ])
+    assert graph.goal_distance(standing_rect(3, 1)) == math.inf
+    assert graph.best_direction(standing_rect(3, 1)) is None
+    assert graph.best_direction(standing_rect(17, 1)) == 1
@@ -0,0 +1,27 @@
+import pygame
+import pytest
+from ui.play_screen import PlayScreen
+from utils.data_logger import DataLogger
+from utils.input_recorder import InputRecording, ReplayDriver
+
+LEVEL = "assets/levels/level1.txt"
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    return pygame.display.set_mode((800, 600))
+
+
+def test_replay_logs_no_stats(screen, monkeypatch):
+    logged = []
+    monkeypatch.setattr(DataLogger, "log", staticmethod(lambda *args, **kwargs: logged.append(kwargs)))
+    # Skip the interactive loop: end the session straight away
+    monkeypatch.setattr(PlayScreen, "run", lambda self: self.save_stats() or "home")
+
+    PlayScreen(screen, LEVEL, 1, "Player", seed=1).run()
+    assert len(logged) == 1
+
+    recording = InputRecording(LEVEL, 1, seed=1, masks=[0] * 10, world_height=600)
+    assert ReplayDriver(recording).play(screen) == "home"
+    assert len(logged) == 1
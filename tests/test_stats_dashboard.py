@@ -0,0 +1,103 @@
+import queue
+import time
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import pytest  # noqa: E402
+from ui.stats_dashboard import StatsDashboard  # noqa: E402
+from utils.data_logger import DataLogger  # noqa: E402
+
+
+class FakeWidget:
+    def __init__(self):
+        self.packed = False
+        self.destroyed = False
+        self.text = ""
+
+    def pack(self, **kwargs):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+    def config(self, **kwargs):
+        self.text = kwargs.get("text", self.text)
+
+
+def headless_dashboard():
+    """
+    A StatsDashboard without a Tk window: after() callbacks are collected and
+    widgets are stand-ins, the worker threads and the result queue are real.
+    """
+    dashboard = StatsDashboard.__new__(StatsDashboard)
+    dashboard.__dict__.update(current_charts={}, chart_cache={}, selected=None, results=queue.Queue(),
+                              loading=set(), closed=False, status_label=FakeWidget(), scheduled=[], built=[])
+
+    def embed_plot(fig):
+        plt.close(fig)
+        widget = FakeWidget()
+        dashboard.built.append(widget)
+        return widget
+
+    dashboard.after = lambda ms, callback: dashboard.scheduled.append(callback)
+    dashboard.embed_plot = embed_plot
+    return dashboard
+
+
+def run_pending(dashboard, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while dashboard.scheduled:
+        assert time.monotonic() < deadline, "chart loading did not finish"
+        time.sleep(0.01)
+        dashboard.scheduled.pop(0)()
+
+
+@pytest.fixture
+def game_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLogger, "FILE_PATH", str(tmp_path / "game_data.csv"))
+    monkeypatch.setattr(DataLogger, "store", None)
+    monkeypatch.setattr(DataLogger, "aggregates", None)
+    for level in (1, 2, 2):
+        DataLogger.log(level, 10, 1, 0.5, 3, 1, 8, player_name="Tester")
+    DataLogger.start_buffered(flush_interval=60, batch_size=100)
+    yield
+    DataLogger.stop(timeout=1.0)
+
+
+def test_charts_are_built_once_and_shown_from_the_cache(game_log):
+    dashboard = headless_dashboard()
+    charts = [("bar", dashboard.bar_chart_data, dashboard.plot_bar_chart),
+              ("pie", dashboard.pie_chart_data, dashboard.plot_pie_chart)]
+    for chart in charts:
+        dashboard.toggle_chart(*chart)
+        assert dashboard.status_label.text == "Loading…"
+        run_pending(dashboard)
+        assert dashboard.current_charts[chart[0]].packed
+    assert len(dashboard.built) == 2
+
+    # Back to a built chart: shown before the worker has even checked the data
+    dashboard.toggle_chart(*charts[0])
+    assert dashboard.current_charts["bar"] is dashboard.built[0] and dashboard.built[0].packed
+    run_pending(dashboard)
+    assert len(dashboard.built) == 2
+
+
+def test_chart_is_rebuilt_after_a_buffered_game_is_logged(game_log):
+    dashboard = headless_dashboard()
+    chart = ("bar", dashboard.bar_chart_data, dashboard.plot_bar_chart)
+    dashboard.toggle_chart(*chart)
+    run_pending(dashboard)
+    first_version = dashboard.chart_cache["bar"][0]
+
+    # Still queued in the buffered writer: the dashboard must flush it
+    DataLogger.log(3, 20, 2, 0.4, 1, 0, 6, player_name="Tester")
+    dashboard.toggle_chart(*chart)
+    run_pending(dashboard)
+    assert dashboard.chart_cache["bar"][0] != first_version
+    assert len(dashboard.built) == 2 and dashboard.built[0].destroyed
+    assert dashboard.current_charts["bar"] is dashboard.built[1]
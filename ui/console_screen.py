@@ -1,5 +1,6 @@
 import pygame
 import textwrap
+from utils.text_cache import TextCache
 
 
 class ConsoleScreen:
@@ -17,10 +18,10 @@ class ConsoleScreen:
         """
         self.screen = screen
         self.clock = pygame.time.Clock()
-        self.title_font = pygame.font.SysFont(None, 52)
-        self.key_font = pygame.font.SysFont(None, 34, bold=True)
-        self.desc_font = pygame.font.SysFont(None, 30)
-        self.hint_font = pygame.font.SysFont(None, 28)
+        self.title_font = TextCache.font(52)
+        self.key_font = TextCache.font(34, bold=True)
+        self.desc_font = TextCache.font(30)
+        self.hint_font = TextCache.font(28)
 
         self.controls = [
             ("← / →", "Move Left / Right"),
@@ -60,7 +61,7 @@ class ConsoleScreen:
                 key_rect = pygame.Rect(base_x, current_y, key_box_w, box_h)
                 pygame.draw.rect(self.screen, (50, 50, 100), key_rect, border_radius=8)
                 pygame.draw.rect(self.screen, (180, 180, 255), key_rect, 2, border_radius=8)
-                key_render = self.key_font.render(key_text, True, (255, 255, 100))
+                key_render = TextCache.render(self.key_font, key_text, (255, 255, 100))
                 self.screen.blit(key_render, key_render.get_rect(center=key_rect.center))
 
                 # Description box
@@ -69,7 +70,7 @@ class ConsoleScreen:
                 pygame.draw.rect(self.screen, (100, 100, 200), desc_rect, 2, border_radius=8)
 
                 for j, line in enumerate(wrapped_lines[:2]):
-                    desc_render = self.desc_font.render(line, True, (255, 255, 255))
+                    desc_render = TextCache.render(self.desc_font, line, (255, 255, 255))
                     self.screen.blit(desc_render, (desc_rect.left + 12, desc_rect.top + 10 + j * 22))
 
             # Increase Y for next line
@@ -86,7 +87,7 @@ class ConsoleScreen:
 
             # Draw title
             title_y = 50 - self.scroll_offset
-            title = self.title_font.render("🎮 Controls / How to Play", True, (255, 215, 0))
+            title = TextCache.render(self.title_font, "🎮 Controls / How to Play", (255, 215, 0))
             title_rect = title.get_rect(center=(self.screen.get_width() // 2, title_y))
             self.screen.blit(title, title_rect)
 
@@ -94,7 +95,8 @@ class ConsoleScreen:
             self.draw_controls()
 
             # Draw footer hint
-            hint = self.hint_font.render("↑ / ↓ or W / S to scroll   |   Press B to go back", True, (180, 180, 180))
+            hint = TextCache.render(self.hint_font, "↑ / ↓ or W / S to scroll   |   Press B to go back",
+                                    (180, 180, 180))
             hint_rect = hint.get_rect(center=(self.screen.get_width() // 2, 560))
             self.screen.blit(hint, hint_rect)
 
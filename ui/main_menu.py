@@ -1,4 +1,6 @@
 import pygame
+from utils.asset_manager import AssetManager
+from utils.text_cache import TextCache
 
 
 class Button:
@@ -24,7 +26,7 @@ class Button:
         self.color_hover = (100, 100, 100)
         self.border_color = (255, 255, 255)
         self.text_color = (255, 255, 255)
-        self.font = pygame.font.SysFont(None, 40)
+        self.font = TextCache.font(40)
 
     def draw(self, screen):
         """
@@ -40,7 +42,7 @@ class Button:
             pygame.draw.rect(screen, self.color_idle, self.rect)
         pygame.draw.rect(screen, self.border_color, self.rect, 2)
 
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = TextCache.render(self.font, self.text, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -69,7 +71,7 @@ class MainMenu:
             screen (pygame.Surface): The main display surface.
         """
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 60)
+        self.font = TextCache.font(60)
 
         button_width = 300
         button_height = 60
@@ -106,13 +108,9 @@ class MainMenu:
         """
         top_color = (50, 150, 255)  # lightblue
         bottom_color = (80, 0, 160)  # purple
-        height = self.screen.get_height()
-        for y in range(height):
-            color_ratio = y / height
-            r = top_color[0] * (1 - color_ratio) + bottom_color[0] * color_ratio
-            g = top_color[1] * (1 - color_ratio) + bottom_color[1] * color_ratio
-            b = top_color[2] * (1 - color_ratio) + bottom_color[2] * color_ratio
-            pygame.draw.line(self.screen, (int(r), int(g), int(b)), (0, y), (self.screen.get_width(), y))
+        # Rendered once per window size and cached by the asset manager
+        background = AssetManager.gradient(self.screen.get_size(), top_color, bottom_color)
+        self.screen.blit(background, (0, 0))
 
     def run(self):
         """
@@ -126,7 +124,7 @@ class MainMenu:
             self.draw_gradient_background()
 
             # Draw title
-            title_surf = self.font.render("Shadow Guide", True, (255, 255, 255))
+            title_surf = TextCache.render(self.font, "Shadow Guide", (255, 255, 255))
             title_rect = title_surf.get_rect(center=(self.screen.get_width() // 2, 80))
             self.screen.blit(title_surf, title_rect)
 
@@ -1,4 +1,5 @@
 import pygame
+from utils.text_cache import TextCache
 
 
 class NameInputScreen:
@@ -15,7 +16,7 @@ class NameInputScreen:
         """
         self.screen = screen
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 48)
+        self.font = TextCache.font(48)
         self.input_text = ""
         self.prompt_text = "Enter your name:"
         self.next_screen = None
@@ -46,8 +47,8 @@ class NameInputScreen:
                             self.input_text += event.unicode
 
             # Render prompt and user input
-            prompt_surf = self.font.render(self.prompt_text, True, (255, 255, 255))
-            input_surf = self.font.render(self.input_text, True, (0, 255, 255))
+            prompt_surf = TextCache.render(self.font, self.prompt_text, (255, 255, 255))
+            input_surf = TextCache.render(self.font, self.input_text, (0, 255, 255))
             prompt_rect = prompt_surf.get_rect(center=(self.screen.get_width() // 2, 200))
             input_rect = input_surf.get_rect(center=(self.screen.get_width() // 2, 260))
 
@@ -1,20 +1,32 @@
 import pygame
 import time
-from pygame.sprite import Group
-from entities.enemy_factory import EnemyFactory
-from entities.player import Player
 from ai.ai_helper import AIHelper
 from utils.data_logger import DataLogger
+from utils.level_simulation import InputAction, LevelSimulation
+from utils.input_recorder import InputRecorder
+from utils.frame_profiler import FrameProfiler
+from utils.asset_manager import AssetManager
+from utils.text_cache import TextCache
+from entities.effects import EffectPool
 
 
 class PlayScreen:
     """
     Handles the main gameplay screen including player logic, enemy updates,
     level progression, death handling, UI rendering, and hint system.
+    Gameplay itself is delegated to a headless LevelSimulation; this class feeds it
+    keyboard input and renders its state.
     """
-    TILE_SIZE = 30
-
-    def __init__(self, screen, map_path, level, player_name="Unknown"):
+    TILE_SIZE = LevelSimulation.TILE_SIZE
+    BACKGROUND_COLOR = (10, 10, 40)
+    TICK_RATE = LevelSimulation.TICK_RATE
+    MAX_FRAME_TIME = 0.25
+    HINT_INTERVAL_TICKS = 3 * TICK_RATE
+    TRACE_PATH = "frame_trace.json"
+
+    def __init__(self, screen, map_path, level, player_name="Unknown", dirty_rects=False, max_fps=60,
+                 seed=None, record_path=None, replay=None, profile=False, vectorized_enemies=False,
+                 record_stats=True):
         """
         Initialize the gameplay screen and all gameplay elements.
 
@@ -23,210 +35,323 @@ class PlayScreen:
             map_path (str): Path to the level map file.
             level (int): Current level number.
             player_name (str): Name of the current player.
+            dirty_rects (bool): Only push changed areas to the display each frame
+                instead of flipping the whole window.
+            max_fps (int): Render frame cap (0 = uncapped). Simulation always runs at TICK_RATE.
+            seed (int): Seed for the session's random source (random when omitted).
+            record_path (str): If set, per-tick input is recorded and saved here when the screen exits.
+            replay (InputRecording): Drive the session from a recording instead of the keyboard
+                (its world height and enemy engine setting override the screen's).
+            profile (bool): Start with the frame phase profiler on (F3 toggles the
+                overlay, F4 exports a Chrome trace to TRACE_PATH).
+            vectorized_enemies (bool): Simulate enemies with the struct-of-arrays EnemyEngine.
+            record_stats (bool): Log the session to DataLogger when the level ends
+                (replays turn this off so they don't add fake records).
         """
         self.screen = screen
         self.map_path = map_path
         self.level = level
         self.player_name = player_name
-        self.font = pygame.font.SysFont(None, 40)
-
-        # Gameplay-related objects
-        self.platforms = []
-        self.enemies = Group()
-        self.goal = None
-        self.health = 3
+        self.use_dirty_rects = dirty_rects
+        self.previous_rects = []
+        self.full_redraw = True
+        self.max_fps = max_fps
+        self.record_stats = record_stats
+        self.font = TextCache.font(40)
+
+        # Gameplay-related objects (owned by the simulation); a replay runs with the recorded settings
+        world_height = self.screen.get_height()
+        if replay is not None:
+            world_height = replay.world_height or world_height
+            vectorized_enemies = replay.vectorized_enemies
+        self.sim = LevelSimulation(map_path, level, world_height=world_height, seed=seed,
+                                   vectorized_enemies=vectorized_enemies)
+        self.level_data = self.sim.level_data
+        self.platforms = self.sim.platforms
+        self.collision_grid = self.sim.collision_grid
+        self.enemies = self.sim.enemies
+        self.goal = self.sim.goal
+        self.spawn_points = self.sim.spawn_points
+        self.effects = EffectPool()
+        self.player = self.sim.player
         self.game_over = False
         self.level_complete = False
-        self.level_data = self.load_map()
-        self.spawn_points = []
+        self.jump_queued = False
+
+        # Input record / replay
+        self.record_path = record_path
+        self.recorder = InputRecorder(map_path, level, self.sim.seed, world_height=self.sim.world_height,
+                                      vectorized_enemies=vectorized_enemies) if record_path else None
+        self.replay_actions = replay.actions() if replay else None
+
+        # ⏱️ Frame phase profiler (shared with the simulation)
+        self.profiler = FrameProfiler(enabled=profile)
+        self.sim.profiler = self.profiler
+        self.profiler_font = TextCache.font(16, name="consolas,dejavusansmono,monospace")
 
         # Stats tracking
-        self.jump_count = 0
-        self.death_count = 0
-        self.jump_times = []
-        self.last_jump_time = None
         self.hint_count = 0
-        self.enemy_triggered = 0
-        self.level_score = 10
         self.total_score_list = []
-        self.start_time = time.time()
-        self.explosions = []
-
-        # Load images for tile rendering
-        self.tile_images = {
-            "#": pygame.transform.scale(pygame.image.load("assets/images/dirt_block_with_grass.png"),
-                                        (self.TILE_SIZE, self.TILE_SIZE)),
-            "S": pygame.transform.scale(pygame.image.load("assets/images/stone_block.png"),
-                                        (self.TILE_SIZE, self.TILE_SIZE)),
-            "W": pygame.transform.scale(pygame.image.load("assets/images/wood_block.png"),
-                                        (self.TILE_SIZE, self.TILE_SIZE))
-        }
-
-        self.goal_image = pygame.transform.scale(
-            pygame.image.load("assets/images/portal.png"),
-            (self.TILE_SIZE, self.TILE_SIZE)
-        )
 
-        # Instantiate player and helper
-        self.parse_map()
-        self.player = Player(self.spawn_points, tile_size=self.TILE_SIZE)
-        self.ai_helper = AIHelper(self.player, self.platforms, self.enemies, self.goal)
-        self.hint_font = pygame.font.SysFont(None, 30)
+        # Shared, pre-scaled and display-converted tile images
+        self.tile_images = AssetManager.tile_images(self.TILE_SIZE)
+        self.goal_image = AssetManager.goal_image(self.TILE_SIZE)
+
+        # Instantiate static layer and helper
+        self.static_layer = None
+        self.static_layer_key = None
+        self.build_static_layer()
+        self.ai_helper = AIHelper(self.player, self.platforms, self.enemies, self.goal,
+                                  self.sim.entity_hash, self.sim.terrain, self.sim.navigation)
+        self.hint_font = TextCache.font(30)
 
-        self.last_hint_time = 0
+        # Hints refresh on simulation ticks, so a replay logs the same hint counts
+        self.last_hint_tick = None
         self.current_hints = []
-        self.hint_interval = 3000
+        self.hint_interval = self.HINT_INTERVAL_TICKS
 
-    def load_map(self):
+    def build_static_layer(self):
         """
-        Load map layout from the specified map file.
-
-        Returns:
-            list[str]: List of rows in the level file.
+        Bake the background colour, every platform tile and the goal portal into one
+        cached surface. Rebuilt only when the level (map path) changes.
         """
-        with open(self.map_path, 'r') as f:
-            return [line.strip() for line in f.readlines()]
+        if self.static_layer is not None and self.static_layer_key == self.map_path:
+            return
 
-    def parse_map(self):
+        width = max(self.screen.get_width(), self.sim.pixel_width)
+        height = max(self.screen.get_height(), self.sim.pixel_height)
+
+        layer = pygame.Surface((width, height))
+        layer.fill(self.BACKGROUND_COLOR)
+        for plat, tile_type in self.platforms:
+            layer.blit(self.tile_images[tile_type], plat.topleft)
+        if self.goal:
+            layer.blit(self.goal_image, self.goal.topleft)
+
+        self.static_layer = layer
+        self.static_layer_key = self.map_path
+
+    def invalidate_static_layer(self):
         """
-        Parse level text data and build platforms, enemies, spawn points, and goal.
+        Drop the cached level surface so it is rebuilt on the next frame.
         """
-        for y, row in enumerate(self.level_data):
-            for x, tile in enumerate(row):
-                pos = pygame.Rect(x * self.TILE_SIZE, y * self.TILE_SIZE, self.TILE_SIZE, self.TILE_SIZE)
-                if tile in self.tile_images:
-                    self.platforms.append((pos, tile))
-                elif tile == 'E':
-                    enemy = EnemyFactory.create_random(pos.x, pos.y, self.level)
-                    self.enemies.add(enemy)
-                elif tile == 'G':
-                    self.goal = pos
-                elif tile == 'P':
-                    self.spawn_points.append((pos.x, pos.y))
+        self.static_layer = None
+        self.static_layer_key = None
 
     def run(self):
+        """
+        Run the gameplay loop, saving the input recording (if enabled) on exit.
+
+        Returns:
+            str: Next screen identifier ("home", "exit", or "level_complete")
+        """
+        try:
+            return self.run_loop()
+        finally:
+            if self.recorder:
+                self.recorder.save(self.record_path)
+
+    def run_loop(self):
         """
         Main gameplay loop: handles events, rendering, collision, and progression.
 
+        Simulation runs in fixed ticks of 1 / TICK_RATE seconds, consumed from an
+        accumulator of real frame time. Rendering happens once per frame and
+        interpolates between the last two ticks, so the frame rate is free to differ.
+
         Returns:
             str: Next screen identifier ("home", "exit", or "level_complete")
         """
         clock = pygame.time.Clock()
+        tick_length = 1.0 / self.TICK_RATE
+        accumulator = 0.0
+        previous_time = time.perf_counter()
 
         while True:
-            self.screen.fill((10, 10, 40))
+            now = time.perf_counter()
+            # Clamp long stalls so the simulation doesn't try to catch up forever
+            accumulator += min(now - previous_time, self.MAX_FRAME_TIME)
+            previous_time = now
+
+            self.profiler.begin_frame()
+            with self.profiler.phase("background"):
+                self.begin_frame()
 
             # Input handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "exit"
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_b and self.game_over:
-                        return "home"
-                    elif event.key in [pygame.K_SPACE, pygame.K_w]:
-                        jumped = self.player.jump()
-                        if jumped:
-                            self.jump_count += 1
-                            current_time = time.time()
-                            if self.last_jump_time:
-                                interval = current_time - self.last_jump_time
-                                self.jump_times.append(interval)
-                            self.last_jump_time = current_time
-
-            # Player movement + collision
-            keys = pygame.key.get_pressed()
-            move_x = self.player.move(keys)
-            self.player.apply_gravity()
-            self.player.check_collision_y(self.platforms)
-            self.player.check_collision_x(self.platforms, move_x)
-
-            # 💀 Player falls off the screen
-            if self.player.rect.top > self.screen.get_height():
-                result = self._handle_death()
-                if result in ["home", "exit"]:
+            with self.profiler.phase("input"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return "exit"
+                    elif event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_b and self.game_over:
+                            return "home"
+                        elif event.key in [pygame.K_SPACE, pygame.K_w]:
+                            # Consumed by the next simulation tick
+                            self.jump_queued = True
+                        elif event.key == pygame.K_F3:
+                            self.profiler.toggle()
+                        elif event.key == pygame.K_F4:
+                            self.profiler.export_chrome_trace(self.TRACE_PATH)
+                keys = pygame.key.get_pressed()
+
+            # ⏱️ Fixed-timestep simulation
+            while accumulator >= tick_length:
+                accumulator -= tick_length
+                action = self.next_action(keys)
+                result = self.update_tick(action)
+                if result:
                     return result
 
-            # 🧨 Enemy updates
-            self.explosions.clear()
-            for enemy in list(self.enemies):
-                result = enemy.update(self.player.rect)
-
-                if isinstance(result, tuple):
-                    explosion, damaged = result
-                    if explosion:
-                        self.explosions.append(explosion)
-                    if damaged:
-                        result = self._handle_death()
-                        if result in ["home", "exit"]:
-                            return result
-                elif self.player.rect.colliderect(enemy.rect):
-                    result = self._handle_death()
-                    if result in ["home", "exit"]:
-                        return result
-
-            # 🎯 # Player reaches goal
-            if self.goal and self.player.rect.colliderect(self.goal):
-                self.level_complete = True
-                self.calculate_level_score()
-                self.save_stats()
-                return self.show_level_complete()
-
-            # 🎨 Render map, enemies, goal, player, and UI
-            for plat, tile_type in self.platforms:
-                self.screen.blit(self.tile_images[tile_type], plat.topleft)
-
-            self.enemies.draw(self.screen)
-            for explosion in self.explosions:
-                explosion.draw(self.screen)
-
-            if self.goal:
-                self.screen.blit(self.goal_image, self.goal.topleft)
-
-            self.player.draw(self.screen)
-            self.draw_helper_hint()
-            self.draw_ui()
+            # 🎨 Render enemies, player, and UI on top of the static layer
+            alpha = accumulator / tick_length
+            drawn = []
+            with self.profiler.phase("render_entities"):
+                if self.sim.enemy_engine is not None:
+                    drawn.extend(self.sim.enemy_engine.draw(self.screen, alpha))
+                else:
+                    for enemy in self.enemies:
+                        drawn.append(self.screen.blit(enemy.image, enemy.interpolated_rect(alpha)))
+                drawn.extend(self.sim.projectiles.draw(self.screen, alpha))
+                drawn.extend(self.effects.draw(self.screen))
+                drawn.append(self.player.draw(self.screen, alpha))
+
+            drawn.extend(self.draw_helper_hint(alpha))
+            with self.profiler.phase("draw_ui"):
+                drawn.extend(self.draw_ui())
+            drawn.extend(self.profiler.draw_overlay(self.screen, self.profiler_font))
+
+            with self.profiler.phase("display_flip"):
+                self.present_frame(drawn)
+            self.profiler.end_frame()
+            clock.tick(self.max_fps)
+
+    def next_action(self, keys):
+        """
+        Build the input for the next tick from the keyboard or the replay,
+        recording it when recording is enabled.
 
-            pygame.display.flip()
-            clock.tick(60)
+        Args:
+            keys (pygame.key.ScancodeWrapper): Current keyboard state.
 
-    def _handle_death(self):
+        Returns:
+            InputAction: Input for the tick.
         """
-        Handle player death: reduce HP, reset position, and check game over.
+        if self.replay_actions is not None:
+            action = next(self.replay_actions, None) or InputAction()
+        else:
+            action = InputAction.from_keys(keys, jump=self.jump_queued)
+        self.jump_queued = False
+
+        if self.recorder:
+            self.recorder.record(action)
+        return action
+
+    def update_tick(self, action):
+        """
+        Advance the simulation by exactly one tick and react to the level ending.
+
+        Args:
+            action (InputAction): Input for this tick.
 
         Returns:
-            str | None: "home" or "exit" if game is over, otherwise None.
+            str | None: Next screen identifier if the level ended, otherwise None.
         """
-        self.health -= 1
-        self.level_score = max(0, self.level_score - 2)
-        self.death_count += 1
-        self.enemy_triggered += 1
-        self.player.reset_position()
-        if self.health <= 0:
+        self.sim.step(action)
+
+        # 💥 Effects live for their own duration in ticks, independent of the sim's per-tick list
+        self.effects.update()
+        for explosion in self.sim.explosions:
+            self.effects.spawn_explosion(explosion.x, explosion.y, explosion.radius, explosion.duration)
+
+        if self.sim.game_over:
             self.game_over = True
             self.save_stats()
-            result = self.show_game_over()
-            return result
+            return self.show_game_over()
+
+        # 🎯 Player reached goal
+        if self.sim.level_complete:
+            self.level_complete = True
+            self.total_score_list.append(self.sim.level_score)
+            self.save_stats()
+            return self.show_level_complete()
+
+        self.update_hints()
+        return None
 
-    def draw_helper_hint(self):
+    def update_hints(self):
         """
-        Display AI-generated hint text near the player.
+        Ask the AI helper for new hints every hint_interval simulation ticks
+        (starting with the first tick of the level).
         """
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_hint_time > self.hint_interval:
-            self.current_hints = self.ai_helper.get_hints()
-            self.last_hint_time = current_time
+        ticks = self.sim.ticks
+        if self.last_hint_tick is None or ticks - self.last_hint_tick >= self.hint_interval:
+            with self.profiler.phase("ai_hints"):
+                self.current_hints = self.ai_helper.get_hints()
+            self.last_hint_tick = ticks
             self.hint_count += len(self.current_hints)
 
-        for i, hint in enumerate(self.current_hints):
-            hint_text = self.hint_font.render(hint, True, (255, 255, 0))
-            self.screen.blit(hint_text, (self.player.rect.x - 20, self.player.rect.y - 40 - i * 20))
+    def begin_frame(self):
+        """
+        Restore the background before drawing dynamic objects.
+        In dirty-rect mode only the areas drawn last frame are restored.
+        """
+        # Static tiles + goal come from the cached layer
+        self.build_static_layer()
+        if self.use_dirty_rects and not self.full_redraw:
+            for rect in self.previous_rects:
+                self.screen.blit(self.static_layer, rect, rect)
+        else:
+            self.screen.blit(self.static_layer, (0, 0))
+
+    def present_frame(self, drawn):
+        """
+        Push the finished frame to the display.
+
+        Args:
+            drawn (list[pygame.Rect]): Areas drawn this frame.
+        """
+        if not self.use_dirty_rects:
+            pygame.display.flip()
+            return
+
+        screen_rect = self.screen.get_rect()
+        drawn = [screen_rect.clip(rect) for rect in drawn]
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            # Old positions must be pushed too, so erased objects disappear
+            pygame.display.update(self.previous_rects + drawn)
+        self.previous_rects = drawn
+
+    def draw_helper_hint(self, alpha=1.0):
+        """
+        Display the current AI-generated hints near the player (refreshed by update_hints).
+
+        Args:
+            alpha (float): Fraction of a tick elapsed since the last update, so the text
+                follows the interpolated player sprite.
+
+        Returns:
+            list[pygame.Rect]: Screen areas covered by the hints.
+        """
+        rects = []
+        with self.profiler.phase("hint_text"):
+            anchor = self.player.interpolated_rect(alpha)
+            for i, hint in enumerate(self.current_hints):
+                hint_text = TextCache.render(self.hint_font, hint, (255, 255, 0))
+                rects.append(self.screen.blit(hint_text, (anchor.x - 20, anchor.y - 40 - i * 20)))
+        return rects
 
     def draw_ui(self):
         """
         Draw player's HP and energy bar on the top-left of the screen.
+
+        Returns:
+            list[pygame.Rect]: Screen areas covered by the HUD.
         """
-        text = self.font.render(f"HP: {self.health}  Level: {self.level}", True, (255, 255, 255))
-        self.screen.blit(text, (10, 10))
+        text = TextCache.render(self.font, f"HP: {self.sim.health}  Level: {self.level}", (255, 255, 255))
+        text_rect = self.screen.blit(text, (10, 10))
 
         bar_width = 200
         bar_height = 20
@@ -235,35 +360,30 @@ class PlayScreen:
         energy_ratio = self.player.energy / self.player.max_energy
         pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
         pygame.draw.rect(self.screen, (0, 200, 255), (bar_x, bar_y, bar_width * energy_ratio, bar_height))
-        pygame.draw.rect(self.screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2)
-
-    def calculate_level_score(self):
-        """
-        Compute score based on time and jump usage, then append to history.
-        """
-        elapsed_time = time.time() - self.start_time
-        if self.jump_count > 10:
-            self.level_score = max(0, self.level_score - 1)
-        if elapsed_time > 60:
-            self.level_score = max(0, self.level_score - 1)
-        self.total_score_list.append(self.level_score)
+        bar_rect = pygame.draw.rect(self.screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2)
+        return [text_rect, bar_rect]
 
     def save_stats(self):
         """
-        Save gameplay stats to the CSV file via DataLogger.
+        Save gameplay stats to the CSV file via DataLogger (unless record_stats is off).
         """
-        avg_interval = sum(self.jump_times) / len(self.jump_times) if self.jump_times else 0.0
+        if not self.record_stats:
+            return
+        sim = self.sim
+        avg_interval = sum(sim.jump_times) / len(sim.jump_times) if sim.jump_times else 0.0
         DataLogger.log(
             level=self.level,
-            jump_count=self.jump_count,
-            death_count=self.death_count,
+            jump_count=sim.jump_count,
+            death_count=sim.death_count,
             avg_jump_interval=avg_interval,
             hint_count=self.hint_count,
-            enemy_triggered=self.enemy_triggered,
-            level_score=self.level_score,
+            enemy_triggered=sim.enemy_triggered,
+            level_score=sim.level_score,
             player_name=self.player_name,
             hint_counter=self.ai_helper.hint_counter
         )
+        # Level end: hand buffered rows to the writer thread without waiting for the disk
+        DataLogger.flush(wait=False)
         # print(f"[LOGGED] {self.player_name} - Level {self.level}")
 
     def show_level_complete(self):
@@ -278,19 +398,19 @@ class PlayScreen:
         center_x = self.screen.get_width() // 2
         center_y = self.screen.get_height() // 2
 
-        title_font = pygame.font.SysFont(None, 64, bold=True)
-        text_font = pygame.font.SysFont(None, 40)
-        button_font = pygame.font.SysFont(None, 32, bold=True)
+        title_font = TextCache.font(64, bold=True)
+        text_font = TextCache.font(40)
+        button_font = TextCache.font(32, bold=True)
 
         while True:
             self.screen.fill((15, 20, 30))  # 💠 dark theme
 
             # Title
-            title = title_font.render("✅ Level Complete!", True, (0, 255, 128))
+            title = TextCache.render(title_font, "✅ Level Complete!", (0, 255, 128))
             self.screen.blit(title, title.get_rect(center=(center_x, center_y - 120)))
 
             # Subtitle
-            subtitle = text_font.render("Advance to the next level?", True, (230, 230, 230))
+            subtitle = TextCache.render(text_font, "Advance to the next level?", (230, 230, 230))
             self.screen.blit(subtitle, subtitle.get_rect(center=(center_x, center_y - 50)))
 
             # Buttons
@@ -303,14 +423,14 @@ class PlayScreen:
             pygame.draw.rect(self.screen, (255, 255, 255), enter_rect, 2, border_radius=12)
             pygame.draw.rect(self.screen, (255, 255, 255), n_rect, 2, border_radius=12)
 
-            enter_text = button_font.render("Enter / Y", True, (255, 255, 255))
-            n_text = button_font.render("N", True, (255, 255, 255))
+            enter_text = TextCache.render(button_font, "Enter / Y", (255, 255, 255))
+            n_text = TextCache.render(button_font, "N", (255, 255, 255))
 
             self.screen.blit(enter_text, enter_text.get_rect(center=enter_rect.center))
             self.screen.blit(n_text, n_text.get_rect(center=n_rect.center))
 
             # Footer
-            footer = self.font.render("Press Enter/Y to continue or N to return", True, (180, 180, 180))
+            footer = TextCache.render(self.font, "Press Enter/Y to continue or N to return", (180, 180, 180))
             self.screen.blit(footer, footer.get_rect(center=(center_x, center_y + 110)))
 
             pygame.display.flip()
@@ -338,29 +458,29 @@ class PlayScreen:
         center_x = self.screen.get_width() // 2
         center_y = self.screen.get_height() // 2
 
-        title_font = pygame.font.SysFont(None, 64, bold=True)
-        text_font = pygame.font.SysFont(None, 40)
-        button_font = pygame.font.SysFont(None, 32, bold=True)
+        title_font = TextCache.font(64, bold=True)
+        text_font = TextCache.font(40)
+        button_font = TextCache.font(32, bold=True)
 
         average_score = sum(self.total_score_list) / len(self.total_score_list) if self.total_score_list else 0
 
         while True:
             self.screen.fill((15, 10, 10))  # 🔴 dark red background
 
-            msg1 = title_font.render("💀 Game Over!", True, (255, 80, 80))
+            msg1 = TextCache.render(title_font, "💀 Game Over!", (255, 80, 80))
             self.screen.blit(msg1, msg1.get_rect(center=(center_x, center_y - 100)))
 
-            score_text = text_font.render(f"Your Average Score: {average_score:.2f}/10", True, (240, 240, 240))
+            score_text = TextCache.render(text_font, f"Your Average Score: {average_score:.2f}/10", (240, 240, 240))
             self.screen.blit(score_text, score_text.get_rect(center=(center_x, center_y - 30)))
 
             back_rect = pygame.Rect(center_x - 100, center_y + 30, 200, 50)
             pygame.draw.rect(self.screen, (70, 70, 220), back_rect, border_radius=12)
             pygame.draw.rect(self.screen, (255, 255, 255), back_rect, 2, border_radius=12)
 
-            back_text = button_font.render("Back to Menu (B)", True, (255, 255, 255))
+            back_text = TextCache.render(button_font, "Back to Menu (B)", (255, 255, 255))
             self.screen.blit(back_text, back_text.get_rect(center=back_rect.center))
 
-            footer = self.font.render("Press B to return", True, (180, 180, 180))
+            footer = TextCache.render(self.font, "Press B to return", (180, 180, 180))
             self.screen.blit(footer, footer.get_rect(center=(center_x, center_y + 110)))
 
             pygame.display.flip()
@@ -1,13 +1,13 @@
 import pygame
-import csv
-import os
-from collections import defaultdict
+from utils.data_logger import DataLogger
+from utils.game_data_columns import GameDataColumns
+from utils.text_cache import TextCache
 
 
 class RecordsScreen:
     """
     Displays a scrollable leaderboard showing top players sorted by average score.
-    Reads from the game_data.csv file and groups by player name.
+    Reads from the game_data.csv file (or the SQLite store) and groups by player name.
     """
 
     def __init__(self, screen):
@@ -19,9 +19,9 @@ class RecordsScreen:
         """
         self.screen = screen
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 32)
-        self.title_font = pygame.font.SysFont(None, 48)
-        self.card_font = pygame.font.SysFont(None, 28)
+        self.font = TextCache.font(32)
+        self.title_font = TextCache.font(48)
+        self.card_font = TextCache.font(28)
         self.records = self.load_grouped_records()
 
         self.card_width = 580
@@ -38,32 +38,26 @@ class RecordsScreen:
         Returns:
             list[dict]: Sorted player records with name, avg_score, and sessions.
         """
-        file_path = "game_data.csv"
-        if not os.path.exists(file_path):
+        DataLogger.flush()
+        if DataLogger.aggregates is not None:
+            # Running per-player totals: cost depends on the number of players only
+            return DataLogger.aggregates.leaderboard()
+        if DataLogger.store is not None:
+            # Indexed GROUP BY, already sorted by average score
+            return DataLogger.store.leaderboard()
+
+        columns = GameDataColumns.load(DataLogger.FILE_PATH)
+        if columns is None:
             return []
 
-        scores_by_name = defaultdict(list)
-        with open(file_path, mode='r', encoding='utf-8-sig') as file:
-            reader = csv.DictReader(file)
-            reader.fieldnames = [field.strip() for field in reader.fieldnames]  # 💡 remove extra spaces in header
-
-            for row in reader:
-                try:
-                    name = row.get("player_name", "Unknown").strip()
-                    raw_score = row.get("level_score", "0")
-                    score = int(raw_score.strip()) if raw_score else 0
-                    scores_by_name[name].append(score)
-                except Exception as e:
-                    print(f"⚠️ Error parsing row: {row} => {e}")
-                    continue
-
+        # Per-player sums over the dictionary-encoded names (a missing score counts as 0)
+        sums, counts = columns.player_totals("level_score")
         grouped = []
-        for name, scores in scores_by_name.items():
-            avg = sum(scores) / len(scores)
+        for code, name in enumerate(columns.player_names):
             grouped.append({
                 "player": name,
-                "avg_score": round(avg, 2),
-                "sessions": len(scores)
+                "avg_score": round(float(sums[code] / counts[code]), 2),
+                "sessions": int(counts[code])
             })
 
         # Sort records from the highest average score to lowest
@@ -86,10 +80,10 @@ class RecordsScreen:
         pygame.draw.rect(surface, (30, 30, 60), (x, y, width, height), border_radius=12)
         pygame.draw.rect(surface, (100, 100, 200), (x, y, width, height), 2, border_radius=12)
 
-        text_rank = self.card_font.render(f"#{rank}", True, (255, 255, 100))
-        text_name = self.card_font.render(f"{player}", True, (255, 255, 255))
-        text_score = self.card_font.render(f"Avg Score: {avg_score}/10", True, (200, 255, 200))
-        text_sessions = self.card_font.render(f"Sessions: {sessions}", True, (180, 180, 255))
+        text_rank = TextCache.render(self.card_font, f"#{rank}", (255, 255, 100))
+        text_name = TextCache.render(self.card_font, f"{player}", (255, 255, 255))
+        text_score = TextCache.render(self.card_font, f"Avg Score: {avg_score}/10", (200, 255, 200))
+        text_sessions = TextCache.render(self.card_font, f"Sessions: {sessions}", (180, 180, 255))
 
         surface.blit(text_rank, (x + 12, y + 10))
         surface.blit(text_name, (x + 70, y + 10))
@@ -110,7 +104,7 @@ class RecordsScreen:
             self.screen.fill((15, 15, 35))
 
             title_y = 50 - self.scroll_offset
-            title = self.title_font.render("🏆 Top Players (by Avg Score)", True, (255, 215, 0))
+            title = TextCache.render(self.title_font, "🏆 Top Players (by Avg Score)", (255, 215, 0))
             self.screen.blit(title, title.get_rect(center=(self.screen.get_width() // 2, title_y)))
 
             current_y = 120 - self.scroll_offset
@@ -122,7 +116,7 @@ class RecordsScreen:
                     )
                 current_y += self.card_height + self.card_spacing
 
-            hint = self.font.render("↑ / ↓ or W / S to scroll   |   Press B to go back", True, (180, 180, 180))
+            hint = TextCache.render(self.font, "↑ / ↓ or W / S to scroll   |   Press B to go back", (180, 180, 180))
             self.screen.blit(hint, hint.get_rect(center=(self.screen.get_width() // 2, 560)))
 
             pygame.display.flip()
@@ -1,17 +1,35 @@
-import csv
+import queue
+import threading
+import numpy as np
 import seaborn as sns
 import tkinter as tk
 import matplotlib.pyplot as plt
 from tkinter import ttk
 from collections import defaultdict
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from utils.data_logger import DataLogger
+from utils.game_data_columns import GameDataColumns
 
 
 class StatsDashboard(tk.Tk):
     """
         A dashboard UI (using Tkinter) for displaying game statistics.
-        Contains bar chart, line chart, pie chart, and heatmap based on CSV data.
+        Contains bar chart, line chart, pie chart, and heatmap based on CSV data
+        (or SQL aggregates when DataLogger uses the SQLite store).
+
+        Chart data is computed on a worker thread and each chart's canvas is kept
+        once built, tagged with the data version it shows, so switching back to a
+        chart is instant and it is only redrawn after new games are logged.
         """
+    POLL_MS = 50
+    HINT_LABELS = [
+        ("hint_jump_now", "Jump Now!"),
+        ("hint_enemy_close", "Enemy Close!"),
+        ("hint_almost_there", "Almost There!"),
+        ("hint_go_left", "Go Left!"),
+        ("hint_go_right", "Go Right!"),
+        ("hint_be_careful", "Be Careful!")
+    ]
 
     def __init__(self):
         """
@@ -21,6 +39,12 @@ class StatsDashboard(tk.Tk):
         self.title("Statistics Dashboard")
         self.geometry("900x700")
         self.current_charts = {}
+        # Chart name -> (data version, canvas widget or None when there is no data)
+        self.chart_cache = {}
+        self.selected = None
+        self.results = queue.Queue()
+        self.loading = set()
+        self.closed = False
         self.create_widgets()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
@@ -33,18 +57,19 @@ class StatsDashboard(tk.Tk):
 
         self.content_frame = tk.Frame(self)
         self.content_frame.pack(fill=tk.BOTH, expand=True)
+        self.status_label = tk.Label(self.content_frame, text="")
 
         charts = [
-            ("Avg Jump Count Per Level", self.plot_bar_chart),
-            ("Total Death Per Level", self.plot_line_chart),
-            ("Ai Hint Type Distribution", self.plot_pie_chart),
-            ("Enemy Encounter", self.plot_heatmap)
+            ("Avg Jump Count Per Level", self.bar_chart_data, self.plot_bar_chart),
+            ("Total Death Per Level", self.line_chart_data, self.plot_line_chart),
+            ("Ai Hint Type Distribution", self.pie_chart_data, self.plot_pie_chart),
+            ("Enemy Encounter", self.heatmap_data, self.plot_heatmap)
         ]
 
         # Create toggle buttons
-        for label, func in charts:
+        for label, data_fn, plot_fn in charts:
             b = ttk.Button(self.toggle_frame, text=label,
-                           command=lambda l=label, f=func: self.toggle_chart(l, f))
+                           command=lambda l=label, d=data_fn, p=plot_fn: self.toggle_chart(l, d, p))
             b.pack(side=tk.LEFT, padx=10)
 
         # Close button
@@ -54,42 +79,130 @@ class StatsDashboard(tk.Tk):
         """
         Destroys all charts and closes the window.
         """
-        for widget in self.current_charts.values():
-            widget.destroy()
+        self.closed = True
+        for _, widget in self.chart_cache.values():
+            if widget is not None:
+                widget.destroy()
+        self.chart_cache.clear()
         self.current_charts.clear()
         self.destroy()
 
     def read_game_data(self):
         """
-        Reads and parses the game_data.csv file.
+        Loads the game_data.csv file as typed columns.
 
         Returns:
-            list[dict]: List of records (each row) as dictionaries.
+            GameDataColumns | None: The log's columns, or None if there is no log yet.
         """
-        with open("game_data.csv", "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            reader.fieldnames = [h.strip() for h in reader.fieldnames]
-            return list(reader)
+        return GameDataColumns.load(DataLogger.FILE_PATH)
 
-    def toggle_chart(self, name, plot_fn):
+    def data_version(self):
         """
-        Displays a chart and hides the previous one.
+        Identifies the current contents of the log (cheap when nothing changed).
+
+        Returns:
+            tuple: Backend plus the last SQLite row id or the CSV reader's data version.
+        """
+        if DataLogger.store is not None:
+            return "sqlite", DataLogger.store.last_id()
+        data = self.read_game_data()
+        return "csv", data.version if data is not None else None
+
+    def toggle_chart(self, name, data_fn, plot_fn):
+        """
+        Displays a chart and hides the previous one. A cached chart is shown at once;
+        either way the data is (re)checked on a worker thread and the chart is
+        rebuilt only if the log changed.
 
         Args:
             name (str): Chart label name.
-            plot_fn (function): Function that returns a matplotlib figure.
+            data_fn (function): Computes the chart data (runs on the worker thread).
+            plot_fn (function): Builds the chart widget from that data (Tk thread).
         """
         for widget in self.current_charts.values():
-            widget.destroy()
+            widget.pack_forget()
         self.current_charts.clear()
+        self.status_label.pack_forget()
+        self.selected = name
+
+        cached = self.chart_cache.get(name)
+        if cached is not None:
+            self._show(name)
+        else:
+            self.status_label.config(text="Loading…")
+            self.status_label.pack(pady=20)
+
+        if name not in self.loading:
+            self.loading.add(name)
+            known = cached[0] if cached is not None else None
+            threading.Thread(target=self._load_chart, args=(name, data_fn, plot_fn, known),
+                             name="StatsDashboardLoader", daemon=True).start()
+            if len(self.loading) == 1:
+                self.after(self.POLL_MS, self._poll_results)
+
+    def _load_chart(self, name, data_fn, plot_fn, known_version):
+        """
+        Worker thread: compute the chart data unless the cached chart is current.
+        Results go through a queue; Tk is only touched from the main thread.
+        """
+        try:
+            # Buffered rows first, or a just-finished game would not change the version
+            DataLogger.flush()
+            version = self.data_version()
+            if version == known_version:
+                self.results.put((name, plot_fn, version, False, None))
+            else:
+                self.results.put((name, plot_fn, version, True, data_fn()))
+        except Exception as e:
+            print(f"⚠️ Could not load chart data for {name}: {e}")
+            self.results.put((name, plot_fn, known_version, False, None))
+
+    def _poll_results(self):
+        """
+        Main thread: turn finished chart data into (cached) canvases.
+        """
+        if self.closed:
+            return
+        while True:
+            try:
+                name, plot_fn, version, changed, data = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.loading.discard(name)
+            if changed:
+                old = self.chart_cache.get(name)
+                if old is not None and old[1] is not None:
+                    old[1].pack_forget()
+                    old[1].destroy()
+                self.chart_cache[name] = (version, plot_fn(data) if data is not None else None)
+            elif name not in self.chart_cache:
+                # Loading failed before the chart was ever built
+                if name == self.selected:
+                    self.status_label.config(text="Could not load data")
+                continue
+            if name == self.selected and (changed or name not in self.current_charts):
+                self._show(name)
 
-        chart = plot_fn()
-        if chart:
-            self.current_charts[name] = chart
+        if self.loading:
+            self.after(self.POLL_MS, self._poll_results)
+
+    def _show(self, name):
+        for widget in self.current_charts.values():
+            widget.pack_forget()
+        self.current_charts.clear()
+        self.status_label.pack_forget()
+        widget = self.chart_cache[name][1]
+        if widget is None:
+            if name not in self.loading:
+                self.status_label.config(text="No data yet")
+                self.status_label.pack(pady=20)
+            return
+        widget.pack(fill=tk.BOTH, expand=True)
+        self.current_charts[name] = widget
 
     def embed_plot(self, fig):
         """
-        Embeds a matplotlib figure into the Tkinter frame.
+        Embeds a matplotlib figure into the Tkinter frame (packed when shown).
 
         Args:
             fig (matplotlib.Figure): The figure to embed.
@@ -100,29 +213,104 @@ class StatsDashboard(tk.Tk):
         canvas = FigureCanvasTkAgg(fig, master=self.content_frame)
         canvas.draw()
         widget = canvas.get_tk_widget()
-        widget.pack(fill=tk.BOTH, expand=True)
         plt.close(fig)
         return widget
 
-    def plot_bar_chart(self):
+    # --- Chart data (worker thread) ---
+
+    def bar_chart_data(self):
         """
-        Plots a bar chart of average jump count per level.
+        Average jump count per level.
+
+        Returns:
+            tuple | None: (levels, average jumps), or None without data.
         """
-        data = self.read_game_data()
-        level_jumps = defaultdict(list)
-        for row in data:
-            try:
-                level = int(row.get("level", 0))
-                jump = int(row.get("jump_count", 0))
-                level_jumps[level].append(jump)
-            except:
-                continue
+        if DataLogger.store is not None:
+            per_level = DataLogger.store.level_aggregates()
+            levels = [a["level"] for a in per_level]
+            avg_jumps = [a["avg_jumps"] for a in per_level]
+        else:
+            data = self.read_game_data()
+            if data is None:
+                return None
+            levels, jumps, rows = data.group_sum("jump_count", "level")
+            levels, avg_jumps = levels.tolist(), (jumps / rows).tolist()
+        return (levels, avg_jumps) if levels else None
+
+    def line_chart_data(self):
+        """
+        Total deaths per level.
+
+        Returns:
+            tuple | None: (levels, total deaths), or None without data.
+        """
+        if DataLogger.store is not None:
+            per_level = DataLogger.store.level_aggregates()
+            levels = [a["level"] for a in per_level]
+            total_deaths = [a["total_deaths"] for a in per_level]
+        else:
+            data = self.read_game_data()
+            if data is None:
+                return None
+            levels, deaths, _ = data.group_sum("death_count", "level")
+            levels, total_deaths = levels.tolist(), deaths.astype(int).tolist()
+        return (levels, total_deaths) if levels else None
+
+    def pie_chart_data(self):
+        """
+        Totals per hint type.
+
+        Returns:
+            dict: Hint label -> total.
+        """
+        hint_totals = defaultdict(int)
+        if DataLogger.store is not None:
+            sums = DataLogger.store.hint_totals()
+            for hint_key, label in self.HINT_LABELS:
+                hint_totals[label] = sums[hint_key]
+        else:
+            data = self.read_game_data()
+            for hint_key, label in self.HINT_LABELS:
+                hint_totals[label] = int(data[hint_key].sum()) if data is not None else 0
+        return dict(hint_totals)
+
+    def heatmap_data(self):
+        """
+        Simulated 10x10 grid of enemy encounters based on CSV index.
 
-        if not level_jumps:
+        Returns:
+            list[list[int]] | None: Grid rows, or None without data.
+        """
+        if DataLogger.store is not None:
+            xy_counter = DataLogger.store.encounter_grid(10)
+            if not xy_counter:
+                return None
+            heat = [[0] * 10 for _ in range(10)]
+            for (x, y), count in xy_counter.items():
+                heat[y][x] = count
+            return heat
+
+        data = self.read_game_data()
+        if data is None or not len(data):
             return None
+        i = np.arange(len(data))
+        cells = ((i * 3) % 10) * 10 + (i * 5) % 10
+        heat = np.bincount(cells, weights=data["enemy_triggered"], minlength=100)
+        return heat.astype(int).reshape(10, 10).tolist()
 
-        levels = sorted(level_jumps)
-        avg_jumps = [sum(v) / len(v) for v in [level_jumps[l] for l in levels]]
+    # --- Chart figures (Tk thread) ---
+
+    def plot_bar_chart(self, data=None):
+        """
+        Plots a bar chart of average jump count per level.
+
+        Args:
+            data (tuple): bar_chart_data() result, computed here if omitted.
+        """
+        data = data or self.bar_chart_data()
+        if not data:
+            return None
+        levels, avg_jumps = data
 
         fig, ax = plt.subplots()
         ax.bar(levels, avg_jumps, color="skyblue")
@@ -132,25 +320,17 @@ class StatsDashboard(tk.Tk):
         ax.set_xticks(levels)
         return self.embed_plot(fig)
 
-    def plot_line_chart(self):
+    def plot_line_chart(self, data=None):
         """
         Plots a line chart showing total deaths per level.
-        """
-        data = self.read_game_data()
-        level_deaths = defaultdict(list)
-        for row in data:
-            try:
-                level = int(row.get("level", 0))
-                deaths = int(row.get("death_count", 0))
-                level_deaths[level].append(deaths)
-            except:
-                continue
 
-        if not level_deaths:
+        Args:
+            data (tuple): line_chart_data() result, computed here if omitted.
+        """
+        data = data or self.line_chart_data()
+        if not data:
             return None
-
-        levels = sorted(level_deaths)
-        total_deaths = [sum(level_deaths[l]) for l in levels]
+        levels, total_deaths = data
 
         fig, ax = plt.subplots()
         ax.plot(levels, total_deaths, marker="o", color="tomato")
@@ -161,26 +341,14 @@ class StatsDashboard(tk.Tk):
         ax.set_xticks(levels)
         return self.embed_plot(fig)
 
-    def plot_pie_chart(self):
+    def plot_pie_chart(self, data=None):
         """
         Plots a pie chart of hint usage distribution by type.
-        """
-        data = self.read_game_data()
-        hint_totals = defaultdict(int)
-        for row in data:
-            for hint_key, label in [
-                ("hint_jump_now", "Jump Now!"),
-                ("hint_enemy_close", "Enemy Close!"),
-                ("hint_almost_there", "Almost There!"),
-                ("hint_go_left", "Go Left!"),
-                ("hint_go_right", "Go Right!"),
-                ("hint_be_careful", "Be Careful!")
-            ]:
-                try:
-                    hint_totals[label] += int(row.get(hint_key, 0))
-                except:
-                    continue
 
+        Args:
+            data (dict): pie_chart_data() result, computed here if omitted.
+        """
+        hint_totals = data if data is not None else self.pie_chart_data()
         labels = list(hint_totals.keys())
         sizes = list(hint_totals.values())
 
@@ -196,27 +364,17 @@ class StatsDashboard(tk.Tk):
         ax.axis("equal")
         return self.embed_plot(fig)
 
-    def plot_heatmap(self):
+    def plot_heatmap(self, data=None):
         """
         Plots a simulated heatmap of enemy encounters based on CSV index.
-        """
-        data = self.read_game_data()
-        xy_counter = defaultdict(int)
-        for i, row in enumerate(data):
-            try:
-                x = (i * 5) % 10
-                y = (i * 3) % 10
-                xy_counter[(x, y)] += int(row.get("enemy_triggered", 0))
-            except:
-                continue
 
-        if not xy_counter:
+        Args:
+            data (list): heatmap_data() result, computed here if omitted.
+        """
+        heat = data or self.heatmap_data()
+        if not heat:
             return None
 
-        heat = [[0] * 10 for _ in range(10)]
-        for (x, y), count in xy_counter.items():
-            heat[y][x] = count
-
         fig, ax = plt.subplots()
         sns.heatmap(heat, cmap="YlOrRd", annot=True, fmt="d", ax=ax)
         ax.set_title("Enemy Encounter Heatmap (simulated)")
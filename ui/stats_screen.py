@@ -1,6 +1,8 @@
 import pygame
 from ui.stats_dashboard import launch_stats_window
+from utils.data_logger import DataLogger
 from utils.visualize_data import Visualizer
+from utils.text_cache import TextCache
 
 
 class StatsScreen:
@@ -18,13 +20,23 @@ class StatsScreen:
         """
         self.screen = screen
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 32)
-        self.title_font = pygame.font.SysFont(None, 48)
-        self.label_font = pygame.font.SysFont(None, 32, bold=True)
-        self.value_font = pygame.font.SysFont(None, 32)
+        self.font = TextCache.font(32)
+        self.title_font = TextCache.font(48)
+        self.label_font = TextCache.font(32, bold=True)
+        self.value_font = TextCache.font(32)
 
+        # Make sure rows still buffered by the background writer are on disk
+        DataLogger.flush()
         self.recent_stats = Visualizer.load_recent_stats()
         self.stat_summary = Visualizer.get_statistical_summary()
+        percentiles = Visualizer.get_level_percentiles()
+        if self.stat_summary and percentiles:
+            # One line per level: jumps and deaths, p90/p99
+            self.stat_summary["P90 / P99 per Level"] = {
+                f"Level {level}": f"J {v['jump_count'][0]}/{v['jump_count'][1]}  "
+                                  f"D {v['death_count'][0]}/{v['death_count'][1]}"
+                for level, v in percentiles.items()
+            }
         self.show_recent = False
         self.show_summary = False
         self.scroll_offset = 0
@@ -48,7 +60,7 @@ class StatsScreen:
             y = 50 - self.scroll_offset
 
             # 📊 Title
-            title = self.title_font.render("\U0001f4ca Statistics", True, (255, 215, 0))
+            title = TextCache.render(self.title_font, "\U0001f4ca Statistics", (255, 215, 0))
             self.screen.blit(title, title.get_rect(center=(center_x, y)))
             y += TITLE_OFFSET
 
@@ -67,7 +79,7 @@ class StatsScreen:
                 btn_color = (0, 180, 100) if is_on else (80, 80, 80)
                 pygame.draw.rect(self.screen, btn_color, rect, border_radius=8)
                 pygame.draw.rect(self.screen, (255, 255, 255), rect, 2, border_radius=8)
-                text = self.font.render(label, True, (255, 255, 255))
+                text = TextCache.render(self.font, label, (255, 255, 255))
                 self.screen.blit(text, text.get_rect(center=rect.center))
                 button_rects.append((rect, label))
             y += btn_height + SECTION_GAP
@@ -82,8 +94,8 @@ class StatsScreen:
 
                 for i, (label, value) in enumerate(recent_lines):
                     line_y = y + 10 + i * LINE_HEIGHT
-                    label_text = self.label_font.render(f"{label}:", True, (255, 255, 255))
-                    value_text = self.value_font.render(str(value), True, (200, 255, 200))
+                    label_text = TextCache.render(self.label_font, f"{label}:", (255, 255, 255))
+                    value_text = TextCache.render(self.value_font, str(value), (200, 255, 200))
                     self.screen.blit(label_text, (box_rect.left + 20, line_y))
                     self.screen.blit(value_text, (box_rect.right - 20 - value_text.get_width(), line_y))
 
@@ -95,7 +107,7 @@ class StatsScreen:
                 for group, metrics in self.stat_summary.items():
 
                     # Section header
-                    group_title = self.label_font.render(group, True, (255, 255, 255))
+                    group_title = TextCache.render(self.label_font, group, (255, 255, 255))
                     self.screen.blit(group_title, (center_x - 200, y))
                     y += LINE_HEIGHT
 
@@ -107,15 +119,15 @@ class StatsScreen:
 
                     for i, (key, value) in enumerate(lines):
                         line_y = y + 10 + i * LINE_HEIGHT
-                        key_text = self.value_font.render(f"{key}:", True, (255, 255, 255))
-                        val_text = self.value_font.render(str(value), True, (200, 255, 200))
+                        key_text = TextCache.render(self.value_font, f"{key}:", (255, 255, 255))
+                        val_text = TextCache.render(self.value_font, str(value), (200, 255, 200))
                         self.screen.blit(key_text, (box_rect.left + 20, line_y))
                         self.screen.blit(val_text, (box_rect.right - 20 - val_text.get_width(), line_y))
 
                     y += box_height + BOX_GAP
 
             # ⌨️ Footer hint
-            hint = self.font.render("\u2191 / \u2193 scroll | B: back | Click toggle above", True, (180, 180, 180))
+            hint = TextCache.render(self.font, "\u2191 / \u2193 scroll | B: back | Click toggle above", (180, 180, 180))
             self.screen.blit(hint, hint.get_rect(center=(center_x, 560)))
 
             pygame.display.flip()
@@ -0,0 +1,315 @@
+import json
+import math
+import os
+import threading
+import time
+from utils.quantile_sketch import KLLSketch
+
+
+class RunningStat:
+    """
+    Count, sum, min, max and Welford mean/variance of one metric, updated per value.
+    """
+    __slots__ = ("count", "total", "low", "high", "mean", "m2")
+
+    def __init__(self, count=0, total=0, low=None, high=None, mean=0.0, m2=0.0):
+        self.count = count
+        self.total = total
+        self.low = low
+        self.high = high
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value):
+        """
+        Args:
+            value (int | float): New observation.
+        """
+        self.count += 1
+        self.total += value
+        self.low = value if self.low is None or value < self.low else self.low
+        self.high = value if self.high is None or value > self.high else self.high
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def stdev(self):
+        """
+        Returns:
+            float: Sample standard deviation (0.0 for fewer than two values).
+        """
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def copy(self):
+        """
+        Returns:
+            RunningStat: Independent snapshot, safe to read after the owner's lock is released.
+        """
+        return RunningStat(self.count, self.total, self.low, self.high, self.mean, self.m2)
+
+    def to_list(self):
+        return [self.count, self.total, self.low, self.high, self.mean, self.m2]
+
+    @classmethod
+    def from_list(cls, values):
+        return cls(*values)
+
+
+class AggregateStore:
+    """
+    Running statistics for every gameplay metric, overall, per player and per level,
+    saved as JSON next to the gameplay log.
+
+    DataLogger feeds each logged row to add_row (O(1) in the size of the history),
+    so the stats and records screens read finished numbers instead of rescanning
+    the log. add_row only updates memory; the owner saves now and then (see
+    dirty / saved_at). The file remembers a marker of the log it summarises (CSV
+    size or last SQLite id), so when the log changed behind its back, or rows
+    were logged after the last save, it is rebuilt once.
+
+    Medians and percentiles come from per-level KLL sketches of the SKETCHED
+    metrics (merged for overall figures), so they need bounded memory too.
+    """
+    VERSION = 2
+    METRICS = [
+        "jump_count", "death_count", "avg_jump_interval", "hint_count", "enemy_triggered", "level_score",
+        "hint_jump_now", "hint_enemy_close", "hint_almost_there", "hint_go_left", "hint_go_right", "hint_be_careful"
+    ]
+    SKETCHED = ["jump_count", "death_count", "enemy_triggered"]
+    SKETCH_K = 128
+
+    def __init__(self, path, header):
+        """
+        Args:
+            path (str): JSON file the aggregates are saved to.
+            header (list[str]): Row column order (DataLogger.HEADER).
+        """
+        self.path = path
+        self.header = header
+        self.lock = threading.Lock()
+        self.saved_at = time.monotonic()
+        self.reset()
+
+    def reset(self):
+        """
+        Forget every aggregate.
+        """
+        self.rows = 0
+        self.marker = None
+        self.overall = self._new_group()
+        # Dicts keep insertion order, so players stay in first-played order
+        self.players = {}
+        self.levels = {}
+        self.sketches = {}
+        self.merged = {}
+        self.last = None
+        # True when memory holds rows the file does not
+        self.dirty = False
+
+    def _new_group(self):
+        return {metric: RunningStat() for metric in self.METRICS}
+
+    # --- Updating ---
+
+    def add_row(self, row):
+        """
+        Fold one logged row into every aggregate.
+
+        Args:
+            row (list): Values in header order (level_score may be None).
+        """
+        record = dict(zip(self.header, row))
+        name = str(record["player_name"]).strip()
+        record["player_name"] = name
+        with self.lock:
+            player = self.players.get(name)
+            if player is None:
+                player = self.players[name] = self._new_group()
+            level = self.levels.get(record["level"])
+            if level is None:
+                level = self.levels[record["level"]] = self._new_group()
+                self.sketches[record["level"]] = {metric: KLLSketch(self.SKETCH_K) for metric in self.SKETCHED}
+            sketches = self.sketches[record["level"]]
+
+            for metric in self.METRICS:
+                value = record.get(metric)
+                if value is None:
+                    continue
+                self.overall[metric].add(value)
+                player[metric].add(value)
+                level[metric].add(value)
+                if metric in sketches:
+                    sketches[metric].update(value)
+            self.rows += 1
+            self.merged.clear()
+            self.dirty = True
+            self.last = [record[name] for name in self.header]
+
+    def rebuild(self, rows, marker):
+        """
+        Recompute everything from the full log.
+
+        Args:
+            rows (iterable): Every logged row in order.
+            marker: Log marker after these rows.
+        """
+        self.reset()
+        for row in rows:
+            self.add_row(row)
+        self.marker = marker
+
+    # --- Persistence ---
+
+    def save(self, marker):
+        """
+        Write the aggregates to disk (atomically replacing the previous file).
+
+        Args:
+            marker: Log marker the aggregates now describe.
+        """
+        with self.lock:
+            self.marker = marker
+            data = {
+                "version": self.VERSION,
+                "rows": self.rows,
+                "marker": marker,
+                "overall": self._dump_group(self.overall),
+                "players": {name: self._dump_group(group) for name, group in self.players.items()},
+                # JSON keys are strings; levels are kept as [level, group] pairs
+                "levels": [[level, self._dump_group(group)] for level, group in self.levels.items()],
+                "sketches": [[level, {metric: sketch.to_dict() for metric, sketch in group.items()}]
+                             for level, group in self.sketches.items()],
+                "last": self.last
+            }
+            self.saved_at = time.monotonic()
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.path)
+        with self.lock:
+            if self.rows == data["rows"]:
+                self.dirty = False
+
+    def load(self):
+        """
+        Read saved aggregates, if any.
+
+        Returns:
+            bool: True if the file existed and was readable.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                return False
+            self.rows = data["rows"]
+            self.marker = data["marker"]
+            self.overall = self._load_group(data["overall"])
+            self.players = {name: self._load_group(group) for name, group in data["players"].items()}
+            self.levels = {level: self._load_group(group) for level, group in data["levels"]}
+            self.sketches = {level: {metric: KLLSketch.from_dict(sketch) for metric, sketch in group.items()}
+                             for level, group in data["sketches"]}
+            self.last = data["last"]
+            self.merged.clear()
+            return True
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"⚠️ Ignoring unreadable stats file {self.path}: {e}")
+            self.reset()
+            return False
+
+    def _dump_group(self, group):
+        return {metric: stat.to_list() for metric, stat in group.items() if stat.count}
+
+    def _load_group(self, data):
+        group = self._new_group()
+        for metric, values in data.items():
+            group[metric] = RunningStat.from_list(values)
+        return group
+
+    # --- Queries ---
+
+    def leaderboard(self):
+        """
+        Returns:
+            list[dict]: player, avg_score and sessions per player, highest average first.
+        """
+        with self.lock:
+            board = []
+            for name, group in self.players.items():
+                score = group["level_score"]
+                # Sessions count every row; a missing score counts as 0, like the CSV leaderboard
+                sessions = group["jump_count"].count
+                board.append({
+                    "player": name,
+                    "avg_score": round(score.total / sessions, 2) if sessions else 0.0,
+                    "sessions": sessions
+                })
+        board.sort(key=lambda r: r["avg_score"], reverse=True)
+        return board
+
+    def latest_record(self):
+        """
+        Returns:
+            tuple: (latest row as a dict, that player's average level_score or None),
+                or (None, None) before anything was logged.
+        """
+        with self.lock:
+            if self.last is None:
+                return None, None
+            record = dict(zip(self.header, self.last))
+            score = self.players[record["player_name"]]["level_score"]
+            return record, (score.mean if score.count else None)
+
+    def _sketch(self, metric, level=None):
+        if level is not None:
+            group = self.sketches.get(level)
+            return group[metric] if group else None
+        merged = self.merged.get(metric)
+        if merged is None:
+            # Room for every level's items: the merge itself adds no error
+            merged = KLLSketch.merged((group[metric] for group in self.sketches.values()),
+                                      self.SKETCH_K * max(1, len(self.sketches)))
+            self.merged[metric] = merged
+        return merged
+
+    def quantile(self, metric, q, level=None):
+        """
+        Args:
+            metric (str): One of SKETCHED.
+            q (float): Fraction in [0, 1] (0.9 for p90).
+            level (int): Level to look at, None for every level.
+
+        Returns:
+            int | float | None: Estimated nearest-rank quantile, None without data.
+        """
+        with self.lock:
+            sketch = self._sketch(metric, level)
+            return sketch.quantile(q) if sketch else None
+
+    def median(self, metric, level=None):
+        """
+        Args:
+            metric (str): One of SKETCHED.
+            level (int): Level to look at, None for every level.
+
+        Returns:
+            int | float | None: Estimated median (as statistics.median computes it), None without data.
+        """
+        with self.lock:
+            sketch = self._sketch(metric, level)
+            return sketch.median() if sketch else None
+
+    def level_percentiles(self, metrics, quantiles):
+        """
+        Args:
+            metrics (list[str]): SKETCHED metrics to report.
+            quantiles (list[float]): Fractions to report (e.g. [0.9, 0.99]).
+
+        Returns:
+            dict: level -> metric -> list of estimated quantiles, by level.
+        """
+        with self.lock:
+            return {level: {metric: [self.sketches[level][metric].quantile(q) for q in quantiles]
+                            for metric in metrics}
+                    for level in sorted(self.sketches)}
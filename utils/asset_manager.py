@@ -0,0 +1,155 @@
+import os
+import pygame
+
+
+class AssetManager:
+    """
+    Process-wide cache of ready-to-blit surfaces.
+    Each image is loaded, scaled and converted to the display format once, then
+    shared by PlayScreen, enemies and the UI screens.
+    """
+    IMAGE_DIR = "assets/images"
+    TILE_IMAGES = {
+        "#": "dirt_block_with_grass.png",
+        "S": "stone_block.png",
+        "W": "wood_block.png"
+    }
+    GOAL_IMAGE = "portal.png"
+
+    _surfaces = {}
+
+    @staticmethod
+    def _display_ready():
+        """
+        convert()/convert_alpha() need a display mode; headless runs skip them.
+        """
+        return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+    @staticmethod
+    def image(name, size=None):
+        """
+        Get an image from assets/images, scaled and converted to the display format.
+
+        Args:
+            name (str): File name inside IMAGE_DIR (or a full path).
+            size (tuple): Optional (width, height) to scale to.
+
+        Returns:
+            pygame.Surface: The cached surface (shared, do not draw on it).
+        """
+        converted = AssetManager._display_ready()
+        key = ("image", name, size, converted)
+        surface = AssetManager._surfaces.get(key)
+        if surface is not None:
+            return surface
+
+        path = name if os.path.exists(name) else os.path.join(AssetManager.IMAGE_DIR, name)
+        surface = pygame.image.load(path)
+        if size:
+            surface = pygame.transform.scale(surface, size)
+        if converted:
+            # Keep per-pixel alpha (e.g. the portal), otherwise use the plain display format
+            if surface.get_flags() & pygame.SRCALPHA:
+                surface = surface.convert_alpha()
+            else:
+                surface = surface.convert()
+
+        AssetManager._surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def tile_images(tile_size):
+        """
+        Args:
+            tile_size (int): Width and height of one tile.
+
+        Returns:
+            dict: Tile character -> scaled tile surface.
+        """
+        return {char: AssetManager.image(name, (tile_size, tile_size))
+                for char, name in AssetManager.TILE_IMAGES.items()}
+
+    @staticmethod
+    def goal_image(tile_size):
+        """
+        Args:
+            tile_size (int): Width and height of one tile.
+
+        Returns:
+            pygame.Surface: Scaled goal portal surface.
+        """
+        return AssetManager.image(AssetManager.GOAL_IMAGE, (tile_size, tile_size))
+
+    @staticmethod
+    def solid(size, color):
+        """
+        Get a plain filled rectangle surface (enemy and bullet sprites).
+
+        Args:
+            size (tuple): (width, height).
+            color (tuple): RGB fill colour.
+
+        Returns:
+            pygame.Surface: The cached surface.
+        """
+        converted = AssetManager._display_ready()
+        key = ("solid", size, tuple(color), converted)
+        surface = AssetManager._surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            if converted:
+                surface = surface.convert()
+            AssetManager._surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def gradient(size, top_color, bottom_color):
+        """
+        Get a vertical gradient surface (e.g. the main menu background).
+
+        Args:
+            size (tuple): (width, height).
+            top_color (tuple): RGB colour of the top row.
+            bottom_color (tuple): RGB colour of the bottom row.
+
+        Returns:
+            pygame.Surface: The cached surface.
+        """
+        converted = AssetManager._display_ready()
+        key = ("gradient", size, tuple(top_color), tuple(bottom_color), converted)
+        surface = AssetManager._surfaces.get(key)
+        if surface is not None:
+            return surface
+
+        width, height = size
+        surface = pygame.Surface(size)
+        for y in range(height):
+            color_ratio = y / height
+            r = top_color[0] * (1 - color_ratio) + bottom_color[0] * color_ratio
+            g = top_color[1] * (1 - color_ratio) + bottom_color[1] * color_ratio
+            b = top_color[2] * (1 - color_ratio) + bottom_color[2] * color_ratio
+            pygame.draw.line(surface, (int(r), int(g), int(b)), (0, y), (width, y))
+        if converted:
+            surface = surface.convert()
+
+        AssetManager._surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def preload(tile_size=30):
+        """
+        Load and convert the level images up front (call after the display is created).
+
+        Args:
+            tile_size (int): Tile size the images are scaled to.
+        """
+        AssetManager.tile_images(tile_size)
+        AssetManager.goal_image(tile_size)
+
+    @staticmethod
+    def clear():
+        """
+        Drop every cached surface.
+        """
+        AssetManager._surfaces.clear()
@@ -0,0 +1,79 @@
+from collections import defaultdict
+
+
+class CollisionGrid:
+    """
+    Uniform grid over the static level tiles, keyed by tile coordinates.
+    Built once per level so collision checks only visit the cells a rect overlaps
+    instead of every platform in the map.
+    """
+
+    def __init__(self, platforms, cell_size):
+        """
+        Index every platform into the grid cells it covers.
+
+        Args:
+            platforms (list): List of (Rect, type) platform tuples, in map order.
+            cell_size (int): Width and height of one grid cell (normally the tile size).
+        """
+        self.platforms = platforms
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+
+        for index, (plat, _) in enumerate(platforms):
+            for cell in self._cells_for(plat):
+                self.cells[cell].append(index)
+
+    def _cells_for(self, rect):
+        """
+        Yield the (col, row) keys of every cell overlapped by a rect.
+
+        Args:
+            rect (pygame.Rect): Area to cover.
+        """
+        size = self.cell_size
+        for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for col in range(rect.left // size, (rect.right - 1) // size + 1):
+                yield col, row
+
+    def query(self, rect):
+        """
+        Find the platforms stored in the cells overlapped by a rect.
+
+        Args:
+            rect (pygame.Rect): Area to look up.
+
+        Returns:
+            list[int]: Sorted platform indices (map order) near the rect.
+        """
+        found = set()
+        for cell in self._cells_for(rect):
+            found.update(self.cells.get(cell, ()))
+        return sorted(found)
+
+    def iter_platforms(self, rect):
+        """
+        Yield candidate platform rects in map order, following a rect that the caller
+        may move while iterating (e.g. collision resolution).
+
+        Whenever the rect changes, the neighbourhood is looked up again and iteration
+        resumes after the last yielded platform. This visits exactly the platforms a
+        full in-order scan would find colliding, so resolution results are unchanged.
+
+        Args:
+            rect (pygame.Rect): The moving rect (read again after every yield).
+        """
+        last = -1
+        while True:
+            before = tuple(rect)
+            moved = False
+            for index in self.query(rect):
+                if index <= last:
+                    continue
+                last = index
+                yield self.platforms[index][0]
+                if tuple(rect) != before:
+                    moved = True
+                    break
+            if not moved:
+                return
@@ -1,11 +1,30 @@
+import atexit
 import csv
 import os
+import queue
+import threading
+import time
+from utils.aggregate_store import AggregateStore
+from utils.game_data_columns import GameDataColumns
+from utils.record_store import RecordStore
 
 
 class DataLogger:
     """
     Utility class for logging gameplay data to a CSV file.
     Used to record player actions and performance for statistics analysis.
+
+    By default every log call appends to the file directly. After
+    start_buffered(), rows are queued instead and a background writer thread
+    appends them in batches, so the game loop never waits on disk I/O.
+
+    After use_sqlite(), rows go to a RecordStore (SQLite) instead of the CSV
+    file, and the stats screens run their aggregates as SQL queries.
+
+    After use_aggregates(), every written row also updates an AggregateStore,
+    so summaries and the leaderboard no longer depend on the log's length. The
+    store is updated in memory and saved at most every AGGREGATES_SAVE_INTERVAL
+    seconds, by stop() and at exit.
     """
     FILE_PATH = "game_data.csv"
     HEADER = [
@@ -14,12 +33,17 @@ class DataLogger:
         "hint_jump_now", "hint_enemy_close", "hint_almost_there",
         "hint_go_left", "hint_go_right", "hint_be_careful"
     ]
+    AGGREGATES_SAVE_INTERVAL = 30.0
+
+    _writer = None
+    store = None
+    aggregates = None
 
     @staticmethod
     def log(level, jump_count, death_count, avg_jump_interval, hint_count,
             enemy_triggered, level_score, player_name="Unknown", hint_counter=None):
         """
-        Appends a new gameplay record to the CSV file.
+        Appends a new gameplay record to the CSV file (queued when buffered).
 
         Args:
             level (int): Current level number.
@@ -33,23 +57,324 @@ class DataLogger:
             hint_counter (dict): Dictionary containing counts of each hint type.
         """
         hcount = hint_counter or {}
-        file_exists = os.path.isfile(DataLogger.FILE_PATH)
-
-        with open(DataLogger.FILE_PATH, "a", newline='', encoding="utf-8") as f:
-            writer = csv.writer(f)
-
-            # Write header only if file doesn't exist yet
-            if not file_exists:
-                writer.writerow(DataLogger.HEADER)
-
-            # Write the gameplay row
-            writer.writerow([
-                player_name, level, jump_count, death_count,
-                round(avg_jump_interval, 3), hint_count, enemy_triggered, level_score,
-                hcount.get("Jump Now!", 0),
-                hcount.get("Enemy Close!", 0),
-                hcount.get("Almost There!", 0),
-                hcount.get("Go Left!", 0),
-                hcount.get("Go Right!", 0),
-                hcount.get("Be Careful!", 0)
-            ])
+        row = [
+            player_name, level, jump_count, death_count,
+            round(avg_jump_interval, 3), hint_count, enemy_triggered, level_score,
+            hcount.get("Jump Now!", 0),
+            hcount.get("Enemy Close!", 0),
+            hcount.get("Almost There!", 0),
+            hcount.get("Go Left!", 0),
+            hcount.get("Go Right!", 0),
+            hcount.get("Be Careful!", 0)
+        ]
+
+        if DataLogger._writer is not None:
+            DataLogger._writer.submit(row)
+        else:
+            DataLogger.write_rows([row])
+
+    @staticmethod
+    def write_rows(rows):
+        """
+        Append rows to the CSV file, writing the header first if the file is new
+        (or to the SQLite store when one is in use).
+
+        Args:
+            rows (list[list]): Rows in HEADER order.
+        """
+        DataLogger._append_rows(rows)
+        DataLogger._update_aggregates(rows)
+
+    @staticmethod
+    def _append_rows(rows):
+        """
+        Write rows to the backend (SQLite store or CSV file) only.
+        """
+        if DataLogger.store is not None:
+            DataLogger.store.insert_rows(rows)
+        else:
+            file_exists = os.path.isfile(DataLogger.FILE_PATH)
+
+            with open(DataLogger.FILE_PATH, "a", newline='', encoding="utf-8") as f:
+                writer = csv.writer(f)
+
+                # Write header only if file doesn't exist yet
+                if not file_exists:
+                    writer.writerow(DataLogger.HEADER)
+
+                # Write the gameplay rows
+                writer.writerows(rows)
+
+    @staticmethod
+    def _update_aggregates(rows):
+        """
+        Feed rows that are already in the log to the aggregates (if in use).
+        Never raises: the rows are safe, and stale aggregates are rebuilt from the log next start.
+        """
+        aggregates = DataLogger.aggregates
+        if aggregates is None:
+            return
+        try:
+            for row in rows:
+                aggregates.add_row(row)
+        except Exception as e:
+            # Half-applied rows would skew every figure: fall back to reading the log
+            DataLogger.aggregates = None
+            print(f"⚠️ Gameplay aggregates disabled until restart: {e}")
+            return
+        if time.monotonic() - aggregates.saved_at >= DataLogger.AGGREGATES_SAVE_INTERVAL:
+            # Runs right after the append, so the marker matches the rows in memory
+            DataLogger._save_aggregates()
+
+    @staticmethod
+    def save_aggregates():
+        """
+        Write logged rows out, then save the aggregates if they changed since the last save.
+
+        Returns:
+            bool: False if the file could not be written.
+        """
+        DataLogger.flush()
+        return DataLogger._save_aggregates()
+
+    @staticmethod
+    def _save_aggregates():
+        aggregates = DataLogger.aggregates
+        if aggregates is None or not aggregates.dirty:
+            return True
+        try:
+            aggregates.save(DataLogger._data_marker())
+            return True
+        except OSError as e:
+            # The rows are safe; a stale stats file is rebuilt from the log next start
+            print(f"⚠️ Could not save gameplay aggregates: {e}")
+            return False
+
+    @staticmethod
+    def use_sqlite(db_path="game_data.db", import_csv=True):
+        """
+        Store records in an SQLite database instead of the CSV file.
+
+        Args:
+            db_path (str): Database file (created if missing).
+            import_csv (bool): Copy the existing CSV log into the database if it is empty.
+
+        Returns:
+            RecordStore: The store now in use.
+        """
+        # Saved with the CSV marker they describe, before the backend changes
+        DataLogger.save_aggregates()
+        store = RecordStore(db_path)
+        if import_csv and not len(store):
+            count = store.import_csv(DataLogger.FILE_PATH)
+            if count:
+                print(f"📥 Imported {count} records from {DataLogger.FILE_PATH} into {db_path}")
+        DataLogger.store = store
+        if DataLogger.aggregates is not None:
+            # Summarise the new backend instead
+            DataLogger.use_aggregates()
+        return store
+
+    @staticmethod
+    def use_aggregates(path=None):
+        """
+        Keep running aggregates of the log, saved next to it. If the saved file does
+        not match the current log (first use, log edited by hand, rows logged after
+        the last save), it is rebuilt from the log once.
+
+        Args:
+            path (str): JSON file, defaults to "<log name>_stats.json".
+
+        Returns:
+            AggregateStore: The aggregates now in use.
+        """
+        DataLogger.save_aggregates()
+        if path is None:
+            source = DataLogger.store.path if DataLogger.store is not None else DataLogger.FILE_PATH
+            path = os.path.splitext(source)[0] + "_stats.json"
+        aggregates = AggregateStore(path, DataLogger.HEADER)
+        marker = DataLogger._data_marker()
+        if not aggregates.load() or aggregates.marker != marker:
+            aggregates.rebuild(DataLogger.read_rows(), marker)
+            aggregates.save(marker)
+        DataLogger.aggregates = aggregates
+        atexit.unregister(DataLogger.save_aggregates)
+        atexit.register(DataLogger.save_aggregates)
+        return aggregates
+
+    @staticmethod
+    def read_rows(csv_path=None):
+        """
+        Read the whole log (CSV or SQLite) as typed rows, skipping unreadable lines.
+
+        Args:
+            csv_path (str): CSV file to read when not using SQLite, defaults to FILE_PATH.
+
+        Returns:
+            list[list]: Rows in HEADER order.
+        """
+        if DataLogger.store is not None:
+            return [list(row) for row in DataLogger.store.rows()]
+        columns = GameDataColumns.load(csv_path or DataLogger.FILE_PATH)
+        return columns.rows() if columns is not None else []
+
+    @staticmethod
+    def _data_marker():
+        """
+        Something that changes whenever rows are added to the log: the CSV size in
+        bytes, or the last SQLite row id.
+        """
+        if DataLogger.store is not None:
+            return ["sqlite", DataLogger.store.last_id()]
+        size = os.path.getsize(DataLogger.FILE_PATH) if os.path.exists(DataLogger.FILE_PATH) else 0
+        return ["csv", size]
+
+    @staticmethod
+    def export_csv(csv_path=None):
+        """
+        Write the SQLite records out as CSV (no-op when logging to CSV already).
+
+        Args:
+            csv_path (str): Destination file, defaults to FILE_PATH.
+
+        Returns:
+            int: Number of rows written.
+        """
+        if DataLogger.store is None:
+            return 0
+        DataLogger.flush()
+        return DataLogger.store.export_csv(csv_path or DataLogger.FILE_PATH)
+
+    @staticmethod
+    def start_buffered(flush_interval=2.0, batch_size=32):
+        """
+        Switch to buffered logging with a background writer thread.
+        Pending rows are also flushed at interpreter exit.
+
+        Args:
+            flush_interval (float): Longest time (seconds) a row waits in the buffer.
+            batch_size (int): Write as soon as this many rows are waiting.
+        """
+        if DataLogger._writer is None:
+            DataLogger._writer = _BufferedWriter(flush_interval, batch_size)
+            atexit.register(DataLogger.stop)
+
+    @staticmethod
+    def flush(wait=True, timeout=5.0):
+        """
+        Write out buffered rows now (no-op when not buffered).
+
+        Args:
+            wait (bool): Block until the rows are on disk. The game loop passes False.
+            timeout (float): Longest time to wait, in seconds.
+
+        Returns:
+            bool: True if everything queued so far has been written (or will be, when not waiting).
+        """
+        if DataLogger._writer is None:
+            return True
+        return DataLogger._writer.flush(wait, timeout)
+
+    @staticmethod
+    def stop(timeout=5.0):
+        """
+        Flush remaining rows, stop the writer thread (back to direct writes) and
+        save the aggregates.
+
+        Args:
+            timeout (float): Longest time to wait for the final write, in seconds.
+        """
+        writer = DataLogger._writer
+        if writer is not None:
+            DataLogger._writer = None
+            atexit.unregister(DataLogger.stop)
+            writer.stop(timeout)
+        DataLogger.save_aggregates()
+
+
+class _BufferedWriter:
+    """
+    Queue plus writer thread behind DataLogger's buffered mode.
+    """
+
+    def __init__(self, flush_interval, batch_size):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="DataLoggerWriter", daemon=True)
+        self.thread.start()
+
+    def submit(self, row):
+        self.queue.put(("row", row))
+
+    def flush(self, wait, timeout):
+        request = _FlushRequest()
+        self.queue.put(("flush", request))
+        return request.wait(timeout) if wait else True
+
+    def stop(self, timeout):
+        request = _FlushRequest()
+        self.queue.put(("stop", request))
+        if not request.wait(timeout):
+            print("⚠️ Some gameplay rows could not be written before exit")
+        self.thread.join(timeout)
+
+    def _write(self, pending):
+        if not pending:
+            return
+        try:
+            DataLogger._append_rows(pending)
+        except Exception as e:
+            # Keep the rows and retry on the next flush (e.g. network drive hiccup);
+            # catching everything keeps the writer thread alive for later rows
+            print(f"⚠️ Could not write {len(pending)} gameplay rows: {e}")
+            return
+        # The rows are in the log: never write them again, even if the aggregates fail
+        rows = list(pending)
+        pending.clear()
+        DataLogger._update_aggregates(rows)
+
+    def _run(self):
+        pending = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                kind, payload = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                kind, payload = "flush", None
+
+            if kind == "row":
+                pending.append(payload)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if len(pending) < self.batch_size:
+                    continue
+
+            self._write(pending)
+            deadline = time.monotonic() + self.flush_interval if pending else None
+            if payload is not None and kind != "row":
+                payload.finish(written=not pending)
+            if kind == "stop":
+                return
+
+
+class _FlushRequest:
+    """
+    A flush (or stop) waiting on the writer thread, and whether it succeeded.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.written = False
+
+    def finish(self, written):
+        self.written = written
+        self.done.set()
+
+    def wait(self, timeout):
+        """
+        Returns:
+            bool: True if every row queued before the request reached the log in time.
+        """
+        return self.done.wait(timeout) and self.written
@@ -0,0 +1,212 @@
+import json
+import time
+import pygame
+from collections import defaultdict, deque
+
+
+class _NullPhase:
+    """
+    No-op context manager handed out while profiling is off.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """
+    Context manager timing one phase of the current frame.
+    """
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add_sample(self.name, self.start, time.perf_counter())
+        return False
+
+
+class FrameProfiler:
+    """
+    Low-overhead per-frame phase timer.
+    Keeps rolling per-phase totals for an on-screen overlay (average + p99) and a
+    bounded event log that can be exported as a Chrome trace-event JSON file.
+    """
+
+    def __init__(self, enabled=False, window=120, max_events=200000):
+        """
+        Args:
+            enabled (bool): Start with timing switched on.
+            window (int): Number of frames kept for the rolling statistics.
+            max_events (int): Maximum trace events kept for export (oldest dropped).
+        """
+        self.enabled = enabled
+        self.window = window
+        self.history = defaultdict(lambda: deque(maxlen=self.window))
+        self.events = deque(maxlen=max_events)
+        self.frame_totals = defaultdict(float)
+        self.frame_start = None
+        self.origin = time.perf_counter()
+        self.frame_index = 0
+
+        self.overlay_lines = []
+        self.overlay_surface = None
+        self.overlay_refresh = 30
+
+    def toggle(self):
+        """
+        Switch profiling on or off. Statistics restart when switched on.
+        """
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.history.clear()
+            self.frame_totals.clear()
+            self.overlay_lines = []
+            self.overlay_surface = None
+        self.frame_start = None
+
+    def phase(self, name):
+        """
+        Time a block of code as part of the current frame.
+
+        Args:
+            name (str): Phase label (e.g. "player", "enemies", "display_flip").
+
+        Returns:
+            A context manager (a shared no-op when profiling is off).
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def add_sample(self, name, start, end):
+        """
+        Record one timed phase (phases may repeat within a frame, e.g. several ticks).
+
+        Args:
+            name (str): Phase label.
+            start (float): perf_counter() at phase start.
+            end (float): perf_counter() at phase end.
+        """
+        self.frame_totals[name] += end - start
+        self.events.append((name, start, end - start))
+
+    def begin_frame(self):
+        """
+        Mark the start of a frame.
+        """
+        if self.enabled:
+            self.frame_start = time.perf_counter()
+            self.frame_totals.clear()
+
+    def end_frame(self):
+        """
+        Mark the end of a frame and fold its phase totals into the rolling window.
+        """
+        if not self.enabled or self.frame_start is None:
+            return
+        end = time.perf_counter()
+        self.events.append(("frame", self.frame_start, end - self.frame_start))
+        self.frame_totals["frame"] = end - self.frame_start
+
+        for name in set(self.history) | set(self.frame_totals):
+            self.history[name].append(self.frame_totals.get(name, 0.0))
+
+        self.frame_index += 1
+        if self.frame_index % self.overlay_refresh == 0 or not self.overlay_lines:
+            self.overlay_lines = self.format_stats()
+            self.overlay_surface = None
+
+    def stats(self):
+        """
+        Rolling statistics per phase.
+
+        Returns:
+            dict: phase -> {"avg_ms", "p99_ms"} over the last `window` frames.
+        """
+        result = {}
+        for name, samples in self.history.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+            result[name] = {
+                "avg_ms": sum(ordered) / len(ordered) * 1000,
+                "p99_ms": p99 * 1000
+            }
+        return result
+
+    def format_stats(self):
+        """
+        Returns:
+            list[str]: Overlay lines, slowest phase first, frame total on top.
+        """
+        stats = self.stats()
+        frame = stats.pop("frame", None)
+        lines = []
+        if frame:
+            lines.append(f"frame   avg {frame['avg_ms']:6.2f}  p99 {frame['p99_ms']:6.2f} ms")
+        for name, values in sorted(stats.items(), key=lambda kv: kv[1]["avg_ms"], reverse=True):
+            lines.append(f"{name[:14]:<14} {values['avg_ms']:6.2f}  {values['p99_ms']:6.2f}")
+        return lines
+
+    def draw_overlay(self, screen, font):
+        """
+        Draw the live timing table in the top-right corner.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+            font (pygame.font.Font): Font for the table.
+
+        Returns:
+            list[pygame.Rect]: Areas drawn (empty when profiling is off).
+        """
+        if not self.enabled or not self.overlay_lines:
+            return []
+
+        # The panel only changes when the numbers refresh, not every frame
+        if self.overlay_surface is None:
+            line_height = font.get_linesize()
+            width = 330
+            height = line_height * len(self.overlay_lines) + 10
+            self.overlay_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.overlay_surface.fill((0, 0, 0, 170))
+            for i, line in enumerate(self.overlay_lines):
+                self.overlay_surface.blit(font.render(line, True, (120, 255, 120)), (6, 5 + i * line_height))
+
+        x = screen.get_width() - self.overlay_surface.get_width() - 10
+        return [screen.blit(self.overlay_surface, (x, 10))]
+
+    def export_chrome_trace(self, path):
+        """
+        Write recorded phases as Chrome trace-event JSON (chrome://tracing, Perfetto).
+
+        Args:
+            path (str): Output file path.
+        """
+        trace = []
+        for name, start, duration in self.events:
+            trace.append({
+                "name": name,
+                "cat": "frame" if name == "frame" else "phase",
+                "ph": "X",
+                "ts": round((start - self.origin) * 1e6, 3),
+                "dur": round(duration * 1e6, 3),
+                "pid": 1,
+                "tid": 1
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,395 @@
+import csv
+import io
+import os
+import threading
+import numpy as np
+from utils.record_store import RecordStore
+
+
+class GameDataColumns:
+    """
+    The gameplay CSV log loaded into typed NumPy columns, for vectorized analytics.
+
+    Numeric fields are parsed in one pass by NumPy instead of per-row int()/float()
+    calls; player names are dictionary-encoded as integer codes in first-seen
+    order. Columns follow the RecordStore schema: integer columns are int64,
+    avg_jump_interval is float64, and a missing level_score is 0 with
+    score_valid False. Unreadable rows are skipped.
+
+    load() goes through a shared GameDataReader per file, which only parses
+    bytes appended since the previous call.
+    """
+    NUMERIC = RecordStore.COLUMNS[1:]
+
+    def __init__(self, player_names, player_codes, columns, score_valid, version=0):
+        """
+        Args:
+            player_names (list[str]): Distinct names; code i is player_names[i].
+            player_codes (np.ndarray): Player code per row.
+            columns (dict): Column name -> np.ndarray, one entry per row.
+            score_valid (np.ndarray): False where level_score was missing.
+            version (int): Data version of the reader that produced these columns.
+        """
+        self.player_names = player_names
+        self.player_codes = player_codes
+        self.columns = columns
+        self.score_valid = score_valid
+        self.version = version
+
+    def __len__(self):
+        return len(self.player_codes)
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    @classmethod
+    def load(cls, path):
+        """
+        Args:
+            path (str): CSV log to read.
+
+        Returns:
+            GameDataColumns | None: The columns, or None if the file does not exist.
+        """
+        return GameDataReader.shared(path).read()
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Forget every shared reader (the next load parses from scratch).
+        """
+        GameDataReader.clear()
+
+    @classmethod
+    def parse(cls, text):
+        """
+        Parse CSV text (header line first) into columns.
+
+        Args:
+            text (str): File contents.
+
+        Returns:
+            GameDataColumns: The parsed columns.
+        """
+        lines = text.splitlines()
+        header = cls.parse_header(lines[0] if lines else "")
+        names = {}
+        codes, values = cls.parse_lines(lines[1:], len(header) - 1, names)
+        return cls.from_values(list(names), codes, values, header)
+
+    @staticmethod
+    def parse_header(line):
+        """
+        Returns:
+            list[str]: Stripped column names of a header line.
+        """
+        return [name.strip() for name in next(csv.reader([line]), [])]
+
+    @classmethod
+    def parse_lines(cls, lines, width, names):
+        """
+        Parse data lines, dictionary-encoding player names into `names`.
+
+        Args:
+            lines (list[str]): CSV data lines (no header).
+            width (int): Number of numeric fields per line.
+            names (dict): Name -> code, extended in place for new names.
+
+        Returns:
+            tuple: (player codes, (rows, width) float array with NaN for empty fields)
+                for the readable lines.
+        """
+        row_names = []
+        numbers = []
+        for line in lines:
+            if not line.strip():
+                continue
+            # Split off the name; only quoted lines need the csv module
+            if '"' in line:
+                fields = next(csv.reader([line]))
+                name, rest = fields[0], ",".join(fields[1:])
+            else:
+                name, _, rest = line.partition(",")
+            row_names.append(name.strip())
+            numbers.append(rest)
+
+        values, ok = cls._parse_numbers(numbers, width)
+        codes = [names.setdefault(name, len(names)) for name, good in zip(row_names, ok.tolist()) if good]
+        return np.asarray(codes, dtype=np.int64), values[ok]
+
+    @staticmethod
+    def _parse_numbers(numbers, width):
+        """
+        Returns:
+            tuple: ((rows, width) float array of the numeric fields, with NaN for
+                empty fields; bool array, False for rows that could not be parsed).
+        """
+        ok = np.ones(len(numbers), dtype=bool)
+        if not numbers or width <= 0:
+            return np.zeros((len(numbers), max(width, 0))), ok
+        try:
+            values = np.loadtxt(io.StringIO("\n".join(numbers)), delimiter=",", ndmin=2, dtype=np.float64)
+            if values.shape == (len(numbers), width):
+                return values, ok
+        except ValueError:
+            pass
+
+        # Slow path for logs with blank or broken fields: parse line by line
+        values = np.full((len(numbers), width), np.nan)
+        for i, rest in enumerate(numbers):
+            fields = rest.split(",")
+            try:
+                if len(fields) != width:
+                    raise ValueError
+                values[i] = [float(field) if field.strip() else np.nan for field in fields]
+            except ValueError:
+                ok[i] = False
+        return values, ok
+
+    @classmethod
+    def from_values(cls, player_names, codes, values, header, version=0):
+        """
+        Build typed columns from parsed values.
+
+        Args:
+            player_names (list[str]): Names by code.
+            codes (np.ndarray): Player code per row.
+            values (np.ndarray): (rows, len(header) - 1) floats, NaN for empty fields.
+            header (list[str]): Column names of the file.
+            version (int): Data version to record.
+
+        Returns:
+            GameDataColumns: The columns.
+        """
+        positions = {name: i for i, name in enumerate(header[1:])}
+        columns = {}
+        score_valid = np.zeros(len(values), dtype=bool)
+        for name, kind in cls.NUMERIC:
+            if name in positions:
+                column = values[:, positions[name]]
+            else:
+                column = np.full(len(values), np.nan)
+            missing = np.isnan(column)
+            if name == "level_score":
+                score_valid = ~missing
+            column = np.where(missing, 0, column)
+            columns[name] = column if kind == "REAL" else column.astype(np.int64)
+        return cls(player_names, codes, columns, score_valid, version)
+
+    def group_by(self, name):
+        """
+        Args:
+            name (str): Column to group rows by (e.g. "level").
+
+        Returns:
+            tuple: (sorted distinct keys, group index per row).
+        """
+        return np.unique(self.columns[name], return_inverse=True)
+
+    def group_sum(self, name, by):
+        """
+        Args:
+            name (str): Column to sum.
+            by (str): Column to group by.
+
+        Returns:
+            tuple: (sorted keys, per-group sums, per-group row counts) as arrays.
+        """
+        keys, groups = self.group_by(by)
+        counts = np.bincount(groups, minlength=len(keys))
+        sums = np.bincount(groups, weights=self.columns[name], minlength=len(keys))
+        return keys, sums, counts
+
+    def player_totals(self, name):
+        """
+        Args:
+            name (str): Column to sum per player.
+
+        Returns:
+            tuple: (per-player sums, per-player row counts), indexed by player code.
+        """
+        size = len(self.player_names)
+        counts = np.bincount(self.player_codes, minlength=size)
+        sums = np.bincount(self.player_codes, weights=self.columns[name], minlength=size)
+        return sums, counts
+
+    def rows(self):
+        """
+        Returns:
+            list[list]: Rows in log column order (level_score None where missing).
+        """
+        names = [self.player_names[code] for code in self.player_codes.tolist()]
+        values = [self.columns[name].tolist() for name, _ in self.NUMERIC]
+        scores = values[[name for name, _ in self.NUMERIC].index("level_score")]
+        for i, valid in enumerate(self.score_valid.tolist()):
+            if not valid:
+                scores[i] = None
+        return [list(row) for row in zip(names, *values)]
+
+
+class GameDataReader:
+    """
+    Tail-following reader for one CSV log, shared by every screen that reads it.
+
+    It keeps the parsed rows in memory and the byte offset it has consumed. Each
+    read() costs one stat() when nothing changed, and otherwise parses only the
+    appended bytes. A smaller file, a new inode, a modification that did not grow
+    the file, or different bytes just before the offset mean the log was
+    truncated, rotated or rewritten, and it is parsed again from the start.
+    A trailing line without its newline (mid-write, or a hand-edited file) is
+    included but re-read next time.
+    """
+    TAIL_BYTES = 64
+    _readers = {}
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): CSV log to follow.
+        """
+        self.path = path
+        self.version = 0
+        self.lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def shared(cls, path):
+        """
+        Args:
+            path (str): CSV log path.
+
+        Returns:
+            GameDataReader: The reader for that file (created on first use).
+        """
+        key = os.path.abspath(path)
+        reader = cls._readers.get(key)
+        if reader is None:
+            reader = cls._readers[key] = cls(path)
+        return reader
+
+    @classmethod
+    def clear(cls):
+        """
+        Drop every shared reader.
+        """
+        cls._readers.clear()
+
+    def reset(self):
+        """
+        Forget everything read so far.
+        """
+        self.inode = None
+        self.mtime = None
+        self.offset = 0
+        self.pending = b""
+        self.tail = b""
+        self.header = None
+        self.names = {}
+        self.codes = np.zeros(0, dtype=np.int64)
+        self.values = None
+        self.partial = None
+        self.snapshot = None
+
+    def _rewritten(self, f, stat):
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            return True
+        if stat.st_mtime_ns == self.mtime or not self.tail:
+            return False
+        if stat.st_size == self.offset + len(self.pending):
+            # Modified without growing: not an append
+            return True
+        # Grown: check that the bytes already consumed are still there
+        f.seek(self.offset - len(self.tail))
+        return f.read(len(self.tail)) != self.tail
+
+    def read(self):
+        """
+        Bring the in-memory rows up to date with the file.
+
+        Returns:
+            GameDataColumns | None: Every row, or None if the file does not exist.
+        """
+        with self.lock:
+            return self._read()
+
+    def _read(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self.inode is not None:
+                self.reset()
+                self.version += 1
+            return None
+
+        if (stat.st_ino == self.inode and stat.st_mtime_ns == self.mtime
+                and stat.st_size == self.offset + len(self.pending)):
+            return self._columns()
+
+        with open(self.path, "rb") as f:
+            if self.inode is not None and self._rewritten(f, stat):
+                self.reset()
+            f.seek(self.offset)
+            data = f.read()
+        self.inode = stat.st_ino
+        self.mtime = stat.st_mtime_ns
+        self._consume(data)
+        return self._columns()
+
+    def _consume(self, data):
+        """
+        Parse newly read bytes: complete lines are committed, a trailing partial
+        line is kept aside and read again on the next call.
+        """
+        end = data.rfind(b"\n") + 1
+        complete, rest = data[:end], data[end:]
+        start = self.offset == 0
+        self.offset += end
+        self.tail = (self.tail + complete)[-self.TAIL_BYTES:]
+
+        text = complete.decode("utf-8-sig" if start else "utf-8", errors="replace")
+        lines = text.splitlines()
+        if self.header is None and lines:
+            self.header = GameDataColumns.parse_header(lines.pop(0))
+        changed = start or bool(lines) or rest != self.pending
+        self.pending = rest
+        if not changed:
+            return
+
+        if self.header is not None and lines:
+            codes, values = GameDataColumns.parse_lines(lines, len(self.header) - 1, self.names)
+            if self.values is None:
+                self.codes, self.values = codes, values
+            else:
+                self.codes = np.concatenate([self.codes, codes])
+                self.values = np.concatenate([self.values, values])
+
+        self.partial = None
+        partial_text = rest.decode("utf-8-sig" if start and not end else "utf-8", errors="replace").strip()
+        if partial_text:
+            if self.header is None:
+                # Only an unterminated header so far; read it again next time
+                self.partial = GameDataColumns.parse_header(partial_text)
+            else:
+                # Parse with a copy of the names so a half-written name is not kept
+                names = dict(self.names)
+                codes, values = GameDataColumns.parse_lines([partial_text], len(self.header) - 1, names)
+                self.partial = (names, codes, values)
+
+        self.version += 1
+        self.snapshot = None
+
+    def _columns(self):
+        if self.snapshot is None:
+            names, codes, values = self.names, self.codes, self.values
+            header = self.header
+            if header is None:
+                # Nothing but (possibly) a header line without its newline
+                header = self.partial or ["player_name"]
+            elif self.partial is not None:
+                names, partial_codes, partial_values = self.partial
+                codes = np.concatenate([codes, partial_codes])
+                values = partial_values if values is None else np.concatenate([values, partial_values])
+            if values is None:
+                values = np.zeros((0, max(len(header) - 1, 0)))
+            self.snapshot = GameDataColumns.from_values(list(names), codes, values, header, self.version)
+        return self.snapshot
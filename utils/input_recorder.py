@@ -0,0 +1,172 @@
+import json
+from utils.level_simulation import InputAction, LevelSimulation
+
+
+class InputRecording:
+    """
+    A recorded gameplay session: the level, its RNG seed, the simulation options it ran
+    with and one packed input per tick. With the same settings and inputs the
+    fixed-tick simulation replays exactly.
+    """
+
+    def __init__(self, map_path, level, seed, masks=None, tick_rate=LevelSimulation.TICK_RATE,
+                 world_height=None, vectorized_enemies=False):
+        """
+        Args:
+            map_path (str): Path to the level map file.
+            level (int): Level number the session was played at.
+            seed (int): Seed of the session's random source.
+            masks (list[int]): Packed InputAction per tick (see InputAction.to_mask).
+            tick_rate (int): Simulation ticks per second when recorded.
+            world_height (int): Fall-death height of the session (None = level height).
+            vectorized_enemies (bool): Whether enemies ran on the EnemyEngine.
+        """
+        self.map_path = map_path
+        self.level = level
+        self.seed = seed
+        self.masks = masks if masks is not None else []
+        self.tick_rate = tick_rate
+        self.world_height = world_height
+        self.vectorized_enemies = vectorized_enemies
+
+    def __len__(self):
+        return len(self.masks)
+
+    def actions(self):
+        """
+        Yield the recorded inputs as InputAction objects, one per tick.
+        """
+        for mask in self.masks:
+            yield InputAction.from_mask(mask)
+
+    def save(self, path):
+        """
+        Write the recording as JSON, with the inputs run-length encoded as
+        [mask, count] pairs (held keys repeat for many ticks).
+
+        Args:
+            path (str): Output file path.
+        """
+        runs = []
+        for mask in self.masks:
+            if runs and runs[-1][0] == mask:
+                runs[-1][1] += 1
+            else:
+                runs.append([mask, 1])
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "map_path": self.map_path,
+                "level": self.level,
+                "seed": self.seed,
+                "tick_rate": self.tick_rate,
+                "world_height": self.world_height,
+                "vectorized_enemies": self.vectorized_enemies,
+                "inputs": runs
+            }, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a recording written by save().
+
+        Args:
+            path (str): Recording file path.
+
+        Returns:
+            InputRecording: The loaded session.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        masks = []
+        for mask, count in data["inputs"]:
+            masks.extend([mask] * count)
+        return cls(data["map_path"], data["level"], data["seed"], masks,
+                   data.get("tick_rate", LevelSimulation.TICK_RATE),
+                   data.get("world_height"), data.get("vectorized_enemies", False))
+
+
+class InputRecorder:
+    """
+    Collects the input fed to a simulation, one entry per tick.
+    """
+
+    def __init__(self, map_path, level, seed, world_height=None, vectorized_enemies=False):
+        """
+        Args:
+            map_path (str): Path to the level map file.
+            level (int): Level number being played.
+            seed (int): Seed of the session's random source.
+            world_height (int): Fall-death height of the simulation.
+            vectorized_enemies (bool): Whether enemies run on the EnemyEngine.
+        """
+        self.recording = InputRecording(map_path, level, seed, world_height=world_height,
+                                        vectorized_enemies=vectorized_enemies)
+
+    def record(self, action):
+        """
+        Append the input of one tick.
+
+        Args:
+            action (InputAction): Input applied on this tick.
+        """
+        self.recording.masks.append(action.to_mask())
+
+    def save(self, path):
+        """
+        Write the recording to disk.
+
+        Args:
+            path (str): Output file path.
+        """
+        self.recording.save(path)
+
+
+class ReplayDriver:
+    """
+    Feeds a recording back into the game, either headless or on screen.
+    """
+
+    def __init__(self, recording):
+        """
+        Args:
+            recording (InputRecording | str): A recording, or a path to load one from.
+        """
+        if isinstance(recording, str):
+            recording = InputRecording.load(recording)
+        self.recording = recording
+
+    def simulate(self):
+        """
+        Replay the recording on a headless LevelSimulation, with the world height and
+        enemy engine of the original session.
+
+        Returns:
+            dict: Final simulation state.
+        """
+        recording = self.recording
+        sim = LevelSimulation(recording.map_path, recording.level, world_height=recording.world_height,
+                              seed=recording.seed, vectorized_enemies=recording.vectorized_enemies)
+        return sim.run(recording.actions())
+
+    def play(self, screen, player_name="Replay", **kwargs):
+        """
+        Replay the recording through PlayScreen, rendering every frame.
+
+        Args:
+            screen (pygame.Surface): Display surface to render onto.
+            player_name (str): Name shown/logged for the replayed session.
+            **kwargs: Extra PlayScreen options (dirty_rects, max_fps, ...). Simulation
+                options come from the recording, and nothing is logged to DataLogger.
+
+        Returns:
+            str: Next screen identifier returned by PlayScreen.run.
+        """
+        from ui.play_screen import PlayScreen
+
+        kwargs["vectorized_enemies"] = self.recording.vectorized_enemies
+        kwargs["record_stats"] = False
+        screen_view = PlayScreen(screen, self.recording.map_path, self.recording.level, player_name,
+                                 seed=self.recording.seed, replay=self.recording, **kwargs)
+        return screen_view.run()
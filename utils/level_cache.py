@@ -0,0 +1,254 @@
+import hashlib
+import os
+import numpy as np
+
+
+class CompiledLevel:
+    """
+    Compact, pre-parsed form of a level text file.
+    Tiles are a (rows, cols) uint8 array of tile codes; entity markers are kept as
+    (col, row) lists in map (row-major) order so spawning stays deterministic.
+    """
+    TILE_CHARS = ("#", "S", "W")
+    EMPTY = 0
+
+    def __init__(self, tiles, enemies, spawns, goal):
+        """
+        Args:
+            tiles (np.ndarray): Tile codes, 0 = empty, i + 1 = TILE_CHARS[i].
+            enemies (list[tuple]): (col, row) of every 'E'.
+            spawns (list[tuple]): (col, row) of every 'P'.
+            goal (tuple | None): (col, row) of the goal 'G' (last one wins, as in the text parser).
+        """
+        self.tiles = tiles
+        self.enemies = enemies
+        self.spawns = spawns
+        self.goal = goal
+
+    @property
+    def rows(self):
+        return self.tiles.shape[0]
+
+    @property
+    def cols(self):
+        return self.tiles.shape[1]
+
+    @classmethod
+    def compile(cls, lines):
+        """
+        Build a compiled level from the rows of a level text file.
+
+        Args:
+            lines (list[str]): Level rows (already stripped).
+
+        Returns:
+            CompiledLevel: The compiled level.
+        """
+        cols = max((len(line) for line in lines), default=0)
+        tiles = np.zeros((len(lines), cols), dtype=np.uint8)
+        codes = {char: i + 1 for i, char in enumerate(cls.TILE_CHARS)}
+        enemies, spawns, goal = [], [], None
+
+        for y, row in enumerate(lines):
+            for x, char in enumerate(row):
+                if char in codes:
+                    tiles[y, x] = codes[char]
+                elif char == 'E':
+                    enemies.append((x, y))
+                elif char == 'P':
+                    spawns.append((x, y))
+                elif char == 'G':
+                    goal = (x, y)
+        return cls(tiles, enemies, spawns, goal)
+
+    def platform_cells(self):
+        """
+        Yield (col, row, tile_char) for every solid tile in row-major order.
+        """
+        rows, cols = np.nonzero(self.tiles)
+        codes = self.tiles[rows, cols]
+        for x, y, code in zip(cols.tolist(), rows.tolist(), codes.tolist()):
+            yield x, y, self.TILE_CHARS[code - 1]
+
+    def to_arrays(self):
+        """
+        Returns:
+            dict: Arrays suitable for np.savez.
+        """
+        return {
+            "tiles": self.tiles,
+            "enemies": np.array(self.enemies, dtype=np.int32).reshape(-1, 2),
+            "spawns": np.array(self.spawns, dtype=np.int32).reshape(-1, 2),
+            "goal": np.array(self.goal if self.goal else (-1, -1), dtype=np.int32)
+        }
+
+    @classmethod
+    def from_arrays(cls, data):
+        """
+        Rebuild a compiled level from arrays written by to_arrays.
+
+        Args:
+            data (Mapping[str, np.ndarray]): Loaded arrays.
+
+        Returns:
+            CompiledLevel: The compiled level.
+        """
+        goal = tuple(int(v) for v in data["goal"])
+        return cls(
+            data["tiles"].astype(np.uint8),
+            [tuple(p) for p in data["enemies"].tolist()],
+            [tuple(p) for p in data["spawns"].tolist()],
+            goal if goal != (-1, -1) else None
+        )
+
+
+class LevelCache:
+    """
+    Process-wide cache of compiled levels, in memory and on disk.
+    Entries are keyed by absolute path and validated against the file's mtime and
+    size, so editing a level transparently recompiles it.
+
+    The disk cache lives in CACHE_DIR next to the game's packages (not the working
+    directory). Each entry records its source file, and prune_disk() deletes
+    entries whose level was moved, deleted or edited. Callers working with
+    throwaway maps (tests, benchmarks) can turn it off with set_disk_cache(False).
+    """
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".level_cache")
+    FORMAT_VERSION = 2
+    disk_enabled = True
+    _memory = {}
+
+    @staticmethod
+    def set_disk_cache(enabled=True, directory=None):
+        """
+        Turn the disk cache on or off, or move it.
+
+        Args:
+            enabled (bool): Read and write compiled levels on disk.
+            directory (str): Cache directory, defaults to the current CACHE_DIR.
+        """
+        LevelCache.disk_enabled = enabled
+        if directory is not None:
+            LevelCache.CACHE_DIR = directory
+
+    @staticmethod
+    def _signature(path):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _disk_path(path):
+        digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(LevelCache.CACHE_DIR, f"{name}-{digest}.npz")
+
+    @staticmethod
+    def load(path):
+        """
+        Return the compiled level for a map file, compiling it only when neither
+        the memory nor the disk cache holds an up-to-date copy.
+
+        Args:
+            path (str): Path to the level text file.
+
+        Returns:
+            CompiledLevel: The compiled level.
+        """
+        key = os.path.abspath(path)
+        signature = LevelCache._signature(path)
+
+        cached = LevelCache._memory.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        level = LevelCache._load_disk(path, signature)
+        if level is None:
+            with open(path, 'r') as f:
+                level = CompiledLevel.compile([line.strip() for line in f.readlines()])
+            LevelCache._save_disk(path, signature, level)
+
+        LevelCache._memory[key] = (signature, level)
+        return level
+
+    @staticmethod
+    def _load_disk(path, signature):
+        if not LevelCache.disk_enabled:
+            return None
+        disk_path = LevelCache._disk_path(path)
+        if not os.path.exists(disk_path):
+            return None
+        try:
+            with np.load(disk_path) as data:
+                stored = (int(data["mtime_ns"]), int(data["size"]))
+                if int(data["version"]) != LevelCache.FORMAT_VERSION or stored != signature:
+                    return None
+                return CompiledLevel.from_arrays(data)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _save_disk(path, signature, level):
+        if not LevelCache.disk_enabled:
+            return
+        try:
+            os.makedirs(LevelCache.CACHE_DIR, exist_ok=True)
+            np.savez(LevelCache._disk_path(path), version=LevelCache.FORMAT_VERSION,
+                     source=os.path.abspath(path), mtime_ns=signature[0], size=signature[1],
+                     **level.to_arrays())
+        except OSError:
+            # The disk cache is an optimisation only (e.g. read-only install)
+            pass
+
+    @staticmethod
+    def prune_disk():
+        """
+        Delete disk entries whose level file is gone or changed since it was compiled
+        (and entries in an older format).
+
+        Returns:
+            int: Number of entries removed.
+        """
+        if not os.path.isdir(LevelCache.CACHE_DIR):
+            return 0
+        removed = 0
+        for name in os.listdir(LevelCache.CACHE_DIR):
+            if not name.endswith(".npz"):
+                continue
+            disk_path = os.path.join(LevelCache.CACHE_DIR, name)
+            try:
+                with np.load(disk_path) as data:
+                    current = int(data["version"]) == LevelCache.FORMAT_VERSION
+                    if current:
+                        source = str(data["source"])
+                        stored = (int(data["mtime_ns"]), int(data["size"]))
+                        current = os.path.exists(source) and LevelCache._signature(source) == stored
+            except (OSError, ValueError, KeyError):
+                current = False
+            if not current:
+                try:
+                    os.remove(disk_path)
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    @staticmethod
+    def preload(paths):
+        """
+        Compile (or load) a list of levels up front, e.g. at game start, after
+        pruning stale disk entries.
+
+        Args:
+            paths (list[str]): Level file paths.
+        """
+        if LevelCache.disk_enabled:
+            LevelCache.prune_disk()
+        for path in paths:
+            LevelCache.load(path)
+
+    @staticmethod
+    def clear_memory():
+        """
+        Drop the in-memory cache (the disk cache is kept).
+        """
+        LevelCache._memory.clear()
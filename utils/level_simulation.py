@@ -0,0 +1,424 @@
+import random
+import pygame
+from pygame.sprite import Group
+from ai.flow_field import FlowField
+from ai.navigation import NavigationGraph
+from ai.terrain_tables import TerrainTables
+from entities.enemy import ChasingEnemy, ShootingEnemy
+from entities.enemy_engine import EnemyEngine
+from entities.enemy_factory import EnemyFactory
+from entities.projectiles import ProjectileSystem
+from entities.player import Player
+from utils.collision_grid import CollisionGrid
+from utils.frame_profiler import FrameProfiler
+from utils.level_cache import LevelCache
+from utils.spatial_hash import SpatialHash
+
+
+class InputAction:
+    """
+    Input for one simulation tick: held movement/dash state plus a jump press.
+    Can be indexed with pygame key constants, so it works anywhere a
+    pygame.key.get_pressed() result is expected.
+    """
+    LEFT_KEYS = (pygame.K_LEFT, pygame.K_a)
+    RIGHT_KEYS = (pygame.K_RIGHT, pygame.K_d)
+    DASH_KEYS = (pygame.K_LSHIFT, pygame.K_RSHIFT)
+
+    def __init__(self, left=False, right=False, jump=False, dash=False):
+        """
+        Args:
+            left (bool): Move left is held.
+            right (bool): Move right is held.
+            jump (bool): Jump was pressed this tick.
+            dash (bool): Dash is held.
+        """
+        self.left = left
+        self.right = right
+        self.jump = jump
+        self.dash = dash
+
+    @classmethod
+    def from_keys(cls, keys, jump=False):
+        """
+        Build an action from a pygame keyboard state.
+
+        Args:
+            keys (pygame.key.get_pressed()): Keyboard state.
+            jump (bool): Whether a jump key was pressed since the last tick.
+
+        Returns:
+            InputAction: The equivalent action.
+        """
+        return cls(
+            left=any(keys[k] for k in cls.LEFT_KEYS),
+            right=any(keys[k] for k in cls.RIGHT_KEYS),
+            jump=jump,
+            dash=any(keys[k] for k in cls.DASH_KEYS)
+        )
+
+    def to_mask(self):
+        """
+        Pack the action into a small bitmask (left=1, right=2, jump=4, dash=8).
+
+        Returns:
+            int: The packed action.
+        """
+        return self.left | self.right << 1 | self.jump << 2 | self.dash << 3
+
+    @classmethod
+    def from_mask(cls, mask):
+        """
+        Unpack an action produced by to_mask.
+
+        Args:
+            mask (int): Packed action.
+
+        Returns:
+            InputAction: The unpacked action.
+        """
+        return cls(left=bool(mask & 1), right=bool(mask & 2), jump=bool(mask & 4), dash=bool(mask & 8))
+
+    def __getitem__(self, key):
+        if key in self.LEFT_KEYS:
+            return self.left
+        if key in self.RIGHT_KEYS:
+            return self.right
+        if key in self.DASH_KEYS:
+            return self.dash
+        return False
+
+
+class LevelSimulation:
+    """
+    Headless gameplay core: loads a level and advances it one fixed tick at a time.
+    Needs no display, no real keyboard and no wall clock, so it can be driven
+    by PlayScreen or stepped directly (balancing runs, CI regression checks).
+
+    Throughput is that of plain Python: roughly 12k ticks/s per core with sprite
+    enemies (about 20 levels of 600 ticks per second, plus ~10 ms to build each
+    level) and about 4k ticks/s with the vectorized enemy engine, whose NumPy
+    calls only pay off on crowded levels. Enough for CI checks, replays and
+    balancing sweeps, not for scoring thousands of levels per second.
+    """
+    TILE_SIZE = 30
+    TICK_RATE = 60
+    TILE_TYPES = ("#", "S", "W")
+
+    def __init__(self, map_path, level, world_height=None, seed=None, vectorized_enemies=False):
+        """
+        Load the map and create the player, enemies and goal.
+
+        Args:
+            map_path (str): Path to the level map file.
+            level (int): Current level number (controls enemy pool).
+            world_height (int): Falling below this y kills the player.
+                Defaults to the level's pixel height.
+            seed (int): Seed for this session's random source. A fresh seed is drawn
+                (and kept in self.seed) when omitted, so every run can be replayed.
+            vectorized_enemies (bool): Simulate enemies with the struct-of-arrays
+                EnemyEngine instead of one sprite per enemy (for very crowded levels).
+        """
+        self.map_path = map_path
+        self.level = level
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+
+        self.platforms = []
+        self.collision_grid = None
+        self.terrain = None
+        self.enemies = Group()
+        self.enemy_engine = None
+        self.goal = None
+        self.spawn_points = []
+        self.explosions = []
+        self.entity_hash = SpatialHash(cell_size=64)
+        self.enemy_contact = None
+        # Last rects put in the entity hash, to skip rebuilding unchanged layers
+        self.indexed_enemies = None
+        self.indexed_player = None
+        self.profiler = FrameProfiler()
+        self.level_data = self.load_map()
+        self.projectiles = ProjectileSystem()
+        self.flow_field = FlowField(self.level_data.tiles, self.TILE_SIZE)
+        if vectorized_enemies:
+            self.enemy_engine = EnemyEngine(self.projectiles, self.rng, self.flow_field)
+            self.enemies = self.enemy_engine
+        self.parse_map()
+        self.world_height = world_height or self.pixel_height
+        self.projectiles.bounds = (0, 0, max(self.pixel_width, 1), self.world_height)
+        self.player = Player(self.spawn_points, tile_size=self.TILE_SIZE, rng=self.rng)
+        self.navigation = NavigationGraph.for_level(self.terrain, self.level_data.tiles, self.level_data.goal,
+                                                    self.player)
+        self.index_enemies()
+        self.index_bullets()
+        self.index_player()
+
+        # State + stats tracking
+        self.ticks = 0
+        self.health = 3
+        self.game_over = False
+        self.level_complete = False
+        self.jump_count = 0
+        self.death_count = 0
+        self.jump_times = []
+        self.last_jump_tick = None
+        self.enemy_triggered = 0
+        self.level_score = 10
+
+    def load_map(self):
+        """
+        Load the compiled map layout (parsed once, then served from the level cache).
+
+        Returns:
+            CompiledLevel: Tile array plus enemy, spawn and goal positions.
+        """
+        return LevelCache.load(self.map_path)
+
+    def parse_map(self):
+        """
+        Build platforms, enemies, spawn points, and goal from the compiled level.
+        Also builds the collision grid used for player/platform checks and the
+        terrain tables used by hints.
+        """
+        size = self.TILE_SIZE
+        level = self.level_data
+        for x, y, tile in level.platform_cells():
+            self.platforms.append((pygame.Rect(x * size, y * size, size, size), tile))
+        for x, y in level.enemies:
+            if self.enemy_engine is not None:
+                self.enemy_engine.add(EnemyFactory.choose_class(self.level, self.rng), x * size, y * size)
+                continue
+            enemy = EnemyFactory.create_random(x * size, y * size, self.level, rng=self.rng)
+            if isinstance(enemy, ShootingEnemy):
+                # Bullets are simulated centrally for the whole level
+                enemy.use_projectile_system(self.projectiles)
+            elif isinstance(enemy, ChasingEnemy):
+                # Chasers share one flow field towards the player
+                enemy.use_flow_field(self.flow_field)
+            self.enemies.add(enemy)
+        for x, y in level.spawns:
+            self.spawn_points.append((x * size, y * size))
+        if level.goal:
+            self.goal = pygame.Rect(level.goal[0] * size, level.goal[1] * size, size, size)
+
+        self.collision_grid = CollisionGrid(self.platforms, self.TILE_SIZE)
+        self.terrain = TerrainTables.from_level(level, self.TILE_SIZE, self.goal)
+
+    @property
+    def pixel_width(self):
+        """
+        int: Level width in pixels.
+        """
+        return self.level_data.cols * self.TILE_SIZE
+
+    @property
+    def pixel_height(self):
+        """
+        int: Level height in pixels.
+        """
+        return self.level_data.rows * self.TILE_SIZE
+
+    @property
+    def done(self):
+        """
+        bool: True once the level is either completed or lost.
+        """
+        return self.game_over or self.level_complete
+
+    @property
+    def elapsed_time(self):
+        """
+        float: Simulated seconds since the level started.
+        """
+        return self.ticks / self.TICK_RATE
+
+    def step(self, action):
+        """
+        Advance the level by exactly one tick.
+
+        Args:
+            action (InputAction): Input for this tick.
+
+        Returns:
+            dict: The state after the tick (see get_state).
+        """
+        if self.done:
+            return self.get_state()
+
+        self.ticks += 1
+
+        if action.jump and self.player.jump():
+            self.jump_count += 1
+            if self.last_jump_tick is not None:
+                self.jump_times.append((self.ticks - self.last_jump_tick) / self.TICK_RATE)
+            self.last_jump_tick = self.ticks
+
+        # Player movement + collision
+        with self.profiler.phase("player"):
+            self.player.update(action, self.collision_grid)
+
+        # 💀 Player falls off the screen
+        if self.player.rect.top > self.world_height:
+            self.handle_death()
+            if self.game_over:
+                return self.get_state()
+
+        # 🧨 Enemy updates
+        with self.profiler.phase("enemies"):
+            self.explosions.clear()
+            self.flow_field.set_target(self.player.rect)
+            if self.enemy_engine is not None:
+                self.step_enemy_engine()
+                if self.game_over:
+                    return self.get_state()
+            else:
+                for enemy in list(self.enemies):
+                    result = enemy.tick(self.player.rect)
+
+                    if isinstance(result, tuple):
+                        explosion, damaged = result
+                        if explosion:
+                            self.explosions.append(explosion)
+                        if damaged:
+                            self.handle_death()
+                    elif self.player.rect.colliderect(enemy.rect):
+                        self.handle_death()
+                    if self.game_over:
+                        return self.get_state()
+                self.index_enemies()
+
+        # 🔫 Bullets: one vectorized move + cull, then a broadphase hit test
+        with self.profiler.phase("bullets"):
+            # Nothing to move, index or test on the (usual) ticks without bullets
+            if len(self.projectiles) or self.entity_hash.count("bullets"):
+                self.projectiles.update()
+                self.index_bullets()
+            if len(self.projectiles):
+                if len(self.projectiles) > SpatialHash.LINEAR_LIMIT:
+                    nearby = self.entity_hash.query_rect("bullets", self.player.rect)
+                    hit = len(nearby) and len(self.projectiles.hit_test(self.player.rect, candidates=nearby))
+                else:
+                    # The hash would scan a layer this small linearly anyway
+                    hit = len(self.projectiles.hit_test(self.player.rect))
+                if hit:
+                    self.handle_death()
+                    if self.game_over:
+                        return self.get_state()
+
+        # 🎯 Player reaches goal
+        if self.goal and self.player.rect.colliderect(self.goal):
+            self.level_complete = True
+            self.calculate_level_score()
+
+        self.index_player()
+        return self.get_state()
+
+    def step_enemy_engine(self):
+        """
+        Advance the vectorized enemies one tick and apply any damage they dealt.
+        Contact is looked up in the entity hash once the whole batch has moved.
+        """
+        explosions, hits = self.enemy_engine.update(self.player.rect)
+        self.explosions.extend(explosions)
+        self.index_enemies()
+        touching = self.entity_hash.query_rect("enemies", self.player.rect)
+        if self.enemy_contact[touching].any():
+            hits += 1
+        for _ in range(hits):
+            self.handle_death()
+            if self.game_over:
+                break
+
+    def index_enemies(self):
+        """
+        Register every live enemy in the entity hash (ids follow spawn order).
+        """
+        if self.enemy_engine is not None:
+            rects, self.enemy_contact = self.enemy_engine.live_rects()
+        else:
+            rects = [tuple(enemy.rect) for enemy in self.enemies]
+            if rects == self.indexed_enemies:
+                return
+            self.indexed_enemies = rects
+        self.entity_hash.build("enemies", rects)
+
+    def index_bullets(self):
+        """
+        Register every live bullet in the entity hash (ids are projectile slots).
+        """
+        slots, rects = self.projectiles.live_rects()
+        self.entity_hash.build("bullets", rects, slots)
+
+    def index_player(self):
+        """
+        Register the player in the entity hash (skipped while the player stands still).
+        """
+        rect = tuple(self.player.rect)
+        if rect != self.indexed_player:
+            self.indexed_player = rect
+            self.entity_hash.build("player", [rect])
+
+    def handle_death(self):
+        """
+        Handle player death: reduce HP, reset position, and flag game over at 0 HP.
+        """
+        self.health -= 1
+        self.level_score = max(0, self.level_score - 2)
+        self.death_count += 1
+        self.enemy_triggered += 1
+        self.player.reset_position()
+        if self.health <= 0:
+            self.game_over = True
+
+    def calculate_level_score(self):
+        """
+        Compute score based on simulated time and jump usage.
+        """
+        if self.jump_count > 10:
+            self.level_score = max(0, self.level_score - 1)
+        if self.elapsed_time > 60:
+            self.level_score = max(0, self.level_score - 1)
+
+    def get_state(self):
+        """
+        Snapshot of the observable simulation state.
+
+        Returns:
+            dict: tick, player rect, health, enemies (type + rect), live bullets, and
+                done / complete / game_over flags.
+        """
+        if self.enemy_engine is not None:
+            enemies = self.enemy_engine.snapshot()
+        else:
+            enemies = [(type(enemy).__name__, tuple(enemy.rect)) for enemy in self.enemies]
+        return {
+            "tick": self.ticks,
+            "player_rect": tuple(self.player.rect),
+            "health": self.health,
+            "energy": self.player.energy,
+            "enemies": enemies,
+            "bullets": len(self.projectiles),
+            "done": self.done,
+            "complete": self.level_complete,
+            "game_over": self.game_over
+        }
+
+    def run(self, actions, max_ticks=None):
+        """
+        Step through a sequence of actions until it runs out, the level ends,
+        or max_ticks is reached.
+
+        Args:
+            actions (iterable[InputAction]): One action per tick.
+            max_ticks (int): Optional tick limit.
+
+        Returns:
+            dict: The final state.
+        """
+        state = self.get_state()
+        for action in actions:
+            if self.done or (max_ticks is not None and self.ticks >= max_ticks):
+                break
+            state = self.step(action)
+        return state
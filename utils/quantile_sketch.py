@@ -0,0 +1,155 @@
+import math
+
+
+class KLLSketch:
+    """
+    KLL streaming quantile sketch (Karnin, Lang & Liberty).
+
+    Values go into a stack of compactors; level h holds items that each stand for
+    2**h original values. When the sketch outgrows its capacity, the first full
+    level is sorted and every other item moves up a level. Memory stays around
+    3 * k items however many values are added, and a rank is off by roughly
+    1.7 / k of the count at most (typically far less). Until the first compaction
+    every value is kept, so small histories get exact answers.
+
+    Two sketches merge into one that summarises both streams, so per-level
+    sketches can be combined into an overall one on demand.
+    """
+    C = 2 / 3
+
+    def __init__(self, k=128):
+        """
+        Args:
+            k (int): Accuracy parameter (capacity of the top compactor).
+        """
+        self.k = k
+        self.count = 0
+        self.levels = [[]]
+        # Which half (even/odd positions) the next compaction of each level keeps;
+        # alternating instead of a coin flip keeps runs reproducible
+        self.offsets = [0]
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(int(math.ceil(self.k * self.C ** depth)), 2)
+
+    def _size(self):
+        return sum(len(items) for items in self.levels)
+
+    def _max_size(self):
+        return sum(self._capacity(level) for level in range(len(self.levels)))
+
+    def update(self, value):
+        """
+        Args:
+            value (int | float): New observation.
+        """
+        self.levels[0].append(value)
+        self.count += 1
+        if len(self.levels[0]) >= self._capacity(0) and self._size() > self._max_size():
+            self._compress()
+
+    def _compress(self):
+        while self._size() > self._max_size():
+            for level, items in enumerate(self.levels):
+                if len(items) >= self._capacity(level):
+                    break
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+                self.offsets.append(0)
+
+            items.sort()
+            # An odd item out stays behind so the weights still add up
+            keep = [items.pop()] if len(items) % 2 else []
+            offset = self.offsets[level]
+            self.offsets[level] ^= 1
+            self.levels[level + 1].extend(items[offset::2])
+            self.levels[level] = keep
+
+    def merge(self, other):
+        """
+        Fold another sketch into this one.
+
+        Args:
+            other (KLLSketch): Sketch of a different stream (left unchanged).
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+            self.offsets.append(0)
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self.count += other.count
+        self._compress()
+
+    def _weighted(self):
+        items = [(value, 1 << level) for level, values in enumerate(self.levels) for value in values]
+        items.sort(key=lambda item: item[0])
+        return items
+
+    def value_at(self, rank):
+        """
+        Args:
+            rank (int): 0-based rank into the (sorted) stream.
+
+        Returns:
+            int | float | None: Estimated value at that rank, None when empty.
+        """
+        seen = 0
+        value = None
+        for value, weight in self._weighted():
+            seen += weight
+            if seen > rank:
+                return value
+        return value
+
+    def quantile(self, q):
+        """
+        Nearest-rank quantile.
+
+        Args:
+            q (float): Fraction in [0, 1] (e.g. 0.9 for p90).
+
+        Returns:
+            int | float | None: Estimated quantile, None when empty.
+        """
+        if not self.count:
+            return None
+        return self.value_at(max(0, math.ceil(q * self.count) - 1))
+
+    def median(self):
+        """
+        Returns:
+            int | float | None: Estimated median, averaging the two middle values for
+                an even count (as statistics.median does), None when empty.
+        """
+        if not self.count:
+            return None
+        if self.count % 2:
+            return self.value_at(self.count // 2)
+        return (self.value_at(self.count // 2 - 1) + self.value_at(self.count // 2)) / 2
+
+    def to_dict(self):
+        return {"k": self.k, "count": self.count, "levels": self.levels, "offsets": self.offsets}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["k"])
+        sketch.count = data["count"]
+        sketch.levels = [list(items) for items in data["levels"]]
+        sketch.offsets = list(data["offsets"])
+        return sketch
+
+    @classmethod
+    def merged(cls, sketches, k=128):
+        """
+        Args:
+            sketches (iterable[KLLSketch]): Sketches to combine.
+            k (int): Accuracy of the combined sketch.
+
+        Returns:
+            KLLSketch: A new sketch summarising all of them.
+        """
+        result = cls(k)
+        for sketch in sketches:
+            result.merge(sketch)
+        return result
@@ -0,0 +1,274 @@
+import contextlib
+import csv
+import math
+import os
+import sqlite3
+
+
+class RecordStore:
+    """
+    SQLite storage for gameplay records (one row per finished level).
+
+    Rows have the same columns as the CSV log, plus an autoincrement id that
+    keeps the logging order. player_name and level are indexed, so the
+    leaderboard, the latest player's average and the per-level charts are SQL
+    aggregates instead of Python scans over every row.
+
+    Every call opens its own short-lived connection. The background logger
+    thread can write while the UI reads, and WAL mode keeps readers from
+    blocking the writer.
+    """
+    COLUMNS = [
+        ("player_name", "TEXT NOT NULL"), ("level", "INTEGER"), ("jump_count", "INTEGER"),
+        ("death_count", "INTEGER"), ("avg_jump_interval", "REAL"), ("hint_count", "INTEGER"),
+        ("enemy_triggered", "INTEGER"), ("level_score", "INTEGER"),
+        ("hint_jump_now", "INTEGER"), ("hint_enemy_close", "INTEGER"), ("hint_almost_there", "INTEGER"),
+        ("hint_go_left", "INTEGER"), ("hint_go_right", "INTEGER"), ("hint_be_careful", "INTEGER")
+    ]
+    NAMES = [name for name, _ in COLUMNS]
+
+    def __init__(self, path):
+        """
+        Open (creating if needed) the database file.
+
+        Args:
+            path (str): SQLite database file path.
+        """
+        self.path = path
+        columns = ", ".join(f"{name} {kind}" for name, kind in self.COLUMNS)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"CREATE TABLE IF NOT EXISTS records (id INTEGER PRIMARY KEY AUTOINCREMENT, {columns})")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_records_player ON records (player_name)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_records_level ON records (level)")
+            # Lets summary() walk to the enemy_triggered median in index order instead of sorting the table
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_records_enemy ON records (enemy_triggered)")
+
+    @contextlib.contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    # --- Writing ---
+
+    def insert_rows(self, rows):
+        """
+        Append rows in one transaction.
+
+        Args:
+            rows (list[list]): Rows in column order (DataLogger.HEADER).
+        """
+        placeholders = ", ".join("?" for _ in self.NAMES)
+        with self._connect() as conn:
+            conn.executemany(f"INSERT INTO records ({', '.join(self.NAMES)}) VALUES ({placeholders})",
+                             [[str(row[0]).strip(), *row[1:]] for row in rows])
+
+    def import_csv(self, csv_path):
+        """
+        Append every record from a CSV log (as written by DataLogger).
+
+        Args:
+            csv_path (str): CSV file to read.
+
+        Returns:
+            int: Number of rows imported (unreadable rows are skipped).
+        """
+        if not os.path.exists(csv_path):
+            return 0
+
+        rows = []
+        with open(csv_path, "r", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            reader.fieldnames = [name.strip() for name in reader.fieldnames or []]
+            for record in reader:
+                try:
+                    rows.append(self.parse_record(record))
+                except ValueError as e:
+                    print(f"⚠️ Skipping unreadable row: {record} => {e}")
+        self.insert_rows(rows)
+        return len(rows)
+
+    @classmethod
+    def parse_record(cls, record):
+        """
+        Convert a CSV record (DictReader row, stripped field names) to a typed row.
+
+        Args:
+            record (dict): Column name -> text.
+
+        Returns:
+            list: Values in column order.
+
+        Raises:
+            ValueError: If a numeric field cannot be parsed.
+        """
+        return [cls._parse(name, kind, record.get(name)) for name, kind in cls.COLUMNS]
+
+    @staticmethod
+    def _parse(name, kind, value):
+        value = (value or "").strip()
+        if kind.startswith("TEXT"):
+            return value or "Unknown"
+        if not value:
+            # Missing level_score stays NULL (it is skipped by the recent-stats average)
+            return None if name == "level_score" else 0
+        return float(value) if kind == "REAL" else int(value)
+
+    def export_csv(self, csv_path):
+        """
+        Write every record to a CSV file in logging order (overwrites the file).
+
+        Args:
+            csv_path (str): Destination CSV file.
+
+        Returns:
+            int: Number of rows written.
+        """
+        rows = self.rows()
+        with open(csv_path, "w", newline='', encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.NAMES)
+            writer.writerows(["" if value is None else value for value in row] for row in rows)
+        return len(rows)
+
+    def rows(self):
+        """
+        Returns:
+            list[tuple]: Every record in logging order, in column order.
+        """
+        with self._connect() as conn:
+            return conn.execute(f"SELECT {', '.join(self.NAMES)} FROM records ORDER BY id").fetchall()
+
+    def last_id(self):
+        """
+        Returns:
+            int: Id of the newest record (0 when empty); changes whenever rows are added.
+        """
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM records").fetchone()[0]
+
+    # --- Queries ---
+
+    def leaderboard(self):
+        """
+        Returns:
+            list[dict]: player, avg_score and sessions per player, highest average first
+                (ties keep first-played order).
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT player_name, AVG(COALESCE(level_score, 0)), COUNT(*) FROM records "
+                "GROUP BY player_name ORDER BY MIN(id)"
+            ).fetchall()
+        board = [{"player": name, "avg_score": round(avg, 2), "sessions": sessions} for name, avg, sessions in rows]
+        # One row per player: rank on the displayed (rounded) average, like the CSV path
+        board.sort(key=lambda r: r["avg_score"], reverse=True)
+        return board
+
+    def latest_record(self):
+        """
+        Returns:
+            tuple: (latest record as a dict, that player's average level_score or None),
+                or (None, None) when the store is empty.
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            last = conn.execute("SELECT * FROM records ORDER BY id DESC LIMIT 1").fetchone()
+            if last is None:
+                return None, None
+            avg = conn.execute("SELECT AVG(level_score) FROM records WHERE player_name = ?",
+                               (last["player_name"],)).fetchone()[0]
+        return dict(last), avg
+
+    def summary(self):
+        """
+        Aggregates behind Visualizer.get_statistical_summary.
+
+        Returns:
+            dict | None: count, per-column sum/min/max (and sum of squares for jump_count),
+                per-level average hints, and the enemy_triggered median; None when empty.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*), SUM(jump_count), MIN(jump_count), MAX(jump_count), SUM(jump_count * jump_count), "
+                "SUM(death_count), MIN(death_count), MAX(death_count), "
+                "SUM(avg_jump_interval), MIN(avg_jump_interval), MAX(avg_jump_interval), "
+                "SUM(hint_count), MAX(enemy_triggered) FROM records"
+            ).fetchone()
+            count = row[0]
+            if not count:
+                return None
+            level_hints = [avg for avg, in conn.execute("SELECT AVG(hint_count) FROM records GROUP BY level")]
+            # Middle value(s) of enemy_triggered, averaged for an even count like statistics.median
+            middle = [value for value, in conn.execute(
+                "SELECT enemy_triggered FROM records ORDER BY enemy_triggered LIMIT ? OFFSET ?",
+                (2 - count % 2, (count - 1) // 2))]
+
+        return {
+            "count": count,
+            "jump_count": {"sum": row[1], "min": row[2], "max": row[3], "sum_sq": row[4]},
+            "death_count": {"sum": row[5], "min": row[6], "max": row[7]},
+            "avg_jump_interval": {"sum": row[8], "min": row[9], "max": row[10]},
+            "hint_count": {"sum": row[11], "level_means": level_hints},
+            "enemy_triggered": {"median": middle[0] if len(middle) == 1 else sum(middle) / 2, "max": row[12]}
+        }
+
+    @staticmethod
+    def sample_stdev(count, total, sum_sq):
+        """
+        Sample standard deviation from count, sum and sum of squares (integer columns).
+
+        Returns:
+            float: The standard deviation (0.0 for fewer than two values).
+        """
+        if count < 2:
+            return 0.0
+        return math.sqrt((count * sum_sq - total * total) / (count * (count - 1)))
+
+    def level_aggregates(self):
+        """
+        Per-level figures for the dashboard charts.
+
+        Returns:
+            list[dict]: level, sessions, avg_jumps and total_deaths, by level.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT level, COUNT(*), AVG(jump_count), SUM(death_count) FROM records GROUP BY level ORDER BY level"
+            ).fetchall()
+        return [{"level": level, "sessions": sessions, "avg_jumps": avg_jumps, "total_deaths": deaths}
+                for level, sessions, avg_jumps, deaths in rows]
+
+    def hint_totals(self):
+        """
+        Returns:
+            dict: Column name -> total for each hint_* column.
+        """
+        hints = [name for name in self.NAMES if name.startswith("hint_") and name != "hint_count"]
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {', '.join(f'COALESCE(SUM({h}), 0)' for h in hints)} FROM records").fetchone()
+        return dict(zip(hints, row))
+
+    def encounter_grid(self, size=10):
+        """
+        Enemy encounters bucketed by logging order, as the dashboard heatmap draws them
+        (row i goes to cell ((i * 5) % size, (i * 3) % size)).
+
+        Returns:
+            dict: (x, y) -> total enemy_triggered.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT (i * 5) % :size AS x, (i * 3) % :size AS y, SUM(enemy_triggered) FROM "
+                "(SELECT ROW_NUMBER() OVER (ORDER BY id) - 1 AS i, enemy_triggered FROM records) GROUP BY x, y",
+                {"size": size}
+            ).fetchall()
+        return {(x, y): total for x, y, total in rows}
@@ -0,0 +1,148 @@
+import numpy as np
+
+
+class SpatialHash:
+    """
+    Broadphase for moving entities (enemies, bullets, the player), rebuilt every tick.
+    Each named layer buckets its rects into square cells by top-left corner and
+    keeps them sorted by cell key, so a query only binary-searches the rows it
+    covers. Query cost depends on how many entities are near the area, not on
+    how many exist in the level.
+    """
+    STRIDE = 1 << 24
+    OFFSET = 1 << 20
+    LINEAR_LIMIT = 32
+
+    def __init__(self, cell_size=64):
+        """
+        Args:
+            cell_size (int): Width and height of one cell in pixels.
+        """
+        self.cell_size = cell_size
+        self.layers = {}
+
+    def _keys(self, rows, cols):
+        return (rows + self.OFFSET) * self.STRIDE + (cols + self.OFFSET)
+
+    def build(self, name, rects, ids=None):
+        """
+        Replace a layer's contents. The cell index is built lazily on the first
+        query, so layers that are rebuilt every tick but rarely queried stay cheap.
+
+        Args:
+            name (str): Layer name (e.g. "enemies").
+            rects (array-like): (n, 4) rects as (x, y, width, height).
+            ids (array-like): Id returned for each rect by queries (defaults to 0..n-1).
+        """
+        rects = np.asarray(rects, dtype=np.int64).reshape(-1, 4)
+        ids = np.arange(len(rects)) if ids is None else np.asarray(ids, dtype=np.int64)
+        self.layers[name] = {"rects": rects, "ids": ids, "keys": None}
+
+    def _indexed(self, name):
+        """
+        Return a non-empty layer, sorting it into cells first if it is large
+        enough for the index to pay off (small layers are scanned directly).
+        """
+        layer = self.layers.get(name)
+        if layer is None or not len(layer["ids"]):
+            return None
+        if layer["keys"] is None and len(layer["ids"]) > self.LINEAR_LIMIT:
+            rects = layer["rects"]
+            size = self.cell_size
+            rows = rects[:, 1] // size
+            keys = self._keys(rows, rects[:, 0] // size)
+            order = np.argsort(keys, kind="stable")
+            layer.update(keys=keys[order], rects=rects[order], ids=layer["ids"][order],
+                         max_w=int(rects[:, 2].max()), max_h=int(rects[:, 3].max()),
+                         rows=(int(rows.min()), int(rows.max())))
+        return layer
+
+    def __len__(self):
+        return sum(len(layer["ids"]) for layer in self.layers.values())
+
+    def count(self, name):
+        """
+        Args:
+            name (str): Layer name.
+
+        Returns:
+            int: Number of entities in the layer.
+        """
+        layer = self.layers.get(name)
+        return len(layer["ids"]) if layer else 0
+
+    def _candidates(self, layer, left, top, right, bottom):
+        """
+        Positions (into the sorted layer) of entities whose top-left corner lies in
+        a cell overlapping [left, right] x [top, bottom]. top/bottom may be None.
+        """
+        if layer["keys"] is None:
+            return np.arange(len(layer["ids"]))
+        size = self.cell_size
+        first_row, last_row = layer["rows"]
+        if top is not None:
+            first_row = max(first_row, top // size)
+        if bottom is not None:
+            last_row = min(last_row, bottom // size)
+        if first_row > last_row:
+            return np.zeros(0, dtype=np.int64)
+
+        rows = np.arange(first_row, last_row + 1)
+        keys = layer["keys"]
+        starts = np.searchsorted(keys, self._keys(rows, left // size), side="left")
+        ends = np.searchsorted(keys, self._keys(rows, right // size), side="right")
+        spans = [np.arange(s, e) for s, e in zip(starts.tolist(), ends.tolist()) if e > s]
+        return np.concatenate(spans) if spans else np.zeros(0, dtype=np.int64)
+
+    def query_rect(self, name, rect):
+        """
+        Find entities overlapping a rect.
+
+        Args:
+            name (str): Layer name.
+            rect (pygame.Rect): Area to test.
+
+        Returns:
+            np.ndarray: Sorted ids of the overlapping entities.
+        """
+        layer = self._indexed(name)
+        if layer is None:
+            return np.zeros(0, dtype=np.int64)
+        positions = self._candidates(layer, rect.left - layer.get("max_w", 0), rect.top - layer.get("max_h", 0),
+                                     rect.right - 1, rect.bottom - 1)
+        x, y, w, h = layer["rects"][positions].T
+        hits = (x < rect.right) & (x + w > rect.left) & (y < rect.bottom) & (y + h > rect.top)
+        return np.sort(layer["ids"][positions[hits]])
+
+    def query_centers(self, name, cx, cy, rx, ry=None):
+        """
+        Find entities whose centre lies strictly within rx horizontally and ry
+        vertically of a point (centres as pygame computes them: x + w // 2).
+
+        Args:
+            name (str): Layer name.
+            cx (int): Point x.
+            cy (int): Point y.
+            rx (int): Horizontal reach.
+            ry (int): Vertical reach, None for unbounded.
+
+        Returns:
+            np.ndarray: Sorted ids of the matching entities.
+        """
+        layer = self._indexed(name)
+        if layer is None:
+            return np.zeros(0, dtype=np.int64)
+        top = None if ry is None else cy - ry - layer.get("max_h", 0)
+        bottom = None if ry is None else cy + ry
+        positions = self._candidates(layer, cx - rx - layer.get("max_w", 0), top, cx + rx, bottom)
+        x, y, w, h = layer["rects"][positions].T
+        hits = np.abs(x + w // 2 - cx) < rx
+        if ry is not None:
+            hits &= np.abs(y + h // 2 - cy) < ry
+        return np.sort(layer["ids"][positions[hits]])
+
+    def clear(self):
+        """
+        Drop every layer.
+        """
+        self.layers.clear()
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+import pygame
+
+
+class TextCache:
+    """
+    Shared font registry plus an LRU cache of rendered text surfaces.
+    Fonts are created once per (name, size, bold); a string is rasterized once per
+    (font, text, colour) and reused until it falls out of the cache.
+    """
+    MAX_ENTRIES = 512
+
+    _fonts = {}
+    _rendered = OrderedDict()
+
+    @staticmethod
+    def font(size, bold=False, name=None):
+        """
+        Get a shared system font.
+
+        Args:
+            size (int): Font size.
+            bold (bool): Bold style.
+            name (str): System font name(s), None for pygame's default font.
+
+        Returns:
+            pygame.font.Font: The shared font object.
+        """
+        key = (name, size, bold)
+        font = TextCache._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size, bold=bold)
+            TextCache._fonts[key] = font
+        return font
+
+    @staticmethod
+    def render(font, text, color):
+        """
+        Render anti-aliased text, reusing a cached surface when possible.
+
+        Args:
+            font (pygame.font.Font): Font to render with (preferably from TextCache.font).
+            text (str): Text to render.
+            color (tuple): RGB text colour.
+
+        Returns:
+            pygame.Surface: The rendered text (shared, do not draw on it).
+        """
+        key = (font, text, tuple(color))
+        cache = TextCache._rendered
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        cache[key] = surface
+        if len(cache) > TextCache.MAX_ENTRIES:
+            # Evict the least recently used string
+            cache.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def clear():
+        """
+        Drop all rendered text (fonts are kept).
+        """
+        TextCache._rendered.clear()
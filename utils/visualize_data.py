@@ -1,13 +1,20 @@
-import csv
-import os
-import statistics
-from collections import defaultdict
+import math
+import numpy as np
+from utils.data_logger import DataLogger
+from utils.game_data_columns import GameDataColumns
 
 
 class Visualizer:
     """
     A utility class for reading and analyzing gameplay statistics from a CSV log file.
     Provides functions for retrieving recent gameplay data and statistical summaries.
+
+    Sources, first match wins:
+    - DataLogger's running aggregates (the game always turns them on, see main.py)
+    - SQL aggregates, when records are stored in SQLite
+    - the CSV read through GameDataColumns, as NumPy column operations. This is a
+      fallback for code that uses Visualizer without the aggregates (scripts, the
+      benchmarks).
     """
     FILE_PATH = "game_data.csv"
 
@@ -27,40 +34,34 @@ class Visualizer:
                 - Hints used
                 - Enemies encountered
         """
-        if not os.path.exists(Visualizer.FILE_PATH):
-            return None
-
-        with open(Visualizer.FILE_PATH, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            reader.fieldnames = [name.strip() for name in reader.fieldnames]
-            reader = list(reader)
-
-            if not reader:
-                return None
+        if DataLogger.aggregates is not None:
+            return Visualizer._recent_from_store(DataLogger.aggregates)
+        if DataLogger.store is not None:
+            return Visualizer._recent_from_store(DataLogger.store)
 
-            last = reader[-1]
-            player = last.get("player_name", "?").strip()
+        # Fallback without aggregates: vectorized over the CSV columns
+        columns = GameDataColumns.load(Visualizer.FILE_PATH)
+        if columns is None or not len(columns):
+            return None
 
-            # Filter rows for the same player and valid level_score
-            player_rows = [r for r in reader if r.get("player_name", "").strip() == player and r.get("level_score")]
+        last = len(columns) - 1
+        code = columns.player_codes[last]
 
-            # Compute average score across all levels for this player
-            try:
-                scores = [float(r["level_score"]) for r in player_rows]
-                avg_score = round(sum(scores) / len(scores), 2)
-            except:
-                avg_score = "?"
+        # Average score across all levels for this player (rows with a score only)
+        mine = (columns.player_codes == code) & columns.score_valid
+        scores = columns["level_score"][mine]
+        avg_score = round(float(scores.mean()), 2) if len(scores) else "?"
 
-            return {
-                "Player": player,
-                "Level": last.get("level") or "?",
-                "Jump Count": last.get("jump_count", "?"),
-                "Death Count": last.get("death_count", "?"),
-                "Avg Score Per Level": avg_score,
-                "Avg Time Between Jumps": round(float(last.get("avg_jump_interval", "0.0")), 3),
-                "Hints Given": last.get("hint_count", "?"),
-                "Enemy Encounters": last.get("enemy_triggered", "?")
-            }
+        return {
+            "Player": columns.player_names[code],
+            "Level": str(columns["level"][last]),
+            "Jump Count": str(columns["jump_count"][last]),
+            "Death Count": str(columns["death_count"][last]),
+            "Avg Score Per Level": avg_score,
+            "Avg Time Between Jumps": round(float(columns["avg_jump_interval"][last]), 3),
+            "Hints Given": str(columns["hint_count"][last]),
+            "Enemy Encounters": str(columns["enemy_triggered"][last])
+        }
 
     @staticmethod
     def get_statistical_summary():
@@ -75,65 +76,223 @@ class Visualizer:
                 - Total and average AI hints
                 - Median/max for enemy encounters
         """
-        if not os.path.exists(Visualizer.FILE_PATH):
-            return {}
+        if DataLogger.aggregates is not None:
+            return Visualizer._summary_from_aggregates(DataLogger.aggregates)
+        if DataLogger.store is not None:
+            return Visualizer._summary_from_store(DataLogger.store)
 
+        # Fallback without aggregates: vectorized over the CSV columns
         try:
-            with open(Visualizer.FILE_PATH, "r", encoding="utf-8-sig") as f:
-                reader = csv.DictReader(f)
-                reader.fieldnames = [name.strip() for name in reader.fieldnames]
-                reader = list(reader)
-
-            if not reader:
+            columns = GameDataColumns.load(Visualizer.FILE_PATH)
+            if columns is None or not len(columns):
                 return {}
 
-            # Extract and convert values to numeric form
-            df = {
-                "jump_count": [int(r.get("jump_count", 0)) for r in reader],
-                "death_count": [int(r.get("death_count", 0)) for r in reader],
-                "avg_jump_interval": [float(r.get("avg_jump_interval", 0.0)) for r in reader],
-                "hint_count": [int(r.get("hint_count", 0)) for r in reader],
-                "enemy_triggered": [int(r.get("enemy_triggered", 0)) for r in reader],
-                "level": [int(r.get("level", 0)) for r in reader],
+            jumps = columns["jump_count"]
+            deaths = columns["death_count"]
+            interval = columns["avg_jump_interval"]
+            hints = columns["hint_count"]
+            enemies = columns["enemy_triggered"]
+            count = len(columns)
+
+            # Average hints per level group, then averaged over the levels
+            _, level_hints, level_rows = columns.group_sum("hint_count", "level")
+            avg_hint_per_level = round(float((level_hints / level_rows).mean()), 2)
+
+            return {
+                "Jump Count": {
+                    "Mean": round(int(jumps.sum()) / count, 2),
+                    "Min": int(jumps.min()),
+                    "Max": int(jumps.max()),
+                    "SD": round(float(jumps.std(ddof=1)), 2) if count > 1 else 0.0
+                },
+                "Deaths": {
+                    "Mean": round(int(deaths.sum()) / count, 2),
+                    "Min": int(deaths.min()),
+                    "Max": int(deaths.max())
+                },
+                "Avg Time Between Jumps": {
+                    "Mean": round(float(interval.mean()), 3),
+                    "Min": round(float(interval.min()), 3),
+                    "Max": round(float(interval.max()), 3)
+                },
+                "AI Hints Given": {
+                    "Total": int(hints.sum()),
+                    "Avg per Level": avg_hint_per_level
+                },
+                "Enemy Encounters": {
+                    "Median": Visualizer._median(enemies),
+                    "Max": int(enemies.max())
+                }
             }
 
-            # Group hints per level for averaging
-            level_hints = defaultdict(list)
-            for r in reader:
-                lvl = int(r.get("level", 0))
-                hints = int(r.get("hint_count", 0))
-                level_hints[lvl].append(hints)
+        except Exception as e:
+            print("❌ Error in get_statistical_summary:", e)
+            return {}
+
+    @staticmethod
+    def _median(values):
+        """
+        Median of an integer column, typed like statistics.median (int for an odd
+        count, float mean of the middle pair otherwise).
+        """
+        count = len(values)
+        middle = np.partition(values, [(count - 1) // 2, count // 2])
+        if count % 2:
+            return int(middle[count // 2])
+        return (int(middle[count // 2 - 1]) + int(middle[count // 2])) / 2
+
+    @staticmethod
+    def get_level_percentiles(quantiles=(0.9, 0.99)):
+        """
+        Tail percentiles of jump and death counts for every level.
+        Read from the running sketches when available (bounded memory and error),
+        otherwise computed exactly by sorting each level's values.
+
+        Args:
+            quantiles (tuple[float]): Fractions to report, p90 and p99 by default.
+
+        Returns:
+            dict: level -> {"jump_count": [...], "death_count": [...]}, one value per quantile.
+        """
+        metrics = ["jump_count", "death_count"]
+        if DataLogger.aggregates is not None:
+            return DataLogger.aggregates.level_percentiles(metrics, quantiles)
+
+        if DataLogger.store is not None:
+            rows = DataLogger.read_rows()
+            levels = np.array([row[1] for row in rows], dtype=np.int64)
+            values = {metric: np.array([row[DataLogger.HEADER.index(metric)] for row in rows], dtype=np.int64)
+                      for metric in metrics}
+        else:
+            columns = GameDataColumns.load(Visualizer.FILE_PATH)
+            if columns is None:
+                return {}
+            levels = columns["level"]
+            values = {metric: columns[metric] for metric in metrics}
+
+        result = {}
+        for level in np.unique(levels).tolist():
+            in_level = levels == level
+            result[level] = {}
+            for metric in metrics:
+                ordered = np.sort(values[metric][in_level])
+                # Nearest-rank percentile, as the sketches report it
+                ranks = [max(0, math.ceil(q * len(ordered)) - 1) for q in quantiles]
+                result[level][metric] = ordered[ranks].tolist()
+        return result
+
+    @staticmethod
+    def _recent_from_store(store):
+        """
+        load_recent_stats from a RecordStore (the latest row plus one indexed AVG)
+        or an AggregateStore (the saved latest row and player average).
+        Values are strings, as read from the CSV.
+        """
+        last, avg_score = store.latest_record()
+        if last is None:
+            return None
+
+        def text(key):
+            return "?" if last[key] is None else str(last[key])
+
+        return {
+            "Player": last["player_name"],
+            "Level": text("level"),
+            "Jump Count": text("jump_count"),
+            "Death Count": text("death_count"),
+            "Avg Score Per Level": "?" if avg_score is None else round(avg_score, 2),
+            "Avg Time Between Jumps": round(last["avg_jump_interval"] or 0.0, 3),
+            "Hints Given": text("hint_count"),
+            "Enemy Encounters": text("enemy_triggered")
+        }
 
-            # Compute average hints per level group
-            avg_hint_per_level = round(sum(sum(v) / len(v) for v in level_hints.values()) / len(level_hints), 2)
+    @staticmethod
+    def _summary_from_store(store):
+        """
+        get_statistical_summary from a RecordStore, with the same keys and rounding.
+        """
+        try:
+            agg = store.summary()
+            if agg is None:
+                return {}
 
+            count = agg["count"]
+            jumps = agg["jump_count"]
+            deaths = agg["death_count"]
+            interval = agg["avg_jump_interval"]
+            level_means = agg["hint_count"]["level_means"]
             return {
                 "Jump Count": {
-                    "Mean": round(statistics.mean(df["jump_count"]), 2),
-                    "Min": min(df["jump_count"]),
-                    "Max": max(df["jump_count"]),
-                    "SD": round(statistics.stdev(df["jump_count"]), 2) if len(df["jump_count"]) > 1 else 0.0
+                    "Mean": round(jumps["sum"] / count, 2),
+                    "Min": jumps["min"],
+                    "Max": jumps["max"],
+                    "SD": round(store.sample_stdev(count, jumps["sum"], jumps["sum_sq"]), 2)
                 },
                 "Deaths": {
-                    "Mean": round(statistics.mean(df["death_count"]), 2),
-                    "Min": min(df["death_count"]),
-                    "Max": max(df["death_count"])
+                    "Mean": round(deaths["sum"] / count, 2),
+                    "Min": deaths["min"],
+                    "Max": deaths["max"]
                 },
                 "Avg Time Between Jumps": {
-                    "Mean": round(statistics.mean(df["avg_jump_interval"]), 3),
-                    "Min": round(min(df["avg_jump_interval"]), 3),
-                    "Max": round(max(df["avg_jump_interval"]), 3)
+                    "Mean": round(interval["sum"] / count, 3),
+                    "Min": round(interval["min"], 3),
+                    "Max": round(interval["max"], 3)
                 },
                 "AI Hints Given": {
-                    "Total": sum(df["hint_count"]),
-                    "Avg per Level": avg_hint_per_level
+                    "Total": agg["hint_count"]["sum"],
+                    "Avg per Level": round(sum(level_means) / len(level_means), 2)
                 },
                 "Enemy Encounters": {
-                    "Median": statistics.median(df["enemy_triggered"]),
-                    "Max": max(df["enemy_triggered"])
+                    "Median": agg["enemy_triggered"]["median"],
+                    "Max": agg["enemy_triggered"]["max"]
                 }
             }
 
         except Exception as e:
             print("❌ Error in get_statistical_summary:", e)
             return {}
+
+    @staticmethod
+    def _summary_from_aggregates(aggregates):
+        """
+        get_statistical_summary from running aggregates, independent of the log size.
+        """
+        # Snapshot under the lock: the logger thread updates these stats in place
+        with aggregates.lock:
+            overall = aggregates.overall
+            jumps = overall["jump_count"].copy()
+            if not jumps.count:
+                return {}
+            deaths = overall["death_count"].copy()
+            interval = overall["avg_jump_interval"].copy()
+            level_means = [group["hint_count"].total / group["hint_count"].count
+                           for group in aggregates.levels.values()]
+            hints_total = overall["hint_count"].total
+            enemy_max = overall["enemy_triggered"].high
+
+        return {
+            "Jump Count": {
+                "Mean": round(jumps.total / jumps.count, 2),
+                "Min": jumps.low,
+                "Max": jumps.high,
+                "SD": round(jumps.stdev(), 2)
+            },
+            "Deaths": {
+                "Mean": round(deaths.total / deaths.count, 2),
+                "Min": deaths.low,
+                "Max": deaths.high
+            },
+            "Avg Time Between Jumps": {
+                "Mean": round(interval.total / interval.count, 3),
+                "Min": round(interval.low, 3),
+                "Max": round(interval.high, 3)
+            },
+            "AI Hints Given": {
+                "Total": hints_total,
+                "Avg per Level": round(sum(level_means) / len(level_means), 2)
+            },
+            "Enemy Encounters": {
+                "Median": aggregates.median("enemy_triggered"),
+                "Max": enemy_max
+            }
+        }